@@ -0,0 +1,75 @@
+import io
+from functools import lru_cache
+
+from PIL import Image
+
+from metrics import span
+
+# Pixel width each image is prepared at. Fixed-width images match their st.image
+# width; column-width images are sized for the widest column they appear in.
+ASSET_WIDTHS = {
+    "images/finallogo.jpg": 350,
+    "images/finallogoonly.jpg": 200,
+    "images/pregnancypic.jpg": 600,
+    "images/jonahfinal.jpg": 400,
+    "images/joshfinal.jpg": 400,
+    "images/milliefinal.jpg": 400,
+    "images/kelechifinal.jpg": 400,
+    "images/adithifinal.jpg": 400,
+    "images/nikitafinal.jpg": 400,
+    "images/checkupsfinal.jpg": 500,
+    "images/dietfinal.jpg": 500,
+    "images/exercisefinal.jpg": 500,
+    "images/avoid_harmfulfinal.jpg": 500,
+    "images/hydrationfinal.jpg": 500,
+    "images/relaxationfinal.jpg": 500,
+    "images/knowledgefinal.jpg": 500,
+    "images/supportfinal.jpg": 500,
+    "images/baby_dayfinal.jpg": 500,
+    "images/health_monitoringfinal.jpg": 500,
+}
+
+# Upper bound on prepared images kept in memory for the process
+ASSET_CACHE_SIZE = 32
+
+JPEG_QUALITY = 80
+
+
+@lru_cache(maxsize=ASSET_CACHE_SIZE)
+def load_asset(path):
+    """
+    Returns the image at path resized to its ASSET_WIDTHS width and recompressed,
+    as progressive JPEG or, for images with transparency, a 256-colour PNG.
+
+    Built once per process and shared by every session. Because st.image serves
+    media by a hash of the bytes, identical bytes on every rerun also give the
+    browser a stable URL to cache.
+
+    Parameters:
+        path (str): Image path, as used in the app.
+
+    Returns:
+        bytes: The encoded image.
+    """
+    width = ASSET_WIDTHS[path]
+    with Image.open(path) as image:
+        # Let the JPEG decoder skip straight to a smaller scale for the large photos
+        image.draft("RGB", (width, width * image.height // image.width))
+        height = round(image.height * width / image.width)
+        resized = image.resize((width, height), Image.LANCZOS)
+
+    out = io.BytesIO()
+    if resized.mode in ("RGBA", "LA", "P"):
+        resized.quantize(256, method=Image.Quantize.FASTOCTREE).save(out, format="PNG", optimize=True)
+    else:
+        resized.convert("RGB").save(out, format="JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+    return out.getvalue()
+
+
+def build_assets():
+    """
+    Prepares every image in ASSET_WIDTHS so no visitor waits on the first resize.
+    """
+    with span("startup_assets"):
+        for path in ASSET_WIDTHS:
+            load_asset(path)
@@ -0,0 +1,163 @@
+import numpy as np
+
+# Rows read from the uploaded file at a time; bounds memory for very large panels
+CHUNK_ROWS = 20_000
+
+# Columns expected in an uploaded CSV, encoded the same way as the Risk Assessment form
+BATCH_INPUT_COLUMNS = [
+    "Delivery_Month",
+    "Mothers_Age",
+    "Mothers_Race_Recode_31",
+    "Mothers_Education",
+    "Fathers_Age_Combined",
+    "Month_Prenatal_Care_Began",
+    "Weight_Pounds",
+    "Height_Inches",
+    "Diabetes_Prepregnancy",
+    "Gestational_Diabetes",
+    "PrePregnancy_Hypertension",
+    "Gestational_Hypertension",
+    "Hypertension_Eclampsia",
+    "Infertility_Treatment",
+    "Infant_Sex",
+    "WIC_Program",
+    "Cigarettes_During_Pregnancy",
+    "Cigarettes_Before_Pregnancy_Int",
+    "Total_Prior_Births",
+    "Last_Birth_Months",
+]
+
+# Values the Risk Assessment form can produce for each column: (lowest, highest, whole numbers only)
+BATCH_INPUT_RANGES = {
+    "Delivery_Month": (1, 12, True),
+    "Mothers_Age": (0, 65, True),
+    "Mothers_Race_Recode_31": (1, 31, True),
+    "Mothers_Education": (1, 8, True),
+    "Fathers_Age_Combined": (0, 100, True),
+    "Month_Prenatal_Care_Began": (1, 10, True),
+    "Weight_Pounds": (50, 500, False),
+    "Height_Inches": (48, 96, False),
+    "Diabetes_Prepregnancy": (0, 1, True),
+    "Gestational_Diabetes": (0, 1, True),
+    "PrePregnancy_Hypertension": (0, 1, True),
+    "Gestational_Hypertension": (0, 1, True),
+    "Hypertension_Eclampsia": (0, 1, True),
+    "Infertility_Treatment": (0, 1, True),
+    "Infant_Sex": (0, 1, True),
+    "WIC_Program": (0, 1, True),
+    "Cigarettes_During_Pregnancy": (0, 1, True),
+    "Cigarettes_Before_Pregnancy_Int": (0, 1, True),
+    "Total_Prior_Births": (0, 21, True),
+    "Last_Birth_Months": (0, 320, True),
+}
+
+# Risk_Level of rows that were not scored
+NOT_SCORED = "NOT SCORED"
+
+
+def invalid_inputs(chunk):
+    """
+    Finds the cells of an uploaded chunk the form could never have produced:
+    empty, non-numeric, fractional codes or outside the form's range.
+
+    Parameters:
+        chunk (pd.DataFrame): Rows with the BATCH_INPUT_COLUMNS.
+
+    Returns:
+        np.ndarray: An (N, len(BATCH_INPUT_COLUMNS)) boolean matrix, True where a cell is invalid.
+    """
+    # Imported here so pandas only loads when someone actually uploads a file
+    import pandas as pd
+
+    invalid = np.empty((len(chunk), len(BATCH_INPUT_COLUMNS)), dtype=bool)
+    for j, col in enumerate(BATCH_INPUT_COLUMNS):
+        low, high, whole = BATCH_INPUT_RANGES[col]
+        values = pd.to_numeric(chunk[col], errors="coerce").to_numpy(dtype=np.float64)
+        with np.errstate(invalid="ignore"):
+            valid = np.isfinite(values) & (values >= low) & (values <= high)
+            if whole:
+                valid &= values == np.floor(values)
+        invalid[:, j] = ~valid
+    return invalid
+
+
+def describe_invalid(invalid):
+    """
+    Lists the invalid columns of each row, for the results file.
+
+    Parameters:
+        invalid (np.ndarray): The matrix returned by invalid_inputs.
+
+    Returns:
+        np.ndarray: One string per row; empty for rows with valid inputs.
+    """
+    problems = np.full(len(invalid), "", dtype=object)
+    for i in np.flatnonzero(invalid.any(axis=1)):
+        columns = [col for col, bad in zip(BATCH_INPUT_COLUMNS, invalid[i]) if bad]
+        problems[i] = "Missing or out of range: " + ", ".join(columns)
+    return problems
+
+
+def derive_features(chunk, graph):
+    """
+    Computes the derived model features for every row of an uploaded chunk at once.
+
+    Parameters:
+        chunk (pd.DataFrame): Rows with the BATCH_INPUT_COLUMNS.
+        graph (FeatureGraph): The same feature graph the Risk Assessment form uses.
+
+    Returns:
+        np.ndarray: An (N, n_features) matrix of raw features in model order.
+    """
+    missing = [col for col in BATCH_INPUT_COLUMNS if col not in chunk.columns]
+    if missing:
+        raise ValueError(f"Uploaded file is missing columns: {', '.join(missing)}")
+
+    return graph.derive({col: chunk[col].to_numpy(dtype=np.float64) for col in graph.input_names})
+
+
+def score_csv(source, output, graph, predictor, chunk_rows=CHUNK_ROWS):
+    """
+    Scores an uploaded CSV chunk by chunk and appends the results to output.
+
+    Each chunk is derived and scaled as one matrix and handed to the predictor
+    in a single call, which splits it into endpoint-sized payloads as needed.
+    Rows with an empty or out-of-range answer are not scored: they get no
+    Risk_Score, a Risk_Level of NOT_SCORED and the offending columns under
+    Problems.
+
+    Parameters:
+        source (file-like or str): The uploaded CSV.
+        output (file-like): Text stream the scored CSV is written to.
+        graph (FeatureGraph): Feature derivation and scaling from the training scaler.
+        predictor (Predictor): The SageMaker or local scoring backend.
+        chunk_rows (int): Number of rows read and scored at a time.
+
+    Yields:
+        tuple: The running counts of rows read and of rows not scored, after each chunk.
+    """
+    # Imported here so pandas only loads when someone actually uploads a file
+    import pandas as pd
+
+    rows = 0
+    not_scored = 0
+    for chunk in pd.read_csv(source, chunksize=chunk_rows):
+        missing = [col for col in BATCH_INPUT_COLUMNS if col not in chunk.columns]
+        if missing:
+            raise ValueError(f"Uploaded file is missing columns: {', '.join(missing)}")
+        invalid = invalid_inputs(chunk)
+        valid = ~invalid.any(axis=1)
+
+        predictions = np.full(len(chunk), np.nan)
+        if valid.any():
+            features = graph.pipeline.transform(derive_features(chunk.loc[valid, BATCH_INPUT_COLUMNS].astype(np.float64), graph))
+            predictions[valid] = predictor.predict(features)
+
+        chunk["Risk_Score"] = predictions
+        chunk["Risk_Level"] = np.where(~valid, NOT_SCORED, np.where(np.round(predictions) == 0, "LOW", "HIGH"))
+        chunk["Problems"] = describe_invalid(invalid)
+        chunk.to_csv(output, header=rows == 0, index=False)
+
+        rows += len(chunk)
+        not_scored += int((~valid).sum())
+        yield rows, not_scored
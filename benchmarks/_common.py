@@ -0,0 +1,92 @@
+"""
+Shared helpers for the benchmark scripts. Run the scripts from the repository
+root, e.g. ``python benchmarks/bench_preprocess.py``.
+"""
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+# Form defaults on the Risk Assessment tab (age 30, 120 lb / 60 in, all "No")
+SAMPLE_INPUT = {
+    "Delivery_Month": 1,
+    "Mothers_Age": 30,
+    "Mothers_Race_Recode_31": 1,
+    "Mothers_Education": 1,
+    "Fathers_Age_Combined": 30,
+    "Month_Prenatal_Care_Began": 1,
+    "Mothers_PrePregnancy_BMI": 120 / 60 ** 2 * 703,
+    "Diabetes_Prepregnancy": 0,
+    "Gestational_Diabetes": 0,
+    "PrePregnancy_Hypertension": 0,
+    "Gestational_Hypertension": 0,
+    "Hypertension_Eclampsia": 0,
+    "Infertility_Treatment": 0,
+    "Infant_Sex": 1,
+    "WIC_Program": 0,
+    "Cigarettes_During_Pregnancy": 0,
+    "Cigarettes_Before_Pregnancy_Int": 0,
+    "Total_Prior_Births": 0,
+    "Had_Previous_Birth": 0,
+    "Less_than_1_year": 1,
+    "1_year_to_2.5_years": 0,
+    "2.5_years_to_4_years": 0,
+    "4_to_5.5_years": 0,
+    "Greater_than_5.5_years": 0,
+    "Risk_Sum": 0,
+}
+
+
+def random_inputs(n, seed=0):
+    """
+    Returns an (n, 25) matrix of plausible raw feature rows in SAMPLE_INPUT order.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    rows = np.tile(np.array(list(SAMPLE_INPUT.values()), dtype=np.float64), (n, 1))
+    rows[:, 0] = rng.integers(1, 13, n)
+    rows[:, 1] = rng.integers(15, 50, n)
+    rows[:, 2] = rng.integers(1, 32, n)
+    rows[:, 3] = rng.integers(1, 9, n)
+    rows[:, 4] = rng.integers(15, 70, n)
+    rows[:, 5] = rng.integers(1, 11, n)
+    rows[:, 6] = rng.uniform(16, 45, n)
+    rows[:, 7:13] = rng.random((n, 6)) < 0.05
+    rows[:, 15:17] = rng.random((n, 2)) < 0.08
+    rows[:, 24] = rows[:, 7:13].sum(axis=1) + rows[:, 15:17].sum(axis=1)
+    return rows
+
+
+def scaler_pipeline(scaler=None):
+    """
+    Returns the FeaturePipeline of a fitted StandardScaler, by default the training scaler in scaler.pkl.
+    """
+    from features import FeaturePipeline
+    from inference import load_scaler
+
+    if scaler is None:
+        scaler = load_scaler(os.path.join(REPO_ROOT, "scaler.pkl"))
+    return FeaturePipeline(scaler.mean_, scaler.scale_, scaler.feature_names_in_)
+
+
+def feature_vector(pipeline, input_data):
+    """
+    Orders a dictionary of raw features into one row in the pipeline's feature order.
+    """
+    import numpy as np
+
+    return np.array([input_data[name] for name in pipeline.feature_names], dtype=np.float64)
+
+
+def timeit(func, repeat):
+    """
+    Returns the mean wall time of ``func()`` in microseconds over ``repeat`` calls.
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e6
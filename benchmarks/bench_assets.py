@@ -0,0 +1,78 @@
+"""
+Image bytes sent per tab before and after the asset pipeline.
+
+"Before" reproduces what st.image does with a file path: read the file and,
+when it is wider than the display width (or Streamlit's 1460px cap for
+column-width images), resize it and re-encode at quality 90 on every rerun.
+"""
+import io
+import time
+
+from PIL import Image
+
+from _common import REPO_ROOT
+from assets import ASSET_WIDTHS, load_asset
+
+STREAMLIT_MAX_WIDTH = 1460
+
+TEAM = [
+    "images/jonahfinal.jpg", "images/joshfinal.jpg", "images/milliefinal.jpg",
+    "images/kelechifinal.jpg", "images/adithifinal.jpg", "images/nikitafinal.jpg",
+]
+TIPS = [
+    "images/checkupsfinal.jpg", "images/dietfinal.jpg", "images/exercisefinal.jpg",
+    "images/avoid_harmfulfinal.jpg", "images/hydrationfinal.jpg", "images/relaxationfinal.jpg",
+    "images/knowledgefinal.jpg", "images/supportfinal.jpg", "images/baby_dayfinal.jpg",
+    "images/health_monitoringfinal.jpg",
+]
+
+# (path, fixed st.image width or None for column width) drawn by each tab
+TABS = {
+    "Home": [("images/finallogo.jpg", 350), ("images/pregnancypic.jpg", None)],
+    "Risk Assessment": [("images/finallogoonly.jpg", 200)],
+    "Meet Our Team": [("images/finallogoonly.jpg", 200)] + [(path, None) for path in TEAM],
+    "StillSafe Tips for Success": [("images/finallogoonly.jpg", 200)] + [(path, None) for path in TIPS],
+    "Feedback": [("images/finallogoonly.jpg", 200)],
+}
+
+
+def streamlit_default_bytes(path, width):
+    with open(path, "rb") as f:
+        data = f.read()
+    image = Image.open(io.BytesIO(data))
+    target = width or STREAMLIT_MAX_WIDTH
+    if image.width <= target:
+        return data
+    resized = image.resize((target, int(image.height * target / image.width)), Image.BILINEAR)
+    out = io.BytesIO()
+    resized.save(out, format="PNG" if image.mode in ("RGBA", "LA", "P") else "JPEG", quality=90)
+    return out.getvalue()
+
+
+def main():
+    print(f"{'tab':<30}{'before bytes':>14}{'after bytes':>14}{'before ms/rerun':>17}{'after ms/rerun':>16}")
+    for tab, images in TABS.items():
+        start = time.perf_counter()
+        before = sum(len(streamlit_default_bytes(path, width)) for path, width in images)
+        before_ms = (time.perf_counter() - start) * 1000
+
+        load_asset.cache_clear()
+        for path, _ in images:
+            load_asset(path)
+        start = time.perf_counter()
+        after = sum(len(load_asset(path)) for path, _ in images)
+        after_ms = (time.perf_counter() - start) * 1000
+        print(f"{tab:<30}{before:>14,}{after:>14,}{before_ms:>17.1f}{after_ms:>16.3f}")
+
+    load_asset.cache_clear()
+    start = time.perf_counter()
+    for path in ASSET_WIDTHS:
+        load_asset(path)
+    print(f"\none-time build of {len(ASSET_WIDTHS)} variants: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    import os
+
+    os.chdir(REPO_ROOT)
+    main()
@@ -0,0 +1,83 @@
+"""
+Aggregate throughput and tail latency of single-row predictions from many
+concurrent sessions, straight to the SageMaker backend and through the
+CoalescingPredictor. The local AWS fakes stand in for an endpoint with a fixed
+latency that serves a limited number of calls at once and throttles the rest,
+which the invoker then retries.
+
+    python benchmarks/bench_coalescing.py [--sessions 64] [--seconds 5] [--latency-ms 30] [--capacity 4]
+"""
+import argparse
+import os
+import threading
+import time
+
+import numpy as np
+
+from _common import REPO_ROOT, random_inputs
+from fakes import patch_boto3
+from inference import InferenceContext
+from invocation import EndpointUnavailable
+from predictors import CoalescingPredictor, SageMakerPredictor
+
+
+def run(predictor, sessions, seconds, think):
+    latencies = []
+    failures = []
+    stop = time.monotonic() + seconds
+
+    def session(seed):
+        rng = np.random.default_rng(seed)
+        rows = random_inputs(64, seed=seed)
+        i = 0
+        while time.monotonic() < stop:
+            time.sleep(rng.exponential(think))
+            start = time.perf_counter()
+            try:
+                predictor.predict(rows[i % len(rows)])
+                latencies.append(time.perf_counter() - start)
+            except EndpointUnavailable:
+                failures.append(1)
+            i += 1
+
+    threads = [threading.Thread(target=session, args=(seed,)) for seed in range(sessions)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return np.array(latencies) * 1000, len(failures)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sessions", type=int, default=64)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--latency-ms", type=float, default=30)
+    parser.add_argument("--capacity", type=int, default=4, help="endpoint calls served at once")
+    parser.add_argument("--think-ms", type=float, default=20, help="mean pause between a session's requests")
+    parser.add_argument("--window-ms", type=float, default=5)
+    parser.add_argument("--max-rows", type=int, default=64)
+    args = parser.parse_args()
+
+    os.chdir(REPO_ROOT)
+    print(f"{args.sessions} sessions, endpoint {args.latency_ms:g} ms with {args.capacity} concurrent slots")
+    print(f"{'mode':<12}{'rows/s':>9}{'p50 ms':>9}{'p99 ms':>9}{'calls':>8}{'throttled':>11}{'failed':>8}")
+    for coalesce in (False, True):
+        with patch_boto3(latency=args.latency_ms / 1000, capacity=args.capacity) as counter:
+            context = InferenceContext()
+            predictor = SageMakerPredictor(context)
+            if coalesce:
+                predictor = CoalescingPredictor(predictor, window=args.window_ms / 1000, max_rows=args.max_rows)
+            predictor.predict(random_inputs(1))  # credentials and client
+            start_calls = counter["invoke_calls"]
+            start_throttled = counter["throttled"]
+            latencies, failed = run(predictor, args.sessions, args.seconds, args.think_ms / 1000)
+            print(
+                f"{'coalesced' if coalesce else 'direct':<12}{len(latencies) / args.seconds:>9,.0f}"
+                f"{np.percentile(latencies, 50):>9.1f}{np.percentile(latencies, 99):>9.1f}"
+                f"{counter['invoke_calls'] - start_calls:>8,}{counter['throttled'] - start_throttled:>11,}{failed:>8,}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Bytes on the wire and encode time per 10k rows for each request codec, plus
+decode time for a 10k-score text/csv response, against the original
+str()-joined CSV and str-based response parsing.
+"""
+import numpy as np
+
+from _common import random_inputs, scaler_pipeline, timeit
+from payloads import CODECS, decode_predictions, get_codec, split_payloads
+
+ROWS = 10_000
+
+
+def str_join_encode(rows):
+    # The original convert_dict_to_csv formatting, one row per line
+    return "\n".join(",".join(map(str, row)) for row in rows).encode()
+
+
+def str_decode(body):
+    # The original response parsing, going through a decoded str
+    return np.array(body.decode("utf-8").strip().replace("\n", ",").split(","), dtype=float)
+
+
+def main():
+    pipeline = scaler_pipeline()
+    rows = pipeline.transform(random_inputs(ROWS))
+
+    sent = sum(len(body.split(b"\n")) for body in split_payloads(rows, get_codec("csv")))
+    assert sent == ROWS, "payload splitting dropped rows"
+
+    print(f"{'codec':<22}{'bytes / 10k rows':>18}{'encode ms':>12}")
+    baseline = str_join_encode(rows)
+    print(f"{'str() join (old)':<22}{len(baseline):>18,}{timeit(lambda: str_join_encode(rows), 5) / 1000:>12.1f}")
+    for name in CODECS:
+        codec = get_codec(name)
+        body = codec.encode(rows)
+        print(f"{name:<22}{len(body):>18,}{timeit(lambda: codec.encode(rows), 5) / 1000:>12.1f}")
+
+    response = "\n".join(map(str, np.random.default_rng(0).random(ROWS))).encode()
+    assert np.array_equal(str_decode(response), decode_predictions(response))
+    print()
+    print(f"decode 10k scores, str path (old): {timeit(lambda: str_decode(response), 20) / 1000:6.2f} ms")
+    print(f"decode 10k scores, bytes path:     {timeit(lambda: decode_predictions(response), 20) / 1000:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
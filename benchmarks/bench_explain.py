@@ -0,0 +1,110 @@
+"""
+Latency budget of per-prediction explanations: what Explainer.explain costs,
+uncached and from the explanation cache, and what it adds to a Submit.
+
+Trains a throwaway XGBoost booster (300 trees of depth 6) and explains random
+scaled forms one at a time, as Submit does. First checks that each
+explanation, plus the bias term, adds up to the model's log-odds for the row.
+Submits are then timed against a stand-in endpoint that sleeps for
+--endpoint-ms: without an explanation, with one computed after the endpoint
+answers, and with one computed on the explainer's worker thread while the
+endpoint is called, as the Risk Assessment does. Exits with status 1 if the
+p99 that the overlapped explanation adds to a Submit is over --budget-ms.
+
+    python benchmarks/bench_explain.py [--requests 2000] [--endpoint-ms 30] [--budget-ms 5]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import xgboost as xgb
+
+from _common import random_inputs, scaler_pipeline
+from bench_service import train_booster
+from bench_speculation import SleepPredictor
+from cache import TTLCache
+from explain import Explainer
+from predictors import LocalXGBoostPredictor
+
+
+def latencies_ms(func, rows):
+    times = []
+    for row in rows:
+        start = time.perf_counter()
+        func(row[np.newaxis])
+        times.append(time.perf_counter() - start)
+    return np.array(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--endpoint-ms", type=float, default=30, help="latency of the stand-in endpoint")
+    parser.add_argument("--budget-ms", type=float, default=5.0, help="allowed p99 an explanation adds to a Submit")
+    args = parser.parse_args()
+
+    pipeline = scaler_pipeline()
+    rows = pipeline.transform(random_inputs(args.requests))
+    with tempfile.TemporaryDirectory() as tmp:
+        model_path = os.path.join(tmp, "xgboost-model.ubj")
+        train_booster(model_path)
+        predictor = LocalXGBoostPredictor(model_path)
+        booster = predictor.booster
+
+    uncached = Explainer(booster, pipeline)
+    cached = Explainer(booster, pipeline, cache=TTLCache(4096, 3600))
+
+    # Contributions by question plus the bias add up to the row's log-odds
+    margin = booster.predict(xgb.DMatrix(rows[:100].astype(np.float32)), output_margin=True)
+    bias = booster.predict(xgb.DMatrix(rows[:1].astype(np.float32)), pred_contribs=True)[0, -1]
+    for row, expected in zip(rows[:100], margin):
+        total = bias + sum(contribution for _, contribution in uncached.explain(row[np.newaxis]))
+        assert abs(total - expected) < 1e-3, (total, expected)
+
+    for row in rows:
+        cached.explain(row[np.newaxis])
+
+    results = [
+        ("predict (local booster)", latencies_ms(predictor.predict, rows)),
+        ("explain, uncached", latencies_ms(uncached.explain, rows)),
+        ("explain, cached", latencies_ms(cached.explain, rows)),
+    ]
+    print(f"{args.requests:,} single-form requests, {booster.num_boosted_rounds()} trees")
+    print(f"{'':<34}{'p50 ms':>9}{'p99 ms':>9}")
+    for name, times in results:
+        print(f"{name:<34}{np.percentile(times, 50):>9.3f}{np.percentile(times, 99):>9.3f}")
+
+    endpoint = SleepPredictor(args.endpoint_ms / 1000)
+    submit_rows = rows[: max(args.requests // 10, 100)]
+
+    def explain_after(row):
+        endpoint.predict(row)
+        uncached.explain(row)
+
+    def explain_overlapped(row):
+        future = uncached.submit(row)
+        endpoint.predict(row)
+        future.result()
+
+    plain = latencies_ms(endpoint.predict, submit_rows)
+    submits = [
+        ("Submit, no explanation", plain),
+        ("Submit, explanation after", latencies_ms(explain_after, submit_rows)),
+        ("Submit, explanation overlapped", latencies_ms(explain_overlapped, submit_rows)),
+    ]
+    print(f"{len(submit_rows):,} Submits against a {args.endpoint_ms:g} ms endpoint")
+    for name, times in submits:
+        print(f"{name:<34}{np.percentile(times, 50):>9.3f}{np.percentile(times, 99):>9.3f}")
+
+    added = np.percentile(submits[2][1], 99) - np.percentile(plain, 99)
+    if added > args.budget_ms:
+        print(f"FAIL: the explanation adds {added:.2f} ms to the p99 Submit, over the {args.budget_ms:g} ms budget")
+        sys.exit(1)
+    print(f"OK: the explanation adds {added:.2f} ms to the p99 Submit, within the {args.budget_ms:g} ms budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Per-rerun feature work on the Risk Assessment form: rebuilding the whole
+feature dictionary and rescaling the row, against an incremental FeatureState
+update when one answer moves. Also times FeatureGraph.derive over a batch.
+Both paths are checked to produce the same scaled values first.
+"""
+import numpy as np
+
+from _common import feature_vector, scaler_pipeline, timeit
+from batch import BATCH_INPUT_COLUMNS
+from features import FeatureGraph
+
+BATCH_ROWS = 100_000
+
+
+def random_form(rng):
+    form = dict.fromkeys(BATCH_INPUT_COLUMNS, 0)
+    form.update({
+        "Delivery_Month": int(rng.integers(1, 13)),
+        "Mothers_Age": int(rng.integers(15, 50)),
+        "Mothers_Race_Recode_31": int(rng.integers(1, 32)),
+        "Mothers_Education": int(rng.integers(1, 9)),
+        "Fathers_Age_Combined": int(rng.integers(15, 70)),
+        "Month_Prenatal_Care_Began": int(rng.integers(1, 11)),
+        "Weight_Pounds": round(float(rng.uniform(90, 300)), 1),
+        "Height_Inches": round(float(rng.uniform(55, 75)), 1),
+        "Infant_Sex": int(rng.integers(0, 2)),
+        "Total_Prior_Births": int(rng.integers(0, 5)),
+        "Last_Birth_Months": int(rng.integers(0, 120)),
+    })
+    for name in ("Diabetes_Prepregnancy", "Gestational_Hypertension", "Cigarettes_During_Pregnancy"):
+        form[name] = int(rng.random() < 0.2)
+    return form
+
+
+def full_recompute(form, pipeline):
+    # What every rerun did before: derive every feature, then order and scale the whole row
+    months = form["Last_Birth_Months"]
+    input_data = {name: form[name] for name in BATCH_INPUT_COLUMNS}
+    input_data.update({
+        "Mothers_PrePregnancy_BMI": (form["Weight_Pounds"] / (form["Height_Inches"] ** 2)) * 703,
+        "Had_Previous_Birth": 1 if form["Total_Prior_Births"] > 0 else 0,
+        "Less_than_1_year": int(months < 12),
+        "1_year_to_2.5_years": int(12 <= months < 30),
+        "2.5_years_to_4_years": int(30 <= months < 48),
+        "4_to_5.5_years": int(48 <= months < 66),
+        "Greater_than_5.5_years": int(months >= 66),
+        "Risk_Sum": sum(form[name] for name in (
+            "Diabetes_Prepregnancy", "Gestational_Diabetes", "PrePregnancy_Hypertension",
+            "Gestational_Hypertension", "Hypertension_Eclampsia", "Infertility_Treatment",
+            "Cigarettes_During_Pregnancy", "Cigarettes_Before_Pregnancy_Int",
+        )),
+    })
+    return pipeline.transform(feature_vector(pipeline, input_data))
+
+
+def main():
+    pipeline = scaler_pipeline()
+    graph = FeatureGraph(pipeline)
+    rng = np.random.default_rng(0)
+
+    # A session that keeps editing one answer at a time must always match a full recompute
+    state = graph.state()
+    form = random_form(rng)
+    state.update(form)
+    for _ in range(5000):
+        other = random_form(rng)
+        name = BATCH_INPUT_COLUMNS[rng.integers(len(BATCH_INPUT_COLUMNS))]
+        form[name] = other[name]
+        state.update(form)
+        assert np.array_equal(state.row(), full_recompute(form, pipeline)), f"incremental row differs after changing {name}"
+
+    forms = [random_form(rng) for _ in range(BATCH_ROWS)]
+    columns = {name: np.array([f[name] for f in forms], dtype=np.float64) for name in graph.input_names}
+    expected = np.vstack([full_recompute(f, pipeline) for f in forms[:1000]])
+    assert np.array_equal(pipeline.transform(graph.derive(columns))[:1000], expected), "batch rows differ"
+
+    months = iter(np.tile(np.arange(1, 13), 10_000).tolist())
+
+    def slider_rerun():
+        form["Delivery_Month"] = next(months)
+        state.update(form)
+
+    def slider_rerun_full():
+        form["Delivery_Month"] = next(months)
+        full_recompute(form, pipeline)
+
+    def weight_rerun():
+        form["Weight_Pounds"] += 0.1
+        state.update(form)
+
+    print(f"rerun, full recompute + rescale:        {timeit(slider_rerun_full, 20_000):9.1f} us")
+    print(f"rerun, incremental (Delivery_Month):    {timeit(slider_rerun, 20_000):9.1f} us")
+    print(f"rerun, incremental (Weight -> BMI):     {timeit(weight_rerun, 20_000):9.1f} us")
+    print(f"rerun, incremental (nothing changed):   {timeit(lambda: state.update(form), 20_000):9.1f} us")
+    print(f"submit, FeatureState.row():             {timeit(state.row, 20_000):9.1f} us")
+    print(f"{BATCH_ROWS // 1000}k rows, FeatureGraph.derive:        {timeit(lambda: graph.derive(columns), 20) / 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Many simulated sessions submitting feedback at once. Reports submit latency
+on the calling thread, end-to-end throughput until everything is durable, and
+checks that every submission reached the store, for both the JSONL segment
+store and the local S3 stand-in.
+"""
+import glob
+import json
+import os
+import tempfile
+import threading
+import time
+
+from _common import REPO_ROOT  # noqa: F401  (puts the repo on sys.path)
+from feedback_store import BufferedFeedbackSink, JSONLSegmentStore, LocalObjectClient, ObjectStore
+
+SESSIONS = 200
+SUBMISSIONS_PER_SESSION = 50
+
+
+def run(store, pattern):
+    sink = BufferedFeedbackSink(store)
+    latencies = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(SESSIONS)
+
+    def session(n):
+        barrier.wait()
+        local = []
+        for i in range(SUBMISSIONS_PER_SESSION):
+            start = time.perf_counter()
+            sink.submit(f"session {n} message {i}")
+            local.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=session, args=(n,)) for n in range(SESSIONS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    sink.close()
+    elapsed = time.perf_counter() - start
+
+    stored = 0
+    files = glob.glob(pattern, recursive=True)
+    for path in files:
+        with open(path, encoding="utf-8") as f:
+            stored += sum(1 for line in f if json.loads(line)["feedback"])
+    total = SESSIONS * SUBMISSIONS_PER_SESSION
+    assert stored == total, f"stored {stored} of {total} submissions"
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1e6
+    p99 = latencies[int(len(latencies) * 0.99)] * 1e6
+    return total / elapsed, p50, p99, len(files)
+
+
+def main():
+    print(f"{SESSIONS} sessions x {SUBMISSIONS_PER_SESSION} submissions")
+    print(f"{'store':<18}{'durable/s':>12}{'submit p50 us':>15}{'submit p99 us':>15}{'files':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        result = run(JSONLSegmentStore(directory), os.path.join(directory, "*.jsonl"))
+        print(f"{'jsonl segments':<18}{result[0]:>12,.0f}{result[1]:>15.1f}{result[2]:>15.1f}{result[3]:>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        result = run(ObjectStore(LocalObjectClient(directory)), os.path.join(directory, "**", "*.jsonl"))
+        print(f"{'local S3 objects':<18}{result[0]:>12,.0f}{result[1]:>15.1f}{result[2]:>15.1f}{result[3]:>8}")
+
+
+if __name__ == "__main__":
+    main()
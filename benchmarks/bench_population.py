@@ -0,0 +1,110 @@
+"""
+Population dashboard: time and peak memory to score and aggregate a cohort
+file, against scoring it one person at a time, and the cost of a re-render.
+
+Writes a synthetic cohort CSV with the batch upload's columns and scores it
+with a throwaway local XGBoost booster, chunk by chunk. The one-at-a-time
+baseline scores a sample of people with one predictor call each, as the form
+does, and is extrapolated to the whole cohort. A re-render only builds the
+tables from the cached aggregates.
+
+    python benchmarks/bench_population.py [--rows 1000000] [--chunk-rows 100000]
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from _common import scaler_pipeline
+from batch import BATCH_INPUT_COLUMNS
+from bench_service import train_booster
+from features import FeatureGraph
+from population import GROUPINGS, file_digest, summarize_cohort
+from predictors import LocalXGBoostPredictor
+
+BASELINE_ROWS = 2_000
+
+
+def write_cohort(path, n, seed=0):
+    rng = np.random.default_rng(seed)
+    columns = {name: np.zeros(n) for name in BATCH_INPUT_COLUMNS}
+    columns.update({
+        "Delivery_Month": rng.integers(1, 13, n),
+        "Mothers_Age": rng.integers(15, 50, n),
+        "Mothers_Race_Recode_31": rng.integers(1, 32, n),
+        "Mothers_Education": rng.integers(1, 9, n),
+        "Fathers_Age_Combined": rng.integers(15, 70, n),
+        "Month_Prenatal_Care_Began": rng.integers(1, 11, n),
+        "Weight_Pounds": rng.uniform(90, 300, n).round(1),
+        "Height_Inches": rng.uniform(55, 75, n).round(1),
+        "Infant_Sex": rng.integers(0, 2, n),
+        "WIC_Program": rng.integers(0, 2, n),
+        "Total_Prior_Births": rng.integers(0, 5, n),
+        "Last_Birth_Months": rng.integers(0, 120, n),
+    })
+    for name in ("Diabetes_Prepregnancy", "Gestational_Hypertension", "Cigarettes_During_Pregnancy"):
+        columns[name] = (rng.random(n) < 0.2).astype(int)
+
+    import pandas as pd
+
+    pd.DataFrame(columns).to_csv(path, index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--chunk-rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    graph = FeatureGraph(scaler_pipeline())
+    with tempfile.TemporaryDirectory() as tmp:
+        model_path = os.path.join(tmp, "xgboost-model.ubj")
+        train_booster(model_path)
+        predictor = LocalXGBoostPredictor(model_path)
+
+        path = os.path.join(tmp, "cohort.csv")
+        write_cohort(path, args.rows)
+        print(f"cohort: {args.rows:,} rows, {os.path.getsize(path) / 1e6:.0f} MB CSV")
+
+        with open(path, "rb") as source:
+            start = time.perf_counter()
+            file_digest(source)
+            print(f"file hash (once per upload):      {time.perf_counter() - start:8.2f} s")
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        summary = summarize_cohort(path, graph, predictor, args.chunk_rows)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"score and aggregate (cold):       {elapsed:8.2f} s, {args.rows / elapsed:,.0f} rows/s, peak {peak / 1e6:.0f} MB")
+
+        # What the one-row pipeline would take: derive, scale and score each person on their own
+        with open(path) as lines:
+            header = next(lines).strip().split(",")
+            sample = [dict(zip(header, map(float, next(lines).split(",")))) for _ in range(BASELINE_ROWS)]
+        start = time.perf_counter()
+        for person in sample:
+            state = graph.state()
+            state.update(person)
+            predictor.predict(state.row())
+        per_person = (time.perf_counter() - start) / BASELINE_ROWS
+        print(f"one person at a time (estimated): {per_person * args.rows:8.2f} s, {per_person * 1e6:.0f} us per person")
+
+        start = time.perf_counter()
+        repeats = 100
+        for _ in range(repeats):
+            summary.overall()
+            for name in GROUPINGS:
+                summary.groups[name].table()
+        print(f"re-render from cached aggregates: {(time.perf_counter() - start) / repeats * 1e3:8.2f} ms for every grouping")
+
+        overall = summary.overall()
+        print(f"overall: {overall['People']:,} people, mean score {overall['Mean risk score']:.3f}, {overall['High-risk share']:.1%} high risk")
+
+
+if __name__ == "__main__":
+    main()
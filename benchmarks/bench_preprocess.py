@@ -0,0 +1,33 @@
+"""
+Compares the compiled FeaturePipeline against the original pandas
+preprocess_input, for a single row and for a batch. That both produce the
+same scaled values is checked by tests/test_features.py.
+"""
+import pandas as pd
+
+from _common import SAMPLE_INPUT, feature_vector, random_inputs, scaler_pipeline, timeit
+from inference import load_scaler
+
+
+def pandas_preprocess(input_data, scaler):
+    # The per-request path this benchmark replaces
+    df = pd.DataFrame([input_data])
+    scaled_df = pd.DataFrame(scaler.transform(df[df.columns]), columns=df.columns)
+    return scaled_df.iloc[0].to_dict()
+
+
+def main():
+    scaler = load_scaler()
+    pipeline = scaler_pipeline(scaler)
+
+    batch = random_inputs(10_000)
+    frame = pd.DataFrame(batch, columns=pipeline.feature_names)
+
+    print(f"single row, pandas preprocess_input: {timeit(lambda: pandas_preprocess(SAMPLE_INPUT, scaler), 2000):9.1f} us")
+    print(f"single row, FeaturePipeline:         {timeit(lambda: pipeline.transform(feature_vector(pipeline, SAMPLE_INPUT)), 2000):9.1f} us")
+    print(f"10k rows, StandardScaler.transform:  {timeit(lambda: scaler.transform(frame), 50):9.1f} us")
+    print(f"10k rows, FeaturePipeline:           {timeit(lambda: pipeline.transform(batch), 50):9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
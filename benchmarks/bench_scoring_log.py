@@ -0,0 +1,95 @@
+"""
+Scoring log: cost of recording a Submit, and throughput and peak memory of
+the offline drift and re-scoring jobs over millions of logged rows.
+
+Writes a synthetic log whose rows follow the training scaler's distribution,
+except that Mothers_Age is shifted by --age-shift years. The drift report
+should flag that feature alone. The log is then re-scored through a throwaway
+XGBoost candidate. Peak memory is the tracemalloc peak of each job, which
+stays at a few chunks however many rows are logged.
+
+    python benchmarks/bench_scoring_log.py [--rows 2000000] [--chunk-rows 262144] [--age-shift 3]
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from _common import REPO_ROOT
+from bench_service import train_booster
+from inference import ENDPOINT_NAME, load_scaler
+from predictors import LocalXGBoostPredictor
+from registry import load_version, publish_version
+from scoring_log import SEGMENT_ROWS, ScoringLog, drift_report, rescore, write_segment
+
+
+def traced(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--chunk-rows", type=int, default=262_144)
+    parser.add_argument("--age-shift", type=float, default=3.0, help="years added to every logged age")
+    args = parser.parse_args()
+
+    scaler = load_scaler(os.path.join(REPO_ROOT, "scaler.pkl"))
+    with tempfile.TemporaryDirectory() as tmp:
+        root = os.path.join(tmp, "artifacts")
+        model_path = os.path.join(tmp, "xgboost-model.ubj")
+        train_booster(model_path)
+        publish_version(root, "v1", scaler.mean_, scaler.scale_, scaler.feature_names_in_, ENDPOINT_NAME)
+        publish_version(root, "candidate", scaler.mean_, scaler.scale_, scaler.feature_names_in_, ENDPOINT_NAME, model_path)
+        reference = load_version(root, "v1")
+        candidate = load_version(root, "candidate")
+        names = reference.pipeline.feature_names
+        age = names.index("Mothers_Age")
+
+        # Cost on the request path: record() only copies the row onto a queue
+        log = ScoringLog(os.path.join(tmp, "record"), flush_interval=0.5)
+        row = np.zeros((1, len(names)))
+        start = time.perf_counter()
+        for _ in range(10_000):
+            log.record(row, np.array([0.1]), reference)
+        record_us = (time.perf_counter() - start) / 10_000 * 1e6
+        log.close()
+        print(f"record(): {record_us:.1f} us per Submit")
+
+        directory = os.path.join(tmp, "log")
+        rng = np.random.default_rng(0)
+        start = time.perf_counter()
+        for first in range(0, args.rows, SEGMENT_ROWS):
+            n = min(SEGMENT_ROWS, args.rows - first)
+            rows = rng.standard_normal((n, len(names)))
+            rows[:, age] += args.age_shift / reference.pipeline.scale[age]
+            write_segment(directory, rows, rng.random(n), "v1", names, rng)
+        size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+        print(f"wrote {args.rows:,} rows in {time.perf_counter() - start:.1f} s, {size / 1e6:.0f} MB on disk")
+
+        (summary, report), elapsed, peak = traced(lambda: drift_report(reference, directory, root, args.chunk_rows))
+        drifted = [row["Feature"] for row in report if row["Drifted"]]
+        print(f"drift:   {summary['rows'] / elapsed:>12,.0f} rows/s, peak {peak / 1e6:.0f} MB; drifted: {', '.join(drifted) or '-'}")
+        age_row = next(row for row in report if row["Feature"] == "Mothers_Age")
+        print(f"         Mothers_Age live mean {age_row['Live mean']:.2f} vs train {age_row['Train mean']:.2f} ({age_row['Mean shift (SD)']:+.3f} SD)")
+
+        predictor = LocalXGBoostPredictor(model_path)
+        output = os.path.join(tmp, "rescored.npy")
+        result, elapsed, peak = traced(lambda: rescore(candidate, predictor, directory, root, args.chunk_rows, output))
+        print(
+            f"rescore: {result['rows'] / elapsed:>12,.0f} rows/s, peak {peak / 1e6:.0f} MB; "
+            f"{result['low_to_high']:,} LOW->HIGH, {result['high_to_low']:,} HIGH->LOW"
+        )
+
+
+if __name__ == "__main__":
+    main()
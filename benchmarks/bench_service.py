@@ -0,0 +1,127 @@
+"""
+Scoring service throughput with 1 to N worker processes.
+
+Trains a throwaway XGBoost booster on random data, publishes it with the
+real scaler into a temporary artifact registry, and starts scoring_service.py
+with the local backend (prediction cache off) once per worker count. Client
+threads then post batches to /v1/score/batch and single forms to /v1/score
+for a fixed time. Throughput can only grow with workers on a machine with
+that many free cores.
+
+    python benchmarks/bench_service.py [--max-workers 4] [--batch 1000] [--clients 8] [--seconds 5]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+import urllib3
+
+from _common import REPO_ROOT
+from bench_features import random_form
+from inference import ENDPOINT_NAME, load_scaler
+from registry import activate, publish_version
+
+
+def train_booster(path):
+    import xgboost as xgb
+
+    rng = np.random.default_rng(0)
+    features = rng.normal(size=(20_000, 25))
+    labels = (features[:, :5].sum(axis=1) + rng.normal(size=20_000) > 2).astype(int)
+    booster = xgb.train({"objective": "binary:logistic", "max_depth": 6, "nthread": 1}, xgb.DMatrix(features, labels), num_boost_round=300)
+    booster.save_model(path)
+
+
+def wait_ready(http, url, process, timeout=60, path="/healthz"):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("server exited during startup")
+        try:
+            if http.request("GET", url + path, retries=False).status == 200:
+                return
+        except urllib3.exceptions.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("server did not become ready")
+
+
+def load(http, url, path, bodies, clients, seconds):
+    done = []
+    stop = time.monotonic() + seconds
+
+    def client(i):
+        count = 0
+        while time.monotonic() < stop:
+            response = http.request("POST", url + path, body=bodies[(i + count) % len(bodies)], headers={"Content-Type": "application/json"})
+            assert response.status == 200, response.data
+            count += 1
+        done.append(count)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(done) / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--max-workers", type=int, default=4)
+    parser.add_argument("--batch", type=int, default=1000, help="records per batch request")
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(1)
+    batch_bodies = [json.dumps({"records": [random_form(rng) for _ in range(args.batch)]}).encode() for _ in range(4)]
+    single_bodies = [json.dumps(random_form(rng)).encode() for _ in range(256)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        model_path = os.path.join(tmp, "xgboost-model.ubj")
+        train_booster(model_path)
+        scaler = load_scaler(os.path.join(REPO_ROOT, "scaler.pkl"))
+        registry = os.path.join(tmp, "artifacts")
+        publish_version(registry, "bench", scaler.mean_, scaler.scale_, scaler.feature_names_in_, ENDPOINT_NAME, model_path)
+        activate(registry, "bench")
+
+        env = dict(
+            os.environ,
+            STILLSAFE_ARTIFACT_DIR=registry,
+            STILLSAFE_PREDICTOR="local",
+            STILLSAFE_PREDICTION_CACHE_SIZE="0",
+            OMP_NUM_THREADS="1",
+        )
+        url = f"http://127.0.0.1:{args.port}"
+        http = urllib3.PoolManager(maxsize=args.clients)
+
+        print(f"{os.cpu_count()} CPU(s); {args.clients} clients, {args.batch} records per batch request")
+        print(f"{'workers':>8}{'batch records/s':>18}{'single req/s':>15}")
+        for workers in range(1, args.max_workers + 1):
+            process = subprocess.Popen(
+                [sys.executable, os.path.join(REPO_ROOT, "scoring_service.py"), "--workers", str(workers), "--port", str(args.port)],
+                env=env,
+                cwd=REPO_ROOT,
+                stderr=subprocess.DEVNULL,
+            )
+            try:
+                wait_ready(http, url, process)
+                load(http, url, "/v1/score/batch", batch_bodies, args.clients, 1)  # warm up
+                batch_rps = load(http, url, "/v1/score/batch", batch_bodies, args.clients, args.seconds)
+                single_rps = load(http, url, "/v1/score", single_bodies, args.clients, args.seconds)
+            finally:
+                process.terminate()
+                process.wait()
+            print(f"{workers:>8}{batch_rps * args.batch:>18,.0f}{single_rps:>15,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Process RSS with 1, 100 and 1000 simultaneous sessions parked on the Risk
+Assessment tab (the tab with the most widgets), each having submitted the
+form once. Sessions are AppTest instances in one process against the local
+AWS fakes; every session is kept alive until the end.
+
+    python benchmarks/bench_session_memory.py [--counts 1 100 1000]
+"""
+import argparse
+import gc
+import json
+import os
+import threading
+
+from _common import REPO_ROOT
+from fakes import patch_boto3
+from load_test import Session, rss_bytes, widget
+
+
+def open_session(seed):
+    session = Session(seed)
+    session.app.session_state["tab_selection"] = "Risk Assessment"
+    session.run()
+    widget(session.app.button, "Submit").click()
+    session.run()
+    return session
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[1, 100, 1000])
+    args = parser.parse_args()
+
+    os.chdir(REPO_ROOT)
+    with patch_boto3(latency=0):
+        # Load the shared state (images, scaler, client) before the baseline reading
+        open_session(-1)
+        for thread in threading.enumerate():
+            if thread.name == "stillsafe-assets":
+                thread.join()
+        gc.collect()
+        baseline = rss_bytes()
+
+        sessions = []
+        results = []
+        for count in sorted(args.counts):
+            while len(sessions) < count:
+                sessions.append(open_session(len(sessions)))
+            gc.collect()
+            rss = rss_bytes()
+            results.append({
+                "sessions": count,
+                "rss_mb": rss / 2**20,
+                "growth_mb": (rss - baseline) / 2**20,
+                "kb_per_session": (rss - baseline) / count / 1024,
+            })
+
+    print(json.dumps({"baseline_rss_mb": baseline / 2**20, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
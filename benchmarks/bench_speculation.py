@@ -0,0 +1,92 @@
+"""
+Simulated users filling in the Risk Assessment form, with and without
+speculative pre-scoring, against a predictor that sleeps for a fixed latency.
+Reports Submit latency, the speculative hit rate and the endpoint calls spent
+per Submit. Time is scaled down: think times, debounce and latency are all in
+fractions of a second.
+
+    python benchmarks/bench_speculation.py [--users 16] [--edits 20] [--latency-ms 300]
+"""
+import argparse
+import threading
+import time
+
+import numpy as np
+
+from _common import random_inputs
+from predictors import Predictor
+from speculation import SpeculationStats, SpeculativePredictor
+
+
+class SleepPredictor(Predictor):
+    model_id = "sleep"
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def predict(self, rows):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.latency)
+        return np.zeros(len(np.atleast_2d(rows)))
+
+
+def user(seed, predictor, speculative, args, submit_latencies):
+    rng = np.random.default_rng(seed)
+    rows = random_inputs(args.edits, seed=seed)
+    front = SpeculativePredictor(predictor, debounce=args.debounce_ms / 1000, max_calls=args.max_calls, stats=args.stats) if speculative else predictor
+    for row in rows:
+        if speculative:
+            front.schedule(row[np.newaxis])
+        # Most answers follow quickly; some take a while (reading, looking something up)
+        time.sleep(rng.exponential(args.think_ms / 1000))
+    # Looking the answers over before pressing Submit
+    time.sleep(rng.exponential(args.review_ms / 1000))
+    start = time.perf_counter()
+    front.predict(rows[-1][np.newaxis])
+    submit_latencies.append(time.perf_counter() - start)
+
+
+def run(speculative, args):
+    predictor = SleepPredictor(args.latency_ms / 1000)
+    args.stats = SpeculationStats()
+    submit_latencies = []
+    threads = [threading.Thread(target=user, args=(seed, predictor, speculative, args, submit_latencies)) for seed in range(args.users)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    latencies = np.array(submit_latencies) * 1000
+    summary = args.stats.summary()
+    return {
+        "submit_p50_ms": np.percentile(latencies, 50),
+        "submit_p95_ms": np.percentile(latencies, 95),
+        "hit_rate": summary["hit_rate"] if speculative else 0.0,
+        "calls_per_submit": predictor.calls / args.users,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--users", type=int, default=16)
+    parser.add_argument("--edits", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=300)
+    parser.add_argument("--think-ms", type=float, default=60, help="mean pause between answers")
+    parser.add_argument("--review-ms", type=float, default=1000, help="mean pause before pressing Submit")
+    parser.add_argument("--debounce-ms", type=float, default=150)
+    parser.add_argument("--max-calls", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'mode':<14}{'submit p50 ms':>15}{'submit p95 ms':>15}{'hit rate':>10}{'calls/submit':>14}")
+    for speculative in (False, True):
+        result = run(speculative, args)
+        print(
+            f"{'speculative' if speculative else 'off':<14}{result['submit_p50_ms']:>15.1f}{result['submit_p95_ms']:>15.1f}"
+            f"{result['hit_rate']:>10.0%}{result['calls_per_submit']:>14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
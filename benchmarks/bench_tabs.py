@@ -0,0 +1,57 @@
+"""
+Cold-start and per-rerun time for each tab, run headless with Streamlit's
+AppTest. Each tab is measured in a fresh interpreter so the cold start
+includes its own imports; the heavy modules it ended up loading are listed.
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+
+from _common import REPO_ROOT
+
+RERUNS = 20
+HEAVY_MODULES = ["numpy", "pandas", "boto3", "sklearn", "xgboost"]
+
+TABS = ["Home", "Risk Assessment", "Meet Our Team", "StillSafe Tips for Success", "Feedback"]
+
+
+def measure(tab):
+    # Runs inside the child interpreter
+    from streamlit.testing.v1 import AppTest
+
+    loaded_before = {name for name in HEAVY_MODULES if name in sys.modules}
+    app = AppTest.from_file(os.path.join(REPO_ROOT, "streamlit_app.py"), default_timeout=60)
+    app.session_state["tab_selection"] = tab
+
+    start = time.perf_counter()
+    app.run()
+    cold = time.perf_counter() - start
+    assert not app.exception, app.exception
+
+    start = time.perf_counter()
+    for _ in range(RERUNS):
+        app.run()
+    rerun = (time.perf_counter() - start) / RERUNS
+
+    heavy = sorted(name for name in HEAVY_MODULES if name in sys.modules and name not in loaded_before)
+    print(json.dumps({"tab": tab, "cold_ms": cold * 1000, "rerun_ms": rerun * 1000, "heavy_imports": heavy}))
+
+
+def main():
+    print(f"{'tab':<30}{'cold start ms':>15}{'rerun ms':>10}  heavy imports")
+    for tab in TABS:
+        output = subprocess.run(
+            [sys.executable, __file__, tab], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(f"{tab:<30}{result['cold_ms']:>15.0f}{result['rerun_ms']:>10.1f}  {', '.join(result['heavy_imports']) or '-'}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        os.chdir(REPO_ROOT)
+        measure(sys.argv[1])
+    else:
+        main()
@@ -0,0 +1,145 @@
+"""
+Tail latency of concurrent Submits against a local HTTPS stand-in for the
+SageMaker endpoint, with the runtime client's old transport settings and with
+the shared transport configuration (inference.runtime_client_config), at
+its defaults and with workers and pool matched to the submitters.
+
+The stand-in is a threaded HTTPS server in a child process with a throwaway
+self-signed certificate (made with the openssl command-line tool). It answers
+invoke_endpoint after a fixed latency and counts the TLS connections it
+accepts. A real boto3 sagemaker-runtime client signs and sends every request,
+through SageMakerPredictor and EndpointInvoker as in the app. Each submitter
+sends single-row requests with random pauses between them.
+
+    python benchmarks/bench_transport.py [--submitters 50] [--seconds 10] [--latency-ms 50]
+"""
+import argparse
+import http.server
+import multiprocessing
+import os
+import ssl
+import subprocess
+import tempfile
+import time
+
+import boto3
+import numpy as np
+from botocore.config import Config
+
+from _common import random_inputs
+from bench_coalescing import run
+from inference import REGION_NAME, runtime_client_config
+from invocation import INVOCATION_WORKERS, EndpointInvoker
+from predictors import SageMakerPredictor
+
+
+class StandInHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep connections open between requests
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        time.sleep(self.server.latency)
+        answer = "\n".join(["0.2"] * (body.strip().count(b"\n") + 1)).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/csv")
+        self.send_header("Content-Length", str(len(answer)))
+        self.end_headers()
+        self.wfile.write(answer)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StandInServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def get_request(self):
+        sock, address = super().get_request()
+        with self.connections.get_lock():
+            self.connections.value += 1
+        return sock, address
+
+
+def serve(port, cert, key, latency, connections, ready):
+    server = StandInServer(("127.0.0.1", port), StandInHandler)
+    server.latency = latency
+    server.connections = connections
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    server.socket = context.wrap_socket(server.socket, server_side=True, do_handshake_on_connect=False)
+    ready.set()
+    server.serve_forever()
+
+
+class StandInContext:
+    """
+    The part of InferenceContext SageMakerPredictor uses: a runtime client.
+    """
+
+    def __init__(self, url, cert, config):
+        self.runtime = boto3.client(
+            "sagemaker-runtime",
+            region_name=REGION_NAME,
+            endpoint_url=url,
+            verify=cert,
+            aws_access_key_id="FAKE",
+            aws_secret_access_key="FAKE",
+            aws_session_token="FAKE",
+            config=config,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--submitters", type=int, default=50)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--latency-ms", type=float, default=50, help="stand-in endpoint latency")
+    parser.add_argument("--think-ms", type=float, default=200, help="mean pause between a submitter's requests")
+    parser.add_argument("--port", type=int, default=8443)
+    args = parser.parse_args()
+
+    settings = [
+        # Before: botocore's default pool of 10, legacy retries, 2 s connect timeout, 8 invocation workers
+        ("before", 8, Config(connect_timeout=2, read_timeout=5, retries={"total_max_attempts": 1})),
+        ("workers only", args.submitters, Config(connect_timeout=2, read_timeout=5, retries={"total_max_attempts": 1})),
+        ("defaults", INVOCATION_WORKERS, runtime_client_config()),
+        ("after", args.submitters, runtime_client_config(pool_size=args.submitters)),
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cert, key = os.path.join(tmp, "cert.pem"), os.path.join(tmp, "key.pem")
+        subprocess.run(
+            [
+                "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1", "-keyout", key, "-out", cert,
+                "-subj", "/CN=127.0.0.1", "-addext", "subjectAltName=IP:127.0.0.1",
+            ],
+            check=True,
+            capture_output=True,
+        )
+        connections = multiprocessing.Value("i", 0)
+        ready = multiprocessing.Event()
+        server = multiprocessing.Process(target=serve, args=(args.port, cert, key, args.latency_ms / 1000, connections, ready), daemon=True)
+        server.start()
+        ready.wait(10)
+
+        print(f"{args.submitters} submitters, stand-in endpoint {args.latency_ms:g} ms, mean pause {args.think_ms:g} ms")
+        print(f"{'transport':<14}{'workers':>8}{'pool':>6}{'req/s':>8}{'p50 ms':>9}{'p99 ms':>9}{'TLS conns':>11}{'failed':>8}")
+        try:
+            for name, workers, config in settings:
+                context = StandInContext(f"https://127.0.0.1:{args.port}", cert, config)
+                predictor = SageMakerPredictor(context, "bench", invoker=EndpointInvoker(workers=workers))
+                predictor.predict(random_inputs(1))  # first connection, as after the startup warm-up
+                start_connections = connections.value
+                latencies, failed = run(predictor, args.submitters, args.seconds, args.think_ms / 1000)
+                print(
+                    f"{name:<14}{workers:>8}{config.max_pool_connections:>6}{len(latencies) / args.seconds:>8,.0f}"
+                    f"{np.percentile(latencies, 50):>9.1f}{np.percentile(latencies, 99):>9.1f}"
+                    f"{connections.value - start_connections:>11,}{failed:>8,}"
+                )
+        finally:
+            server.terminate()
+
+
+if __name__ == "__main__":
+    main()
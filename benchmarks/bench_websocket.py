@@ -0,0 +1,133 @@
+"""
+Bytes the Streamlit server sends over the websocket per rerun, for each tab.
+
+Starts the app with `streamlit run` (local backend, a throwaway booster in a
+temporary artifact registry) and drives it the way the browser does: one
+websocket session, rerun requests carrying the sidebar radio's state, and the
+hashes of the messages the client has cached, so messages the client already
+holds come back as short references. For each tab it reports the first visit
+and the mean of later reruns; the Submit row is a first and a repeated
+Submit on Risk Assessment. Sizes are the serialized protobuf frames, before any
+permessage-deflate compression. Needs the `websockets` package.
+
+    python benchmarks/bench_websocket.py [--reruns 5] [--port 8766]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+
+import urllib3
+from websockets.sync.client import connect
+
+from _common import REPO_ROOT
+from bench_service import train_booster, wait_ready
+from inference import ENDPOINT_NAME, load_scaler
+from registry import activate, publish_version
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+TABS = ["Home", "Risk Assessment", "Meet Our Team", "StillSafe Tips for Success", "Feedback"]
+
+# Reruns a cached message survives without being used again (global.maxCachedMessageAge)
+MAX_CACHED_MESSAGE_AGE = 2
+
+
+class Client:
+    """
+    A minimal stand-in for the browser: sends reruns, tallies the bytes of the
+    replies and keeps the forward-message cache the frontend keeps.
+    """
+
+    def __init__(self, ws):
+        self.ws = ws
+        self.cache = {}  # message hash -> age in reruns
+        self.widgets = {}  # label -> widget id
+        self.radio_id = None
+
+    def rerun(self, tab, trigger=None):
+        back = BackMsg()
+        state = back.rerun_script
+        state.cached_message_hashes.extend(self.cache)
+        if self.radio_id is not None:
+            widget = state.widget_states.widgets.add()
+            widget.id = self.radio_id
+            widget.string_value = tab
+        if trigger is not None:
+            widget = state.widget_states.widgets.add()
+            widget.id = self.widgets[trigger]
+            widget.trigger_value = True
+        self.ws.send(back.SerializeToString())
+
+        total = 0
+        while True:
+            frame = self.ws.recv()
+            total += len(frame)
+            msg = ForwardMsg()
+            msg.ParseFromString(frame)
+            kind = msg.WhichOneof("type")
+            if kind == "ref_hash":
+                self.cache[msg.ref_hash] = 0
+            elif msg.metadata.cacheable:
+                self.cache[msg.hash] = 0
+            if kind == "delta" and msg.delta.WhichOneof("type") == "new_element":
+                element = msg.delta.new_element
+                if element.WhichOneof("type") == "radio" and element.radio.label == "Go to":
+                    self.radio_id = element.radio.id
+                elif element.WhichOneof("type") == "button":
+                    self.widgets[element.button.label] = element.button.id
+            if kind == "script_finished":
+                break
+        self.cache = {h: age + 1 for h, age in self.cache.items() if age < MAX_CACHED_MESSAGE_AGE}
+        return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--reruns", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        model_path = os.path.join(tmp, "xgboost-model.ubj")
+        train_booster(model_path)
+        scaler = load_scaler(os.path.join(REPO_ROOT, "scaler.pkl"))
+        registry = os.path.join(tmp, "artifacts")
+        publish_version(registry, "bench", scaler.mean_, scaler.scale_, scaler.feature_names_in_, ENDPOINT_NAME, model_path)
+        activate(registry, "bench")
+
+        env = dict(os.environ, STILLSAFE_ARTIFACT_DIR=registry, STILLSAFE_PREDICTOR="local")
+        process = subprocess.Popen(
+            [
+                sys.executable, "-m", "streamlit", "run", os.path.join(REPO_ROOT, "streamlit_app.py"),
+                "--server.headless", "true", "--server.port", str(args.port),
+            ],
+            env=env,
+            cwd=REPO_ROOT,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            url = f"http://127.0.0.1:{args.port}"
+            wait_ready(urllib3.PoolManager(), url, process, path="/_stcore/health")
+            with connect(f"ws://127.0.0.1:{args.port}/_stcore/stream", subprotocols=["streamlit"], origin="http://localhost", max_size=None) as ws:
+                client = Client(ws)
+                start = client.rerun(TABS[0])  # session start; learns the radio's widget id
+
+                print(f"{'tab':<30}{'first visit':>13}{'per rerun':>11}  (bytes)")
+                for tab in TABS:
+                    first = start if tab == TABS[0] else client.rerun(tab)
+                    later = sum(client.rerun(tab) for _ in range(args.reruns)) / args.reruns
+                    print(f"{tab:<30}{first:>13,}{later:>11,.0f}")
+
+                client.rerun("Risk Assessment")
+                submits = [client.rerun("Risk Assessment", trigger="Submit") for _ in range(2)]
+                print(f"{'Risk Assessment, Submit':<30}{submits[0]:>13,}{submits[1]:>11,}")
+        finally:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Wall time and endpoint calls for the what-if table around the default form:
+one SageMaker request per scenario, as a naive loop would make, against the
+single batched request sensitivity_table sends. Uses the local AWS fakes with
+a fixed endpoint latency. The batched rows are first checked against scaling
+each scenario on its own.
+
+    python benchmarks/bench_whatif.py [--latency-ms 100]
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+from _common import REPO_ROOT
+from fakes import patch_boto3
+from inference import InferenceContext
+from predictors import SageMakerPredictor
+from whatif import build_scenarios, sensitivity_table
+
+# The Risk Assessment form's defaults, as encoded answers
+DEFAULT_FORM = {
+    "Delivery_Month": 1,
+    "Mothers_Age": 30,
+    "Mothers_Race_Recode_31": 1,
+    "Mothers_Education": 1,
+    "Fathers_Age_Combined": 30,
+    "Month_Prenatal_Care_Began": 1,
+    "Weight_Pounds": 120.0,
+    "Height_Inches": 60.0,
+    "Diabetes_Prepregnancy": 0,
+    "Gestational_Diabetes": 0,
+    "PrePregnancy_Hypertension": 0,
+    "Gestational_Hypertension": 0,
+    "Hypertension_Eclampsia": 0,
+    "Infertility_Treatment": 0,
+    "Infant_Sex": 1,
+    "WIC_Program": 0,
+    "Cigarettes_During_Pregnancy": 0,
+    "Cigarettes_Before_Pregnancy_Int": 0,
+    "Total_Prior_Births": 0,
+    "Last_Birth_Months": 0,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--latency-ms", type=float, default=100)
+    args = parser.parse_args()
+
+    os.chdir(REPO_ROOT)
+    with patch_boto3(latency=args.latency_ms / 1000) as counter:
+        context = InferenceContext()
+        graph = context.graph
+        predictor = SageMakerPredictor(context)
+        scenarios = build_scenarios(DEFAULT_FORM)
+
+        rows = []
+        for _, _, inputs in scenarios:
+            state = graph.state()
+            state.update(inputs)
+            rows.append(state.row())
+        columns = {name: np.array([s[name] for _, _, s in scenarios], dtype=np.float64) for name in graph.input_names}
+        assert np.array_equal(np.vstack(rows), graph.pipeline.transform(graph.derive(columns))), "batched rows differ"
+
+        predictor.predict(rows[0])  # credentials and client
+        before = counter["invoke_calls"]
+        start = time.perf_counter()
+        for row in rows:
+            predictor.predict(row)
+        serial_ms = (time.perf_counter() - start) * 1000
+        serial_calls = counter["invoke_calls"] - before
+
+        before = counter["invoke_calls"]
+        start = time.perf_counter()
+        sensitivity_table(DEFAULT_FORM, graph, predictor)
+        batched_ms = (time.perf_counter() - start) * 1000
+        batched_calls = counter["invoke_calls"] - before
+
+    print(f"{len(scenarios)} scenarios, endpoint latency {args.latency_ms:g} ms")
+    print(f"one request per scenario: {serial_ms:8.1f} ms, {serial_calls} endpoint calls")
+    print(f"sensitivity_table:        {batched_ms:8.1f} ms, {batched_calls} endpoint call(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Local stand-ins for the AWS clients the app uses, so benchmarks run without
+network access. patch_boto3() swaps boto3.client for a factory that returns
+them.
+"""
+import collections
+import datetime
+import io
+import random
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from unittest import mock
+
+from botocore.exceptions import ClientError
+
+from _common import REPO_ROOT  # noqa: F401  (puts the repo on sys.path)
+from payloads import RECORDIO_MAGIC
+
+
+class FakeCognitoClient:
+    def __init__(self, counter):
+        self.counter = counter
+
+    def get_id(self, IdentityPoolId):
+        self.counter.add("cognito_calls")
+        return {"IdentityId": "us-east-1:fake-identity"}
+
+    def get_credentials_for_identity(self, IdentityId):
+        return {
+            "Credentials": {
+                "AccessKeyId": "FAKE",
+                "SecretKey": "FAKE",
+                "SessionToken": "FAKE",
+                "Expiration": datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(hours=1),
+            }
+        }
+
+
+class FakeSageMakerRuntime:
+    """
+    Answers invoke_endpoint after a configurable latency with one score per row.
+
+    Parameters:
+        counter (dict): Shared call counters.
+        latency (float): Seconds each call takes.
+        jitter (float): Extra uniformly random seconds added to each call.
+        score (float): Score returned for every row.
+        capacity (int): Calls the endpoint serves at once; more are throttled. None for no limit.
+
+    Errors queued with fail_next() are raised by the next calls, in order.
+    """
+
+    def __init__(self, counter, latency=0.05, jitter=0.0, score=0.2, capacity=None):
+        self.counter = counter
+        self.latency = latency
+        self.jitter = jitter
+        self.score = score
+        self._slots = threading.BoundedSemaphore(capacity) if capacity else None
+        self._errors = collections.deque()
+
+    def fail_next(self, *errors):
+        """
+        Makes the next calls raise these errors, one per call.
+        """
+        self._errors.extend(errors)
+
+    def invoke_endpoint(self, EndpointName, ContentType, Body, Accept="text/csv"):
+        self.counter.add("invoke_calls")
+        try:
+            error = self._errors.popleft()
+        except IndexError:
+            error = None
+        if error is not None:
+            self.counter.add("errors")
+            raise error
+        if self._slots is None:
+            return self._answer(ContentType, Body)
+        if not self._slots.acquire(blocking=False):
+            self.counter.add("throttled")
+            raise ClientError({"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}}, "InvokeEndpoint")
+        try:
+            return self._answer(ContentType, Body)
+        finally:
+            self._slots.release()
+
+    def _answer(self, ContentType, Body):
+        time.sleep(self.latency + random.uniform(0, self.jitter))
+        if ContentType == "application/x-recordio-protobuf":
+            rows = Body.count(struct.pack("<I", RECORDIO_MAGIC))
+        else:
+            rows = Body.strip().count(b"\n") + 1
+        self.counter.add("rows_scored", rows)
+        return {"Body": io.BytesIO("\n".join([str(self.score)] * rows).encode())}
+
+
+class Counter(dict):
+    """
+    Call counters that several threads can bump at once.
+    """
+
+    def __init__(self):
+        super().__init__(cognito_calls=0, invoke_calls=0, rows_scored=0, throttled=0, errors=0)
+        self._lock = threading.Lock()
+
+    def add(self, key, amount=1):
+        with self._lock:
+            self[key] += amount
+
+
+@contextmanager
+def patch_boto3(latency=0.05, jitter=0.0, capacity=None):
+    """
+    Replaces boto3.client with the fakes for the duration of the block.
+
+    Yields:
+        Counter: Cognito and SageMaker call counts.
+    """
+    import boto3
+
+    counter = Counter()
+    runtime = FakeSageMakerRuntime(counter, latency, jitter, capacity=capacity)
+
+    def client(service_name, **kwargs):
+        if service_name == "cognito-identity":
+            return FakeCognitoClient(counter)
+        if service_name == "sagemaker-runtime":
+            return runtime
+        raise ValueError(f"No fake for {service_name}")
+
+    with mock.patch.object(boto3, "client", client):
+        yield counter
@@ -0,0 +1,197 @@
+"""
+Headless load test: simulated sessions drive streamlit_app.py through
+Streamlit's AppTest against local fakes for Cognito and sagemaker-runtime.
+Each session switches tabs, moves the age slider and submits the Risk
+Assessment form.
+
+AppTest installs a single mock Streamlit runtime per process, so sessions
+inside one process take turns rather than running in parallel. Concurrency
+comes from --processes, each driving its share of the sessions against its
+own copy of the app.
+
+Prints one JSON document (also written to --output) with reruns/sec, submit
+latency percentiles, RSS per session and the endpoint call counts, so runs
+can be compared across commits.
+
+    python benchmarks/load_test.py --sessions 40 --processes 4 --iterations 10 --latency-ms 50
+"""
+import argparse
+import gc
+import json
+import multiprocessing
+import os
+import platform
+import random
+import subprocess
+import sys
+import threading
+import time
+
+from _common import REPO_ROOT
+from fakes import patch_boto3
+from warmup import WARM_UP
+
+TABS = ["Home", "Risk Assessment", "Meet Our Team", "StillSafe Tips for Success", "Population Dashboard", "Feedback"]
+
+
+def rss_bytes():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+def percentile(values, q):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+def widget(elements, label_prefix):
+    return next(element for element in elements if element.label.startswith(label_prefix))
+
+
+class Session:
+    """
+    One simulated visitor with its own AppTest script run and session state.
+    """
+
+    def __init__(self, seed):
+        from streamlit.testing.v1 import AppTest
+
+        self.app = AppTest.from_file(os.path.join(REPO_ROOT, "streamlit_app.py"), default_timeout=120)
+        self.random = random.Random(seed)
+        self.reruns = 0
+        self.submit_latencies = []
+        self.errors = 0
+
+    def run(self):
+        self.app.run()
+        self.reruns += 1
+        if self.app.exception:
+            self.errors += 1
+
+    def step(self):
+        self.app.session_state["tab_selection"] = self.random.choice(TABS)
+        self.run()
+        if self.app.session_state["tab_selection"] != "Risk Assessment":
+            return
+
+        widget(self.app.slider, "How old are you").set_value(self.random.randint(18, 45))
+        self.run()
+        widget(self.app.button, "Submit").click()
+        start = time.perf_counter()
+        self.run()
+        self.submit_latencies.append(time.perf_counter() - start)
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def drive(job):
+    """
+    Runs a share of the sessions in this process and returns their raw measurements.
+    """
+    first_seed, count, iterations, latency, jitter = job
+    os.chdir(REPO_ROOT)
+    with patch_boto3(latency=latency, jitter=jitter) as counter:
+        # Warm the process-wide caches (images, scaler, client) so sessions measure steady state
+        warm = Session(-1)
+        warm.run()
+        WARM_UP.wait(60)
+        warm.app.session_state["tab_selection"] = "Risk Assessment"
+        warm.run()
+        widget(warm.app.button, "Submit").click()
+        warm.run()
+        for thread in threading.enumerate():
+            if thread.name == "stillsafe-assets":
+                thread.join()
+
+        gc.collect()
+        rss_before = rss_bytes()
+        sessions = [Session(first_seed + n) for n in range(count)]
+        for session in sessions:
+            session.run()
+        gc.collect()
+        rss_after = rss_bytes()
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            for session in sessions:
+                session.step()
+        elapsed = time.perf_counter() - start
+
+    return {
+        "elapsed": elapsed,
+        "reruns": sum(session.reruns for session in sessions) - count,
+        "submits": [latency for session in sessions for latency in session.submit_latencies],
+        "rss_per_session": (rss_after - rss_before) / count,
+        "rss_total": rss_bytes(),
+        "errors": sum(session.errors for session in sessions),
+        "endpoint": dict(counter),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--iterations", type=int, default=10, help="tab switches per session")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="fake endpoint latency")
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="also write the JSON result to this file")
+    args = parser.parse_args()
+
+    shares = [args.sessions // args.processes + (n < args.sessions % args.processes) for n in range(args.processes)]
+    jobs = [
+        (args.seed + sum(shares[:n]), share, args.iterations, args.latency_ms / 1000, args.jitter_ms / 1000)
+        for n, share in enumerate(shares)
+        if share
+    ]
+    start = time.perf_counter()
+    if len(jobs) == 1:
+        results = [drive(jobs[0])]
+    else:
+        with multiprocessing.get_context("spawn").Pool(len(jobs)) as pool:
+            results = pool.map(drive, jobs)
+    wall = time.perf_counter() - start
+
+    reruns = sum(r["reruns"] for r in results)
+    busy = max(r["elapsed"] for r in results)
+    submits = [latency for r in results for latency in r["submits"]]
+    endpoint = {key: sum(r["endpoint"][key] for r in results) for key in results[0]["endpoint"]}
+    result = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "config": vars(args),
+        "wall_seconds": wall,
+        "reruns": reruns,
+        "reruns_per_second": reruns / busy,
+        "submits": len(submits),
+        "submit_latency_ms": {
+            name: (percentile(submits, q) * 1000 if submits else None)
+            for name, q in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99))
+        },
+        "rss_per_session_bytes": sum(r["rss_per_session"] for r in results) / len(results),
+        "rss_per_process_bytes": [r["rss_total"] for r in results],
+        "script_errors": sum(r["errors"] for r in results),
+        "endpoint": endpoint,
+    }
+    output = json.dumps(result, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
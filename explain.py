@@ -0,0 +1,182 @@
+# Per-prediction explanations.
+#
+# XGBoost computes exact TreeSHAP contributions (pred_contribs) locally, in
+# one pass over the trees of the booster the endpoint serves; nothing is sent
+# to the endpoint. Each model feature's contribution is then added to the form
+# question it comes from, e.g. the five last-birth buckets become "Months since
+# last pregnancy". Risk_Sum, the number of "Yes" risk factors, is not a question
+# of its own: its contribution is shared equally by the risk factors answered
+# "Yes" on that form, so a "No" answer is never credited with it. With none
+# answered "Yes" it is shown as NO_RISK_FACTORS. Contributions are in log-odds, relative to the model's average prediction,
+# and add up to the row's score.
+
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from cache import TTLCache
+from features import RISK_FACTOR_COLUMNS
+from metrics import REGISTRY, span
+from predictors import MODEL_PATH, PREDICTION_CACHE_SIZE, PREDICTION_CACHE_TTL
+from whatif import RISK_FACTOR_LABELS
+
+# Set STILLSAFE_EXPLANATIONS=0 to leave the contributions out of the result
+EXPLANATIONS = os.environ.get("STILLSAFE_EXPLANATIONS", "1") == "1"
+
+# Questions shown with a result, at most
+TOP_FACTORS = 5
+
+# Longest Submit waits for an explanation once the risk score is back; a
+# slower one is skipped so it never delays the result
+EXPLAIN_TIMEOUT_SECONDS = float(os.environ.get("STILLSAFE_EXPLAIN_TIMEOUT", "0.05"))
+
+# Threads that compute explanations while Submit waits on the endpoint. The
+# work is CPU-bound and XGBoost releases the GIL, so one per core.
+EXPLAIN_WORKERS = os.cpu_count() or 1
+
+# Form question each model feature comes from
+QUESTION_LABELS = {
+    "Delivery_Month": "Expected delivery month",
+    "Mothers_Age": "Your age",
+    "Mothers_Race_Recode_31": "Race",
+    "Mothers_Education": "Education",
+    "Fathers_Age_Combined": "Father's age",
+    "Month_Prenatal_Care_Began": "Month prenatal care began",
+    "Mothers_PrePregnancy_BMI": "Pre-pregnancy BMI (weight and height)",
+    **RISK_FACTOR_LABELS,
+    "Infant_Sex": "Baby's sex",
+    "WIC_Program": "WIC participation",
+    "Total_Prior_Births": "Previous pregnancies",
+    "Had_Previous_Birth": "Previous pregnancies",
+    "Less_than_1_year": "Months since last pregnancy",
+    "1_year_to_2.5_years": "Months since last pregnancy",
+    "2.5_years_to_4_years": "Months since last pregnancy",
+    "4_to_5.5_years": "Months since last pregnancy",
+    "Greater_than_5.5_years": "Months since last pregnancy",
+}
+
+# Derived features that count the "Yes" answers to several yes/no questions:
+# their contribution is split equally between the questions answered "Yes"
+SHARED_FEATURES = {
+    "Risk_Sum": RISK_FACTOR_COLUMNS,
+}
+
+# Shown for the Risk_Sum contribution of a form with no risk factor answered "Yes"
+NO_RISK_FACTORS = "No risk factors"
+
+
+class Explainer:
+    """
+    Explains single predictions of a local copy of the served booster.
+
+    Explanations are kept in an LRU+TTL cache keyed like the prediction cache,
+    on the scaled row, the model and the artifact digest, so a repeated form
+    gets its score and its explanation from memory. submit() computes one on a
+    worker thread, so it overlaps the endpoint call instead of following it.
+    """
+
+    def __init__(self, booster, pipeline, model_id="", artifact_digest="", cache=None, workers=EXPLAIN_WORKERS):
+        feature_names = pipeline.feature_names
+        if booster.num_features() != len(feature_names):
+            raise ValueError(f"Booster has {booster.num_features()} features, the artifacts list {len(feature_names)}")
+        self.booster = booster
+        self.cache = cache
+        self._key_prefix = f"{model_id}|{artifact_digest}|".encode()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stillsafe-explain")
+
+        # (n_features, n_questions) 0/1 matrix that adds feature contributions up by question
+        self.questions = tuple(dict.fromkeys(QUESTION_LABELS[name] for name in feature_names if name in QUESTION_LABELS))
+        self.grouping = np.zeros((len(feature_names), len(self.questions)))
+        for i, name in enumerate(feature_names):
+            if name in QUESTION_LABELS:
+                self.grouping[i, self.questions.index(QUESTION_LABELS[name])] = 1.0
+
+        # Shared features, with the positions of their yes/no features and of
+        # those features' questions, and the scaler arrays to read the answers back
+        self.shared = []
+        for name, sources in SHARED_FEATURES.items():
+            if name in feature_names:
+                source_index = np.array([feature_names.index(source) for source in sources])
+                question_index = np.array([self.questions.index(QUESTION_LABELS[source]) for source in sources])
+                mean, scale = pipeline.mean[source_index], pipeline.scale[source_index]
+                self.shared.append((feature_names.index(name), source_index, question_index, mean, scale))
+
+    def explain(self, row):
+        """
+        Returns the contribution of each form question to one prediction.
+
+        Parameters:
+            row (np.ndarray): A (1, n_features) array of features scaled by the pipeline.
+
+        Returns:
+            list: (question, contribution) pairs, largest effect first. Positive
+                contributions raised the risk score, negative ones lowered it.
+        """
+        row = np.ascontiguousarray(np.atleast_2d(row), dtype=np.float64)
+        key = hashlib.blake2b(self._key_prefix + row.tobytes(), digest_size=16).digest()
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        # Imported here, like the local backend, so the SageMaker backend does not need xgboost
+        import xgboost as xgb
+
+        with span("explain"):
+            contributions = self.booster.predict(xgb.DMatrix(row.astype(np.float32)), pred_contribs=True)
+            # The last column is the bias term, which belongs to no question
+            by_question = contributions[0, :-1] @ self.grouping
+            unshared = 0.0
+            for feature, source_index, question_index, mean, scale in self.shared:
+                answered_yes = row[0, source_index] * scale + mean > 0.5
+                if answered_yes.any():
+                    by_question[question_index[answered_yes]] += contributions[0, feature] / answered_yes.sum()
+                else:
+                    unshared += contributions[0, feature]
+        explanation = list(zip(self.questions, by_question.tolist()))
+        if unshared:
+            explanation.append((NO_RISK_FACTORS, float(unshared)))
+        explanation.sort(key=lambda item: -abs(item[1]))
+        if self.cache is not None:
+            self.cache.put(key, explanation)
+        return explanation
+
+    def submit(self, row):
+        """
+        Starts explain(row) on a worker thread.
+
+        Returns:
+            Future: Resolves to the explanation.
+        """
+        return self._executor.submit(self.explain, row)
+
+
+def build_explainer(artifacts, enabled=EXPLANATIONS):
+    """
+    Loads the booster of an artifact version for explanations.
+
+    Parameters:
+        artifacts (ArtifactVersion): The version being served.
+        enabled (bool): Whether explanations are turned on.
+
+    Returns:
+        Explainer: The explainer, or None if explanations are off, xgboost is
+            not installed or no local copy of the booster exists.
+    """
+    model_path = artifacts.model_path or MODEL_PATH
+    if not enabled or not os.path.exists(model_path):
+        return None
+    try:
+        import xgboost as xgb
+    except ImportError:
+        return None
+
+    booster = xgb.Booster()
+    booster.load_model(model_path)
+    cache = None
+    if PREDICTION_CACHE_SIZE > 0:
+        cache = TTLCache(PREDICTION_CACHE_SIZE, PREDICTION_CACHE_TTL)
+        REGISTRY.register_cache("explanation", cache)
+    return Explainer(booster, artifacts.pipeline, f"local:{model_path}", artifacts.digest, cache)
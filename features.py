@@ -0,0 +1,215 @@
+from typing import Callable, NamedTuple
+
+import numpy as np
+
+
+class FeaturePipeline:
+    """
+    Standard scaling compiled down to the fitted arrays of the training scaler.
+
+    Holds the scaler's mean_ and scale_ in feature_names_in_ order and applies
+    them to a single row or an (N, 25) matrix in one NumPy pass, producing the
+    same values as StandardScaler.transform without any DataFrames.
+    """
+
+    def __init__(self, mean, scale, feature_names):
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.feature_names = tuple(feature_names)
+        self.feature_index = {name: i for i, name in enumerate(self.feature_names)}
+
+    def transform(self, rows):
+        """
+        Scales a single row or a matrix of rows.
+
+        Parameters:
+            rows (array-like): Shape (n_features,) or (N, n_features), in feature_names order.
+
+        Returns:
+            np.ndarray: Scaled values with shape (N, n_features).
+        """
+        scaled = np.subtract(np.atleast_2d(rows), self.mean, dtype=np.float64)
+        np.divide(scaled, self.scale, out=scaled)
+        return scaled
+
+
+# Binary risk factors that add up to Risk_Sum
+RISK_FACTOR_COLUMNS = (
+    "Diabetes_Prepregnancy",
+    "Gestational_Diabetes",
+    "PrePregnancy_Hypertension",
+    "Gestational_Hypertension",
+    "Hypertension_Eclampsia",
+    "Infertility_Treatment",
+    "Cigarettes_During_Pregnancy",
+    "Cigarettes_Before_Pregnancy_Int",
+)
+
+
+class DerivedFeature(NamedTuple):
+    """
+    A model feature (or group of features) computed from encoded form answers.
+
+    compute takes the inputs positionally, as scalars or as equal-length arrays,
+    and returns one value or array per output.
+    """
+
+    outputs: tuple
+    inputs: tuple
+    compute: Callable
+
+
+# Plain operators rather than NumPy calls, so one form answer is as cheap as a column
+def _bmi(weight_pounds, height_inches):
+    return (weight_pounds / height_inches ** 2 * 703,)
+
+
+def _had_previous_birth(total_prior_births):
+    return ((total_prior_births > 0) * 1.0,)
+
+
+def _last_birth_buckets(months):
+    return (
+        (months < 12) * 1.0,
+        ((months >= 12) & (months < 30)) * 1.0,
+        ((months >= 30) & (months < 48)) * 1.0,
+        ((months >= 48) & (months < 66)) * 1.0,
+        (months >= 66) * 1.0,
+    )
+
+
+def _risk_sum(*factors):
+    return (sum(factors) * 1.0,)
+
+
+DERIVED_FEATURES = (
+    DerivedFeature(("Mothers_PrePregnancy_BMI",), ("Weight_Pounds", "Height_Inches"), _bmi),
+    DerivedFeature(("Had_Previous_Birth",), ("Total_Prior_Births",), _had_previous_birth),
+    DerivedFeature(
+        ("Less_than_1_year", "1_year_to_2.5_years", "2.5_years_to_4_years", "4_to_5.5_years", "Greater_than_5.5_years"),
+        ("Last_Birth_Months",),
+        _last_birth_buckets,
+    ),
+    DerivedFeature(("Risk_Sum",), RISK_FACTOR_COLUMNS, _risk_sum),
+)
+
+
+class FeatureGraph:
+    """
+    Maps encoded form answers onto model features.
+
+    Model columns that are not derived are copied straight from the inputs; the
+    rest come from DERIVED_FEATURES, each of which declares the inputs it reads.
+    derive() runs the whole graph over columns of a batch, while FeatureState
+    keeps one session's row and recomputes only what a changed input touches.
+    """
+
+    def __init__(self, pipeline, derived=DERIVED_FEATURES):
+        self.pipeline = pipeline
+        self.derived = tuple(derived)
+        produced = {name for node in self.derived for name in node.outputs}
+        self.passthrough = tuple(name for name in pipeline.feature_names if name not in produced)
+        self.input_names = tuple(dict.fromkeys(self.passthrough + tuple(name for node in self.derived for name in node.inputs)))
+
+        # Scaling parameters as Python floats, for rescaling one element at a time
+        self.mean = pipeline.mean.tolist()
+        self.scale = pipeline.scale.tolist()
+
+        # Nodes to rerun when an input changes, and the model columns each node writes
+        self.dependents = {name: tuple(node for node in self.derived if name in node.inputs) for name in self.input_names}
+        self.output_index = {node.outputs: tuple(pipeline.feature_index[name] for name in node.outputs) for node in self.derived}
+
+    def derive(self, columns):
+        """
+        Computes raw model rows from columns of encoded inputs.
+
+        Parameters:
+            columns (Mapping): Input name -> scalar or 1-D array, for every name in input_names.
+
+        Returns:
+            np.ndarray: An (N, n_features) matrix of raw features in model order.
+        """
+        values = {name: columns[name] for name in self.passthrough}
+        for node in self.derived:
+            values.update(zip(node.outputs, node.compute(*(columns[name] for name in node.inputs))))
+        return np.column_stack([np.asarray(values[name], dtype=np.float64) for name in self.pipeline.feature_names])
+
+    def state(self):
+        """
+        Returns an empty incremental row for one session.
+        """
+        return FeatureState(self)
+
+
+class FeatureState:
+    """
+    One session's model row, kept raw and scaled and updated element by element.
+
+    StandardScaler works column by column, so a changed input only rewrites the
+    columns it feeds and the rest of the scaled row is left as it was.
+    """
+
+    __slots__ = ("graph", "inputs", "raw", "scaled")
+
+    def __init__(self, graph):
+        n_features = len(graph.pipeline.feature_names)
+        self.graph = graph
+        self.inputs = {}
+        self.raw = np.full(n_features, np.nan)
+        self.scaled = np.full(n_features, np.nan)
+
+    def update(self, inputs):
+        """
+        Applies new input values and recomputes the derived features that read them.
+
+        Parameters:
+            inputs (Mapping): Some or all of the graph's inputs, keyed by name.
+
+        Returns:
+            int: The number of model columns rewritten.
+        """
+        changed = [name for name, value in inputs.items() if name not in self.inputs or self.inputs[name] != value]
+        if not changed:
+            return 0
+        self.inputs.update((name, inputs[name]) for name in changed)
+
+        graph = self.graph
+        feature_index = graph.pipeline.feature_index
+        written = 0
+        stale = {}
+        for name in changed:
+            if name in feature_index:
+                self._set(feature_index[name], self.inputs[name])
+                written += 1
+            stale.update(dict.fromkeys(graph.dependents.get(name, ())))
+
+        for node in stale:
+            if all(name in self.inputs for name in node.inputs):
+                outputs = node.compute(*(self.inputs[name] for name in node.inputs))
+                for i, value in zip(graph.output_index[node.outputs], outputs):
+                    self._set(i, value)
+                    written += 1
+        return written
+
+    def _set(self, i, value):
+        value = float(value)
+        self.raw[i] = value
+        self.scaled[i] = (value - self.graph.mean[i]) / self.graph.scale[i]
+
+    def value(self, name):
+        """
+        Returns the raw value of one model feature, or NaN if its inputs are not all set.
+        """
+        return self.raw[self.graph.pipeline.feature_index[name]]
+
+    def row(self):
+        """
+        Returns a (1, n_features) copy of the scaled row.
+
+        Raises:
+            ValueError: Some model features have not been given their inputs yet.
+        """
+        if np.isnan(self.raw).any():
+            missing = [name for name, value in zip(self.graph.pipeline.feature_names, self.raw) if np.isnan(value)]
+            raise ValueError(f"Missing feature(s) {', '.join(missing)} in input data")
+        return self.scaled[np.newaxis].copy()
@@ -0,0 +1,210 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+
+# Where submitted feedback goes: "jsonl" (local segment files) or "s3" (object store)
+FEEDBACK_BACKEND = os.environ.get("STILLSAFE_FEEDBACK_BACKEND", "jsonl")
+FEEDBACK_DIR = os.environ.get("STILLSAFE_FEEDBACK_DIR", "feedback")
+FEEDBACK_BUCKET = os.environ.get("STILLSAFE_FEEDBACK_BUCKET", "stillsafe-feedback")
+
+# Submissions are written once this many are buffered, or after FLUSH_INTERVAL_SECONDS
+FLUSH_BATCH_SIZE = 100
+FLUSH_INTERVAL_SECONDS = 2.0
+
+# A new JSONL segment is started once the current one reaches this size
+SEGMENT_MAX_BYTES = 8 * 1024 * 1024
+
+# A batch the store refused is retried after this delay, doubling up to WRITE_RETRY_MAX_SECONDS
+WRITE_RETRY_SECONDS = 1.0
+WRITE_RETRY_MAX_SECONDS = 60.0
+
+logger = logging.getLogger(__name__)
+
+
+class JSONLSegmentStore:
+    """
+    Append-only JSON Lines files, rotated into numbered segments by size.
+
+    Every batch is fsynced before write_batch returns.
+    """
+
+    def __init__(self, directory=FEEDBACK_DIR, segment_max_bytes=SEGMENT_MAX_BYTES):
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        os.makedirs(directory, exist_ok=True)
+        segments = sorted(name for name in os.listdir(directory) if name.endswith(".jsonl"))
+        self._segment = int(segments[-1].split("-")[1].split(".")[0]) if segments else 0
+
+    def _path(self):
+        return os.path.join(self.directory, f"feedback-{self._segment:06d}.jsonl")
+
+    def write_batch(self, records):
+        path = self._path()
+        if os.path.exists(path) and os.path.getsize(path) >= self.segment_max_bytes:
+            self._segment += 1
+            path = self._path()
+        with open(path, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class LocalObjectClient:
+    """
+    Local stand-in for an S3 client that supports put_object, writing each
+    object under root/<bucket>/<key>. Objects appear atomically.
+    """
+
+    def __init__(self, root=FEEDBACK_DIR):
+        self.root = root
+
+    def put_object(self, Bucket, Key, Body):
+        path = os.path.join(self.root, Bucket, Key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(Body)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+
+class ObjectStore:
+    """
+    Writes each batch as one new JSONL object, so earlier objects are never modified.
+
+    Parameters:
+        client: boto3 S3 client or LocalObjectClient.
+        bucket (str): Destination bucket.
+        prefix (str): Key prefix for feedback objects.
+    """
+
+    def __init__(self, client, bucket=FEEDBACK_BUCKET, prefix="feedback/"):
+        self.client = client
+        self.bucket = bucket
+        self.prefix = prefix
+
+    def write_batch(self, records):
+        key = f"{self.prefix}{datetime.now(timezone.utc):%Y/%m/%d/%H%M%S}-{uuid.uuid4().hex}.jsonl"
+        body = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+        self.client.put_object(Bucket=self.bucket, Key=key, Body=body.encode("utf-8"))
+
+
+class BufferedFeedbackSink:
+    """
+    Accepts feedback without touching storage on the caller's thread.
+
+    submit() only queues the record; a background thread writes queued records
+    to the store in batches. A batch the store refuses is logged and retried
+    with exponential backoff until it is written. close() writes whatever is
+    still queued and is registered to run at interpreter exit.
+    """
+
+    def __init__(self, store, batch_size=FLUSH_BATCH_SIZE, flush_interval=FLUSH_INTERVAL_SECONDS, retry_seconds=WRITE_RETRY_SECONDS):
+        self.store = store
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.retry_seconds = retry_seconds
+        self._retry = []
+        self._queue = queue.Queue()
+        self._closed = threading.Event()
+        self._writer = threading.Thread(target=self._run, name="stillsafe-feedback", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def submit(self, text):
+        """
+        Queues one feedback submission with its UTC timestamp.
+        """
+        if self._closed.is_set():
+            raise ValueError("Feedback sink is closed")
+        self._queue.put({"submitted_at": datetime.now(timezone.utc).isoformat(), "feedback": text})
+
+    def _drain(self, first=None):
+        batch = [] if first is None else [first]
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch):
+        try:
+            self.store.write_batch(batch)
+        except Exception:
+            logger.exception("Could not write %d feedback submissions", len(batch))
+            return False
+        return True
+
+    def _run(self):
+        failures = 0
+        while not self._closed.is_set():
+            if self._retry:
+                # New submissions keep queueing while the refused batch waits
+                self._closed.wait(min(self.retry_seconds * 2 ** (failures - 1), WRITE_RETRY_MAX_SECONDS))
+                if self._closed.is_set():
+                    break
+                batch = self._retry
+            else:
+                try:
+                    first = self._queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    continue
+                # Give concurrent submitters a moment to fill the batch
+                deadline = time.monotonic() + self.flush_interval
+                while self._queue.qsize() + 1 < self.batch_size and time.monotonic() < deadline and not self._closed.is_set():
+                    time.sleep(0.01)
+                batch = self._drain(first)
+            if self._write(batch):
+                self._retry, failures = [], 0
+            else:
+                self._retry, failures = batch, failures + 1
+
+    def close(self):
+        """
+        Stops the writer and writes everything still queued, including a batch
+        waiting to be retried. Batches the store still refuses are logged and dropped.
+        """
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._writer.join()
+        batches = [self._retry] if self._retry else []
+        while not self._queue.empty():
+            batches.append(self._drain())
+        for batch in batches:
+            if not self._write(batch):
+                logger.error("Dropped %d feedback submissions at shutdown", len(batch))
+        self._retry = []
+
+
+def build_feedback_sink(backend=FEEDBACK_BACKEND):
+    """
+    Creates the feedback sink selected by configuration.
+
+    Parameters:
+        backend (str): "jsonl" for local segment files, "s3" for the S3 bucket
+            in STILLSAFE_FEEDBACK_BUCKET, or "local-s3" for the same object
+            layout written under STILLSAFE_FEEDBACK_DIR.
+
+    Returns:
+        BufferedFeedbackSink: The sink.
+    """
+    if backend == "jsonl":
+        store = JSONLSegmentStore()
+    elif backend == "s3":
+        import boto3
+
+        store = ObjectStore(boto3.client("s3"))
+    elif backend == "local-s3":
+        store = ObjectStore(LocalObjectClient())
+    else:
+        raise ValueError(f"Unknown feedback backend: {backend}")
+    return BufferedFeedbackSink(store)
@@ -0,0 +1,123 @@
+# Static HTML fragments.
+#
+# The global stylesheet and the fixed HTML blocks of the tabs (risk messages,
+# tips, team members) are compacted once per process, when their module is
+# first imported, and the same string is sent on every rerun. Streamlit hashes
+# the content of every element it sends and the browser keeps the ones at
+# least global.minCachedMessageSize bytes long (.streamlit/config.toml), so on
+# later reruns a fragment the browser already holds is sent as a short
+# reference to its hash instead of in full.
+
+import re
+
+# Panel colours for messages shown under a form
+SUCCESS_PANEL = ("#EAFBF1", "#62A87C")
+ERROR_PANEL = ("#FDEDEC", "#E74C3C")
+
+
+def compact_css(css):
+    """
+    Removes comments and all optional whitespace from a stylesheet.
+
+    Parameters:
+        css (str): CSS source.
+
+    Returns:
+        str: The same rules, minified.
+    """
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};:,>])\s*", r"\1", css).replace(";}", "}").strip()
+
+
+def compact_html(html):
+    """
+    Removes comments and indentation from an HTML fragment. Runs of whitespace
+    inside text collapse to one space, as the browser would render them.
+
+    Parameters:
+        html (str): HTML source.
+
+    Returns:
+        str: The compacted fragment.
+    """
+    html = re.sub(r"<!--.*?-->", "", html, flags=re.DOTALL)
+    html = re.sub(r"\s+", " ", html)
+    return re.sub(r">\s+<", "><", html).strip()
+
+
+def message_panel(html, colours=SUCCESS_PANEL):
+    """
+    Wraps a message in the bordered panel used for results and errors.
+
+    Parameters:
+        html (str): Message body; may contain inline HTML.
+        colours (tuple): Background and border colour.
+
+    Returns:
+        str: The compacted panel.
+    """
+    background, border = colours
+    return compact_html(
+        f"""
+        <div style="background-color: {background}; border-left: 5px solid {border}; padding: 10px; border-radius: 10px; margin-top: 20px;">
+            <p style="color: #3D405B; font-size: 16px; margin: 0;">{html}</p>
+        </div>
+        """
+    )
+
+
+APP_CSS = "<style>" + compact_css(
+    """
+    /* Sidebar background and text styling */
+    div[data-testid="stSidebar"] {
+        background-color: #FEEBF3; /* Soft pink */
+    }
+    div[data-testid="stSidebar"] h1, div[data-testid="stSidebar"] h2, div[data-testid="stSidebar"] h3,
+    div[data-testid="stSidebar"] h4, div[data-testid="stSidebar"] h5, div[data-testid="stSidebar"] h6,
+    div[data-testid="stSidebar"] p, div[data-testid="stSidebar"] label, div[data-testid="stSidebar"] span {
+        color: #3D405B; /* Warm gray for text */
+    }
+    /* Main content area background and text styling */
+    div[data-testid="stAppViewContainer"] {
+        background-color: #FFF5F8; /* Light pastel pink */
+        color: #3D405B; /* Warm gray for main content */
+    }
+    div[data-testid="stAppViewContainer"] h1,
+    div[data-testid="stAppViewContainer"] h2,
+    div[data-testid="stAppViewContainer"] h3,
+    div[data-testid="stAppViewContainer"] h4,
+    div[data-testid="stAppViewContainer"] h5,
+    div[data-testid="stAppViewContainer"] h6 {
+        color: #C45BAA !important; /* Feminine magenta for headings */
+    }
+    /* Input label (question styling) */
+    div[data-testid="stAppViewContainer"] label {
+        color: #3D405B !important; /* Match greyish color */
+        font-weight: bold; /* Bold labels */
+    }
+    /* Dropdown and input text styling */
+    select, input, textarea {
+        color: white !important; /* White text inside input fields */
+        background-color: #3D405B !important; /* Dark gray background for input fields */
+    }
+    option {
+        color: white !important; /* White text for dropdown options */
+    }
+    textarea {
+        color: white !important; /* White text for text area */
+    }
+    /* Button styling */
+    .stButton button {
+        background-color: #FFC8E1; /* Light pink */
+        color: #3D405B; /* Warm gray text */
+        border-radius: 12px;
+        border: 1px solid #C45BAA; /* Magenta border */
+        padding: 8px 16px;
+    }
+    .stButton button:hover {
+        background-color: #FEEBF3; /* Softer pink on hover */
+        color: #3D405B; /* Warm gray text */
+    }
+    """
+) + "</style>"
@@ -0,0 +1,168 @@
+import os
+import pickle
+import threading
+from datetime import datetime, timedelta, timezone
+
+import boto3
+from botocore.config import Config
+
+from invocation import INVOCATION_WORKERS
+from metrics import span
+from registry import ARTIFACT_DIR, ArtifactRegistry
+
+IDENTITY_POOL_ID = "us-east-1:2ac8666d-0dab-4ad1-8584-fb59e6d5da4c"
+REGION_NAME = "us-east-1"
+
+# The endpoint and scaler the first artifact version was published from;
+# serving reads both from the artifact registry
+ENDPOINT_NAME = "xgboost-241217-2256-011-e160200c"
+SCALER_PATH = "scaler.pkl"
+
+# Transport settings of the sagemaker-runtime client, shared by every session.
+# The connection pool holds one connection per invocation worker, so concurrent
+# Submits neither queue for a connection nor open (and then discard) a fresh
+# TLS connection each. Connect and read timeouts are kept tight because
+# invocation.EndpointInvoker retries within the overall latency budget.
+RUNTIME_POOL_SIZE = int(os.environ.get("STILLSAFE_RUNTIME_POOL_SIZE", str(INVOCATION_WORKERS)))
+RUNTIME_CONNECT_TIMEOUT = float(os.environ.get("STILLSAFE_CONNECT_TIMEOUT", "1"))
+RUNTIME_READ_TIMEOUT = float(os.environ.get("STILLSAFE_READ_TIMEOUT", "5"))
+
+# botocore retry mode. Retries themselves are left to EndpointInvoker, so
+# botocore makes a single attempt; in "adaptive" mode it still slows every
+# session's calls down together once the endpoint starts throttling.
+RUNTIME_RETRY_MODE = os.environ.get("STILLSAFE_RETRY_MODE", "adaptive")
+
+# TCP keep-alive stops idle pooled connections, such as the one the startup
+# warm-up opens, from being dropped silently by the network
+RUNTIME_TCP_KEEPALIVE = os.environ.get("STILLSAFE_TCP_KEEPALIVE", "1") == "1"
+
+
+def runtime_client_config(
+    pool_size=RUNTIME_POOL_SIZE,
+    connect_timeout=RUNTIME_CONNECT_TIMEOUT,
+    read_timeout=RUNTIME_READ_TIMEOUT,
+    retry_mode=RUNTIME_RETRY_MODE,
+    tcp_keepalive=RUNTIME_TCP_KEEPALIVE,
+):
+    """
+    Builds the botocore transport configuration for the sagemaker-runtime client.
+
+    Parameters:
+        pool_size (int): Connections kept open to the endpoint.
+        connect_timeout (float): Seconds to wait for a connection.
+        read_timeout (float): Seconds to wait for a response.
+        retry_mode (str): botocore retry mode: "legacy", "standard" or "adaptive".
+        tcp_keepalive (bool): Whether to send TCP keep-alive probes on idle connections.
+
+    Returns:
+        Config: The client configuration.
+    """
+    return Config(
+        max_pool_connections=pool_size,
+        connect_timeout=connect_timeout,
+        read_timeout=read_timeout,
+        retries={"mode": retry_mode, "total_max_attempts": 1},
+        tcp_keepalive=tcp_keepalive,
+    )
+
+
+RUNTIME_CLIENT_CONFIG = runtime_client_config()
+
+# Refresh the temporary credentials this long before Cognito says they expire
+CREDENTIAL_REFRESH_MARGIN = timedelta(minutes=5)
+
+
+def get_cognito_credentials(identity_pool_id, region_name=REGION_NAME):
+    try:
+        # Initialize Cognito Identity client
+        cognito = boto3.client("cognito-identity", region_name=region_name)
+
+        # Get Identity ID
+        identity_id = cognito.get_id(IdentityPoolId=identity_pool_id)["IdentityId"]
+
+        # Get temporary credentials
+        credentials = cognito.get_credentials_for_identity(IdentityId=identity_id)["Credentials"]
+        return credentials
+    except Exception as e:
+        raise ValueError(f"Error retrieving Cognito credentials: {e}")
+
+
+def load_scaler(path=SCALER_PATH):
+    """
+    Loads the StandardScaler fitted during training.
+
+    Parameters:
+        path (str): Location of the pickled scaler.
+
+    Returns:
+        StandardScaler: The fitted scaler.
+    """
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+class InferenceContext:
+    """
+    Inference state shared by every session in the server process.
+
+    The active artifact version (scaler arrays, feature graph and endpoint) is
+    loaded from the registry when the context is built and followed as the
+    registry's CURRENT version changes. Cognito credentials and the
+    sagemaker-runtime client are created on first use and rebuilt shortly before
+    the credentials expire, so reruns that never predict make no network calls.
+    """
+
+    def __init__(self, identity_pool_id=IDENTITY_POOL_ID, region_name=REGION_NAME, artifact_dir=ARTIFACT_DIR):
+        self.identity_pool_id = identity_pool_id
+        self.region_name = region_name
+        self.registry = ArtifactRegistry(artifact_dir)
+        with span("startup_inference_context"):
+            self.registry.current()
+        self._credentials = None
+        self._runtime = None
+        self._lock = threading.Lock()
+
+    @property
+    def artifacts(self):
+        """
+        Returns the active ArtifactVersion. Take it once per request and use
+        that snapshot throughout, so a version swap mid-request cannot mix two
+        scalers or models.
+        """
+        return self.registry.current()
+
+    @property
+    def pipeline(self):
+        return self.artifacts.pipeline
+
+    @property
+    def graph(self):
+        return self.artifacts.graph
+
+    def _credentials_expiring(self):
+        if self._credentials is None:
+            return True
+        expiration = self._credentials.get("Expiration")
+        if expiration is None:
+            return False
+        return datetime.now(timezone.utc) >= expiration - CREDENTIAL_REFRESH_MARGIN
+
+    @property
+    def runtime(self):
+        """
+        Returns the shared sagemaker-runtime client, fetching fresh Cognito
+        credentials first if there are none yet or they are about to expire.
+        """
+        with self._lock:
+            if self._runtime is None or self._credentials_expiring():
+                with span("credentials"):
+                    self._credentials = get_cognito_credentials(self.identity_pool_id, self.region_name)
+                self._runtime = boto3.client(
+                    "sagemaker-runtime",
+                    region_name=self.region_name,
+                    aws_access_key_id=self._credentials["AccessKeyId"],
+                    aws_secret_access_key=self._credentials["SecretKey"],
+                    aws_session_token=self._credentials["SessionToken"],
+                    config=RUNTIME_CLIENT_CONFIG,
+                )
+            return self._runtime
@@ -0,0 +1,170 @@
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from botocore.exceptions import ClientError, ConnectionError as BotocoreConnectionError
+
+# Total time one endpoint request may take, across all retries, before giving up
+LATENCY_BUDGET_SECONDS = float(os.environ.get("STILLSAFE_LATENCY_BUDGET", "8"))
+MAX_ATTEMPTS = int(os.environ.get("STILLSAFE_MAX_ATTEMPTS", "3"))
+BASE_BACKOFF_SECONDS = 0.2
+MAX_BACKOFF_SECONDS = 2.0
+
+# Consecutive failures that open the circuit, and how long it stays open
+BREAKER_FAILURE_THRESHOLD = int(os.environ.get("STILLSAFE_BREAKER_THRESHOLD", "5"))
+BREAKER_RESET_SECONDS = float(os.environ.get("STILLSAFE_BREAKER_RESET", "30"))
+
+# Worker threads that run endpoint calls off the Streamlit script threads, i.e.
+# the endpoint calls one server process has in flight at once. Set it to the
+# number of sessions expected to submit concurrently; the runtime client's
+# connection pool is sized to match (inference.RUNTIME_POOL_SIZE).
+INVOCATION_WORKERS = int(os.environ.get("STILLSAFE_INVOCATION_WORKERS", "32"))
+
+RETRYABLE_ERROR_CODES = {
+    "ThrottlingException",
+    "TooManyRequestsException",
+    "ServiceUnavailable",
+    "ModelNotReadyException",
+    "InternalFailure",
+}
+
+
+class EndpointUnavailable(Exception):
+    """
+    Raised when the endpoint cannot answer within the latency budget or the
+    circuit breaker is open.
+    """
+
+
+def is_retryable(error):
+    """
+    Returns True for throttling and transient connection errors worth retrying.
+    """
+    if isinstance(error, BotocoreConnectionError):
+        return True
+    if isinstance(error, ClientError):
+        code = error.response.get("Error", {}).get("Code")
+        status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+        return code in RETRYABLE_ERROR_CODES or status in (429, 503)
+    return False
+
+
+def is_endpoint_failure(error):
+    """
+    Returns True for errors that show the endpoint itself is failing: server-side
+    errors such as ModelError, and anything that is not an error response.
+    Client errors such as ValidationError mean the endpoint answered.
+    """
+    if isinstance(error, ClientError):
+        code = error.response.get("Error", {}).get("Code")
+        status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode") or 0
+        return code == "ModelError" or status >= 500
+    return True
+
+
+class CircuitBreaker:
+    """
+    Fails fast while the endpoint is unhealthy.
+
+    After failure_threshold consecutive failures the circuit opens and calls are
+    refused for reset_seconds. One trial call is then let through: success
+    closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, failure_threshold=BREAKER_FAILURE_THRESHOLD, reset_seconds=BREAKER_RESET_SECONDS, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.clock = clock
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and self.clock() - self._opened_at >= self.reset_seconds:
+                self.state = "half_open"
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = "closed"
+            self._failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self.state == "half_open" or self._failures >= self.failure_threshold:
+                self.state = "open"
+                self._opened_at = self.clock()
+
+
+class EndpointInvoker:
+    """
+    Runs endpoint calls on a worker thread under a strict latency budget.
+
+    Throttling and connection errors are retried with full-jitter exponential
+    backoff while the budget allows. Timeouts and exhausted retries count
+    against the circuit breaker and surface as EndpointUnavailable. Other
+    errors are raised as they are; server-side ones (is_endpoint_failure) count
+    against the breaker, client errors count as the endpoint answering.
+    """
+
+    def __init__(
+        self,
+        latency_budget=LATENCY_BUDGET_SECONDS,
+        max_attempts=MAX_ATTEMPTS,
+        breaker=None,
+        clock=time.monotonic,
+        sleep=time.sleep,
+        workers=INVOCATION_WORKERS,
+    ):
+        self.latency_budget = latency_budget
+        self.max_attempts = max_attempts
+        self.breaker = breaker or CircuitBreaker()
+        self.clock = clock
+        self.sleep = sleep
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stillsafe-invoke")
+
+    def call(self, func, *args, **kwargs):
+        """
+        Calls func(*args, **kwargs) off the current thread and returns its result.
+
+        Raises:
+            EndpointUnavailable: The circuit is open, the budget ran out, or
+                retryable errors persisted past max_attempts.
+        """
+        if not self.breaker.allow():
+            raise EndpointUnavailable("The endpoint is failing; not calling it until it recovers")
+
+        deadline = self.clock() + self.latency_budget
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                result = self._executor.submit(func, *args, **kwargs).result(timeout=max(deadline - self.clock(), 0))
+            except FutureTimeoutError:
+                self.breaker.record_failure()
+                raise EndpointUnavailable(f"No response from the endpoint within {self.latency_budget:g} seconds")
+            except Exception as e:
+                if not is_retryable(e):
+                    # Always settle the breaker, or a half-open trial call would leave it half-open for good
+                    if is_endpoint_failure(e):
+                        self.breaker.record_failure()
+                    else:
+                        self.breaker.record_success()
+                    raise
+                delay = random.uniform(0, min(MAX_BACKOFF_SECONDS, BASE_BACKOFF_SECONDS * 2 ** (attempt - 1)))
+                if attempt < self.max_attempts and self.clock() + delay < deadline:
+                    self.sleep(delay)
+                    continue
+                self.breaker.record_failure()
+                raise EndpointUnavailable(f"Endpoint still unavailable after {attempt} attempts: {e}") from e
+            self.breaker.record_success()
+            return result
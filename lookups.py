@@ -0,0 +1,36 @@
+# Answer options on the Risk Assessment form and the codes the model was trained on.
+# Defined once per process and shared read-only by every session.
+
+MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+RACES = (
+    "White (alone)", "Black (alone)", "AIAN (alone)", "Asian (alone)", "NHOPI (alone)",
+    "Black And White", "Black and AIAN", "Black and Asian", "Black and NHOPI",
+    "AIAN and White", "AIAN and Asian", "AIAN and NHOPI", "Asian and White",
+    "Asian and NHOPI", "NHOPI and White", "Black, AIAN, and White", "Black, AIAN, and Asian",
+    "Black, AIAN, and NHOPI", "Black, Asian, and White", "Black, Asian, and NHOPI",
+    "Black, NHOPI, and White", "AIAN, Asian, and White", "AIAN, NHOPI, and White",
+    "AIAN, Asian, and NHOPI", "Asian, NHOPI, and White", "Black, AIAN, Asian, and White",
+    "Black, AIAN, Asian, and NHOPI", "Black, AIAN, NHOPI, and White",
+    "Black, Asian, NHOPI, and White", "AIAN, Asian, NHOPI, and White",
+    "Black, AIAN, Asian, NHOPI, and White",
+)
+
+EDUCATION_LEVELS = (
+    "8th grade or less", "9th through 12th grade with no diploma",
+    "High school graduate or GED completed", "Some college credit, but not a degree",
+    "Associate degree (AA, AS)", "Bachelor’s degree (BA, AB, BS)",
+    "Master’s degree (MA, MS, MEng, Med, MSW, MBA)",
+    "Doctorate (PhD, EdD) or Professional degree (MD, DDS, DVM, LLB, JD)",
+)
+
+YES_NO = ("No", "Yes")
+INFANT_SEXES = ("Male", "Female")
+
+# Name -> 1-based code, as recorded in the CDC natality files
+MONTH_CODES = {name: code for code, name in enumerate(MONTHS, start=1)}
+RACE_CODES = {name: code for code, name in enumerate(RACES, start=1)}
+EDUCATION_CODES = {name: code for code, name in enumerate(EDUCATION_LEVELS, start=1)}
@@ -0,0 +1,180 @@
+import bisect
+import threading
+import time
+
+# Upper bounds, in seconds, of the latency histogram buckets (Prometheus "le")
+BUCKET_BOUNDS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+# Recent durations kept per stage for the rolling percentiles
+WINDOW_SIZE = 1024
+
+
+class StageStats:
+    """
+    Cumulative histogram plus a ring buffer of the most recent durations for one stage.
+    """
+
+    __slots__ = ("bucket_counts", "count", "total", "window", "_next", "_lock")
+
+    def __init__(self):
+        self.bucket_counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.window = []
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds):
+        bucket = bisect.bisect_left(BUCKET_BOUNDS, seconds)
+        with self._lock:
+            self.bucket_counts[bucket] += 1
+            self.count += 1
+            self.total += seconds
+            if len(self.window) < WINDOW_SIZE:
+                self.window.append(seconds)
+            else:
+                self.window[self._next] = seconds
+                self._next = (self._next + 1) % WINDOW_SIZE
+
+    def percentiles(self, quantiles=(0.5, 0.95, 0.99)):
+        """
+        Returns:
+            dict: Quantile -> seconds over the recent window (empty if nothing was observed).
+        """
+        with self._lock:
+            recent = sorted(self.window)
+        if not recent:
+            return {}
+        return {q: recent[min(int(q * len(recent)), len(recent) - 1)] for q in quantiles}
+
+
+class Span:
+    """
+    Times one stage. Only the stage name is recorded, never any values from the request.
+    """
+
+    __slots__ = ("stats", "start")
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stats.observe(time.perf_counter() - self.start)
+        return False
+
+
+class MetricsRegistry:
+    """
+    Per-stage latency statistics for the process.
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self.caches = {}
+        self._lock = threading.Lock()
+
+    def register_cache(self, name, cache):
+        """
+        Reports a cache's size and hit, miss and eviction counters with the
+        metrics. Registering another cache under the same name replaces it.
+
+        Parameters:
+            name (str): Label of the cache, e.g. "prediction".
+            cache (TTLCache): Anything with a stats() method returning those counters.
+        """
+        with self._lock:
+            self.caches[name] = cache
+
+    def cache_summary(self):
+        """
+        Returns:
+            list: One dict per registered cache with its size, hits, misses, evictions and hit rate.
+        """
+        rows = []
+        for name, cache in sorted(self.caches.items()):
+            stats = cache.stats()
+            lookups = stats["hits"] + stats["misses"]
+            rows.append({"cache": name, **stats, "hit_rate": stats["hits"] / lookups if lookups else 0.0})
+        return rows
+
+    def stage(self, name):
+        stats = self.stages.get(name)
+        if stats is None:
+            with self._lock:
+                stats = self.stages.setdefault(name, StageStats())
+        return stats
+
+    def span(self, name):
+        return Span(self.stage(name))
+
+    def summary(self):
+        """
+        Returns:
+            list: One dict per stage with count, mean and rolling p50/p95/p99 in milliseconds.
+        """
+        rows = []
+        for name, stats in sorted(self.stages.items()):
+            percentiles = stats.percentiles()
+            rows.append({
+                "stage": name,
+                "count": stats.count,
+                "mean_ms": stats.total / stats.count * 1000 if stats.count else 0.0,
+                "p50_ms": percentiles.get(0.5, 0.0) * 1000,
+                "p95_ms": percentiles.get(0.95, 0.0) * 1000,
+                "p99_ms": percentiles.get(0.99, 0.0) * 1000,
+            })
+        return rows
+
+    def prometheus_text(self):
+        """
+        Renders every stage in the Prometheus text exposition format: a
+        cumulative histogram plus rolling quantiles over the recent window.
+        """
+        lines = [
+            "# HELP stillsafe_stage_latency_seconds Time spent in each stage of the app.",
+            "# TYPE stillsafe_stage_latency_seconds histogram",
+        ]
+        for name, stats in sorted(self.stages.items()):
+            cumulative = 0
+            for bound, count in zip(BUCKET_BOUNDS, stats.bucket_counts):
+                cumulative += count
+                lines.append(f'stillsafe_stage_latency_seconds_bucket{{stage="{name}",le="{bound:g}"}} {cumulative}')
+            lines.append(f'stillsafe_stage_latency_seconds_bucket{{stage="{name}",le="+Inf"}} {stats.count}')
+            lines.append(f'stillsafe_stage_latency_seconds_sum{{stage="{name}"}} {stats.total:.9f}')
+            lines.append(f'stillsafe_stage_latency_seconds_count{{stage="{name}"}} {stats.count}')
+
+        lines.append(f"# HELP stillsafe_stage_latency_recent_seconds Rolling quantiles over the last {WINDOW_SIZE} observations.")
+        lines.append("# TYPE stillsafe_stage_latency_recent_seconds gauge")
+        for name, stats in sorted(self.stages.items()):
+            for quantile, seconds in stats.percentiles().items():
+                lines.append(f'stillsafe_stage_latency_recent_seconds{{stage="{name}",quantile="{quantile:g}"}} {seconds:.9f}')
+
+        caches = self.cache_summary()
+        if caches:
+            lines.append("# HELP stillsafe_cache_entries Entries currently held by each cache.")
+            lines.append("# TYPE stillsafe_cache_entries gauge")
+            lines.extend(f'stillsafe_cache_entries{{cache="{row["cache"]}"}} {row["size"]}' for row in caches)
+            for counter in ("hits", "misses", "evictions"):
+                lines.append(f"# HELP stillsafe_cache_{counter}_total Cache {counter} since the process started.")
+                lines.append(f"# TYPE stillsafe_cache_{counter}_total counter")
+                lines.extend(f'stillsafe_cache_{counter}_total{{cache="{row["cache"]}"}} {row[counter]}' for row in caches)
+        return "\n".join(lines) + "\n"
+
+
+# Shared by every module and session in the process
+REGISTRY = MetricsRegistry()
+
+
+def span(name):
+    """
+    Context manager that records how long the block takes under the given stage name.
+    """
+    return REGISTRY.span(name)
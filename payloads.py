@@ -0,0 +1,178 @@
+import struct
+
+import numpy as np
+
+# SageMaker rejects real-time request bodies over 6 MB; stay a little under it
+MAX_PAYLOAD_BYTES = 5 * 1024 * 1024
+
+# Rows encoded at a time when packing payloads
+BLOCK_ROWS = 1000
+
+# RecordIO framing used by SageMaker's built-in algorithms
+RECORDIO_MAGIC = 0xCED7230A
+
+
+def _varint(value):
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _length_delimited(field_number, payload_length):
+    # Protobuf tag and length prefix for a length-delimited field
+    return _varint(field_number << 3 | 2) + _varint(payload_length)
+
+
+class CSVCodec:
+    """
+    Headerless text/csv with a fixed number of significant digits.
+
+    Nine significant digits round-trip every float32 exactly, and the XGBoost
+    container scores in float32, so predictions match full-precision CSV while
+    each value is at most about 15 characters.
+    """
+
+    content_type = "text/csv"
+    separator = b"\n"
+
+    def __init__(self, significant_digits=9):
+        self.value_format = f"%.{significant_digits}g"
+
+    def encode(self, rows):
+        rows = np.atleast_2d(rows)
+        row_format = ",".join([self.value_format] * rows.shape[1])
+        return ("\n".join([row_format] * rows.shape[0]) % tuple(rows.ravel().tolist())).encode()
+
+
+class LibSVMCodec(CSVCodec):
+    """
+    text/libsvm rows with a dummy label and zero-based feature indices.
+
+    Every feature is written, zeros included: the XGBoost container reads an
+    absent libsvm entry as missing, not as 0, which would change the score.
+    """
+
+    content_type = "text/libsvm"
+
+    def encode(self, rows):
+        rows = np.atleast_2d(rows)
+        row_format = "0 " + " ".join(f"{i}:{self.value_format}" for i in range(rows.shape[1]))
+        return ("\n".join([row_format] * rows.shape[0]) % tuple(rows.ravel().tolist())).encode()
+
+
+class RecordIOProtobufCodec:
+    """
+    application/x-recordio-protobuf with one dense float32 tensor per row.
+
+    Every record for a given feature count has the same protobuf prefix, so the
+    whole payload is assembled as one uint8 matrix: the fixed RecordIO header and
+    prefix in the leading columns and each row's little-endian float32 bytes after.
+    """
+
+    content_type = "application/x-recordio-protobuf"
+    separator = b""
+
+    def __init__(self):
+        self._layouts = {}
+
+    def _layout(self, n_features):
+        if n_features not in self._layouts:
+            tensor_length = 4 * n_features
+            # Float32Tensor.values (field 1, packed)
+            tensor = _length_delimited(1, tensor_length)
+            # Value.float32_tensor (field 2)
+            value = _length_delimited(2, len(tensor) + tensor_length) + tensor
+            # Record.features map entry: key "values" (field 1), value (field 2)
+            entry_key = _length_delimited(1, len(b"values")) + b"values"
+            entry = entry_key + _length_delimited(2, len(value) + tensor_length) + value
+            # Record.features (field 1)
+            prefix = _length_delimited(1, len(entry) + tensor_length) + entry
+
+            record_length = len(prefix) + tensor_length
+            padding = -record_length % 4
+            header = struct.pack("<II", RECORDIO_MAGIC, record_length)
+            self._layouts[n_features] = (header + prefix, len(header) + record_length + padding)
+        return self._layouts[n_features]
+
+    def encode(self, rows):
+        rows = np.atleast_2d(rows)
+        n_rows, n_features = rows.shape
+        prefix, record_size = self._layout(n_features)
+
+        records = np.zeros((n_rows, record_size), dtype=np.uint8)
+        records[:, : len(prefix)] = np.frombuffer(prefix, dtype=np.uint8)
+        values = np.ascontiguousarray(rows, dtype="<f4").view(np.uint8)
+        records[:, len(prefix) : len(prefix) + 4 * n_features] = values
+        return records.tobytes()
+
+
+CODECS = {
+    "csv": CSVCodec,
+    "libsvm": LibSVMCodec,
+    "recordio-protobuf": RecordIOProtobufCodec,
+}
+
+
+def get_codec(name):
+    """
+    Returns a codec instance by name: "csv", "libsvm" or "recordio-protobuf".
+    """
+    try:
+        return CODECS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown request codec: {name}")
+
+
+def split_payloads(rows, codec, max_bytes=MAX_PAYLOAD_BYTES, block_rows=BLOCK_ROWS):
+    """
+    Encodes rows with the codec and packs them into as few request bodies as
+    possible, each at most max_bytes long.
+
+    Parameters:
+        rows (np.ndarray): 2-D array of scaled features in model order.
+        codec: One of the codecs in CODECS.
+        max_bytes (int): Size limit for a single request body.
+        block_rows (int): Rows encoded together; a payload holds whole blocks
+            unless a single block is too large, in which case it is halved.
+
+    Yields:
+        bytes: An encoded request body.
+    """
+    rows = np.atleast_2d(rows)
+    blocks = []
+    size = 0
+    start = 0
+    while start < len(rows):
+        block = codec.encode(rows[start : start + block_rows])
+        if len(block) > max_bytes and block_rows > 1:
+            block_rows //= 2
+            continue
+        start += block_rows
+        if blocks and size + len(codec.separator) + len(block) > max_bytes:
+            yield codec.separator.join(blocks)
+            blocks = []
+            size = 0
+        size += len(block) + (len(codec.separator) if blocks else 0)
+        blocks.append(block)
+    if blocks:
+        yield codec.separator.join(blocks)
+
+
+def decode_predictions(body):
+    """
+    Parses the container's text/csv response, comma- or newline-separated, into
+    a float64 array without going through an intermediate str.
+
+    Parameters:
+        body (bytes): Raw response body.
+
+    Returns:
+        np.ndarray: One score per row.
+    """
+    return np.array(body.strip().replace(b"\n", b",").split(b","), dtype=np.float64)
@@ -0,0 +1,186 @@
+# Population-level risk for a whole cohort.
+#
+# A cohort file has the batch upload's columns (BATCH_INPUT_COLUMNS), one row
+# per person, encoded as on the Risk Assessment form. It is read in chunks and
+# each chunk is derived, scaled and scored as one matrix, with a single call to
+# the predictor (which splits it into endpoint-sized payloads if it has to).
+# Rows with an answer the form cannot produce are skipped and counted, as the
+# batch upload does, instead of being scored into the aggregates. Only per-group running totals are kept, so memory stays at a few chunks
+# whatever the size of the cohort.
+
+import hashlib
+
+import numpy as np
+
+from batch import BATCH_INPUT_COLUMNS, derive_features, invalid_inputs
+from lookups import EDUCATION_LEVELS, MONTHS, RACES
+from metrics import span
+
+# Rows read, derived and scored at a time
+COHORT_CHUNK_ROWS = 100_000
+
+# Label of rows whose code is missing or not one the form can produce
+NOT_STATED = "Not stated"
+
+# Groupings offered on the dashboard: label -> (encoded column, code -> answer)
+GROUPINGS = {
+    "Race": ("Mothers_Race_Recode_31", dict(enumerate(RACES, start=1))),
+    "Education level": ("Mothers_Education", dict(enumerate(EDUCATION_LEVELS, start=1))),
+    "Month prenatal care began": ("Month_Prenatal_Care_Began", {month: f"Month {month}" for month in range(1, 11)}),
+    "Delivery month": ("Delivery_Month", dict(enumerate(MONTHS, start=1))),
+    "WIC program": ("WIC_Program", {0: "No", 1: "Yes"}),
+    "Infant sex": ("Infant_Sex", {1: "Male", 0: "Female"}),
+}
+
+
+def file_digest(source, block_size=1024 * 1024):
+    """
+    Hashes an uploaded file without reading it into memory at once.
+
+    Parameters:
+        source (file-like): The uploaded file; left rewound to the start.
+        block_size (int): Bytes hashed at a time.
+
+    Returns:
+        str: The file's SHA-256 hex digest.
+    """
+    digest = hashlib.sha256()
+    source.seek(0)
+    for block in iter(lambda: source.read(block_size), b""):
+        digest.update(block)
+    source.seek(0)
+    return digest.hexdigest()
+
+
+class GroupTotals:
+    """
+    Running totals for one grouping: people, summed risk score and people
+    scored high risk, for each answer plus NOT_STATED.
+    """
+
+    def __init__(self, column, labels):
+        self.column = column
+        self.labels = tuple(labels.values()) + (NOT_STATED,)
+
+        # Code -> position in labels; codes outside the lookup fall through to NOT_STATED
+        self.lookup = np.full(max(labels) + 1, len(labels), dtype=np.intp)
+        self.lookup[list(labels)] = np.arange(len(labels))
+
+        self.people = np.zeros(len(self.labels), dtype=np.int64)
+        self.score_sum = np.zeros(len(self.labels))
+        self.high_risk = np.zeros(len(self.labels), dtype=np.int64)
+
+    def group(self, codes):
+        """
+        Returns the position in labels of every code, as one array.
+        """
+        codes = np.asarray(codes, dtype=np.float64)
+        valid = (codes >= 0) & (codes < len(self.lookup)) & (codes == np.floor(codes))
+        groups = np.full(len(codes), len(self.labels) - 1, dtype=np.intp)
+        groups[valid] = self.lookup[codes[valid].astype(np.intp)]
+        return groups
+
+    def add(self, codes, predictions, high_risk):
+        groups = self.group(codes)
+        n_groups = len(self.labels)
+        self.people += np.bincount(groups, minlength=n_groups)
+        self.score_sum += np.bincount(groups, weights=predictions, minlength=n_groups)
+        self.high_risk += np.bincount(groups[high_risk], minlength=n_groups)
+
+    def table(self):
+        """
+        Returns:
+            list: One row per answer with at least one person: the answer, the
+                number of people, their mean risk score and the share scored high risk.
+        """
+        return [
+            {
+                "Group": label,
+                "People": int(people),
+                "Mean risk score": score_sum / people,
+                "High-risk share": high_risk / people,
+            }
+            for label, people, score_sum, high_risk in zip(self.labels, self.people, self.score_sum, self.high_risk)
+            if people
+        ]
+
+
+class CohortSummary:
+    """
+    Aggregates of a scored cohort: overall totals, one GroupTotals per grouping
+    and the number of rows skipped for an empty or out-of-range answer.
+    """
+
+    def __init__(self, groupings=GROUPINGS):
+        self.skipped = 0
+        self.people = 0
+        self.score_sum = 0.0
+        self.high_risk = 0
+        self.groups = {name: GroupTotals(column, labels) for name, (column, labels) in groupings.items()}
+
+    def add(self, chunk, predictions):
+        """
+        Adds one scored chunk to the totals.
+
+        Parameters:
+            chunk (pd.DataFrame): Rows with the BATCH_INPUT_COLUMNS.
+            predictions (np.ndarray): One risk score per row.
+        """
+        predictions = np.asarray(predictions, dtype=np.float64)
+        high_risk = np.round(predictions) != 0
+        self.people += len(predictions)
+        self.score_sum += float(predictions.sum())
+        self.high_risk += int(high_risk.sum())
+        for totals in self.groups.values():
+            totals.add(chunk[totals.column].to_numpy(dtype=np.float64), predictions, high_risk)
+
+    def overall(self):
+        """
+        Returns:
+            dict: The number of people, their mean risk score and the share scored high risk.
+        """
+        if not self.people:
+            return {"People": 0, "Mean risk score": float("nan"), "High-risk share": float("nan")}
+        return {
+            "People": self.people,
+            "Mean risk score": self.score_sum / self.people,
+            "High-risk share": self.high_risk / self.people,
+        }
+
+
+def summarize_cohort(source, graph, predictor, chunk_rows=COHORT_CHUNK_ROWS):
+    """
+    Scores a cohort file chunk by chunk and aggregates the scores by group.
+    Rows with an empty or out-of-range answer (batch.invalid_inputs) are not
+    scored; they are counted in the summary's skipped.
+
+    Parameters:
+        source (file-like or str): A CSV with the BATCH_INPUT_COLUMNS.
+        graph (FeatureGraph): Feature derivation and scaling from the training scaler.
+        predictor (Predictor): The SageMaker or local scoring backend.
+        chunk_rows (int): Number of rows read and scored at a time.
+
+    Returns:
+        CohortSummary: The cohort's aggregates.
+    """
+    # Imported here so pandas only loads when someone actually uploads a cohort
+    import pandas as pd
+
+    summary = CohortSummary()
+    chunks = pd.read_csv(source, chunksize=chunk_rows, usecols=lambda name: name in BATCH_INPUT_COLUMNS)
+    for chunk in chunks:
+        missing = [col for col in BATCH_INPUT_COLUMNS if col not in chunk.columns]
+        if missing:
+            raise ValueError(f"Cohort file is missing columns: {', '.join(missing)}")
+        valid = ~invalid_inputs(chunk).any(axis=1)
+        summary.skipped += int((~valid).sum())
+        if not valid.any():
+            continue
+        chunk = chunk.loc[valid].astype(np.float64)
+
+        with span("cohort_features"):
+            features = graph.pipeline.transform(derive_features(chunk, graph))
+        with span("cohort_predict"):
+            predictions = predictor.predict(features)
+        summary.add(chunk, predictions)
+    return summary
@@ -0,0 +1,323 @@
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+
+from cache import TTLCache
+from inference import ENDPOINT_NAME, RUNTIME_CONNECT_TIMEOUT, RUNTIME_POOL_SIZE
+from invocation import INVOCATION_WORKERS, LATENCY_BUDGET_SECONDS, EndpointInvoker, EndpointUnavailable
+from metrics import REGISTRY, span
+from payloads import decode_predictions, get_codec, split_payloads
+
+# Which backend scores requests: "sagemaker" (remote endpoint), "local" (in-process
+# booster) or "service" (the standalone scoring service in scoring_service.py)
+PREDICTOR_BACKEND = os.environ.get("STILLSAFE_PREDICTOR", "sagemaker")
+
+# Booster exported from the endpoint's model.tar.gz, used by the local backend
+MODEL_PATH = os.environ.get("STILLSAFE_MODEL_PATH", "xgboost-model")
+
+# Where the "service" backend finds the scoring service
+SCORING_SERVICE_URL = os.environ.get("STILLSAFE_SCORING_URL", "http://127.0.0.1:8600")
+
+# Prediction cache size and lifetime; set the size to 0 to turn caching off
+PREDICTION_CACHE_SIZE = int(os.environ.get("STILLSAFE_PREDICTION_CACHE_SIZE", "4096"))
+PREDICTION_CACHE_TTL = float(os.environ.get("STILLSAFE_PREDICTION_CACHE_TTL", "3600"))
+
+# Micro-batching: concurrent small requests are gathered for up to this many
+# milliseconds (0 turns it off) or until this many rows are waiting, then sent together
+COALESCE_WINDOW_MS = float(os.environ.get("STILLSAFE_COALESCE_WINDOW_MS", "0"))
+COALESCE_MAX_ROWS = int(os.environ.get("STILLSAFE_COALESCE_MAX_ROWS", "64"))
+
+# Request body encoding for the SageMaker endpoint: "csv", "libsvm" or "recordio-protobuf"
+REQUEST_CODEC = os.environ.get("STILLSAFE_CODEC", "csv")
+
+
+class Predictor:
+    """
+    Scores rows of scaled features and returns the model's raw outputs.
+    """
+
+    # Identifies the model behind the predictor, so cached scores do not outlive it
+    model_id = ""
+
+    def predict(self, rows):
+        """
+        Parameters:
+            rows (array-like): 2-D array of scaled features, one row per patient.
+
+        Returns:
+            np.ndarray: One prediction per row.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """
+        Releases the predictor's threads once it is no longer served, e.g. when
+        its artifact version is evicted. Calls already in progress still finish.
+        """
+
+
+class SageMakerPredictor(Predictor):
+    """
+    Sends rows to the deployed SageMaker endpoint in the configured request
+    encoding, splitting large batches into several requests that each fit under
+    the payload limit. Each request goes through the invoker's latency budget,
+    retries and breaker.
+    """
+
+    def __init__(self, context, endpoint_name=ENDPOINT_NAME, invoker=None, codec=None):
+        self.context = context
+        self.endpoint_name = endpoint_name
+        self.invoker = invoker or EndpointInvoker()
+        self.codec = codec or get_codec(REQUEST_CODEC)
+        self.model_id = f"sagemaker:{endpoint_name}"
+
+    def predict(self, rows):
+        with span("encode"):
+            bodies = list(split_payloads(rows, self.codec))
+        if not bodies:
+            # No rows, e.g. a header-only chunk of an upload: nothing to send
+            return np.empty(0)
+        return np.concatenate([self._invoke(body) for body in bodies])
+
+    def _invoke(self, body):
+        return self.invoker.call(self._invoke_once, body)
+
+    def _invoke_once(self, body):
+        runtime = self.context.runtime
+        with span("invoke_endpoint"):
+            response = runtime.invoke_endpoint(
+                EndpointName=self.endpoint_name,
+                ContentType=self.codec.content_type,
+                Accept="text/csv",
+                Body=body,
+            )
+            response_body = response["Body"].read()
+
+        # The XGBoost container answers with comma- or newline-separated scores
+        with span("decode"):
+            return decode_predictions(response_body)
+
+
+class LocalXGBoostPredictor(Predictor):
+    """
+    Scores rows in-process with the booster the endpoint serves, skipping the network hop.
+    """
+
+    def __init__(self, model_path=MODEL_PATH):
+        # Imported here so the SageMaker backend does not need xgboost installed
+        import xgboost as xgb
+
+        self.booster = xgb.Booster()
+        self.booster.load_model(model_path)
+        self.model_id = f"local:{model_path}"
+
+    def predict(self, rows):
+        with span("local_predict"):
+            return self.booster.inplace_predict(np.asarray(rows, dtype=np.float32))
+
+
+class ServicePredictor(Predictor):
+    """
+    Sends scaled rows to the standalone scoring service, which scores them in
+    its worker processes with the same artifact version. Connections are kept
+    alive and shared by every session, with the pool size and connect timeout
+    of the sagemaker-runtime client.
+    """
+
+    def __init__(self, url, artifact_version, timeout=LATENCY_BUDGET_SECONDS):
+        # urllib3 comes with botocore, so this adds no dependency
+        import urllib3
+
+        self.url = url.rstrip("/") + "/v1/predict"
+        self.artifact_version = artifact_version
+        self.model_id = f"service:{url}"
+        self._http = urllib3.PoolManager(
+            maxsize=RUNTIME_POOL_SIZE,
+            retries=False,
+            timeout=urllib3.Timeout(connect=RUNTIME_CONNECT_TIMEOUT, read=timeout),
+        )
+        self._errors = urllib3.exceptions.HTTPError
+
+    def predict(self, rows):
+        rows = np.atleast_2d(rows)
+        if not len(rows):
+            return np.empty(0)
+        body = json.dumps({"rows": rows.tolist(), "artifact_version": self.artifact_version}).encode()
+        with span("service_predict"):
+            try:
+                response = self._http.request("POST", self.url, body=body, headers={"Content-Type": "application/json"})
+            except self._errors as e:
+                raise EndpointUnavailable(f"Scoring service unreachable: {e}")
+        if response.status == 503:
+            raise EndpointUnavailable(f"Scoring service unavailable: {response.data.decode(errors='replace')}")
+        if response.status != 200:
+            raise ValueError(f"Scoring service error {response.status}: {response.data.decode(errors='replace')}")
+        return np.asarray(json.loads(response.data)["predictions"], dtype=np.float64)
+
+
+class CoalescingPredictor(Predictor):
+    """
+    Merges small requests from concurrent sessions into one multi-row call.
+
+    The first request to arrive opens a batch whose deadline is one window
+    after its arrival; requests arriving before then join it. The batch is sent
+    as soon as it holds max_rows rows or the deadline passes, so no request
+    waits longer than the window, and each caller gets back the scores for its
+    own rows. Requests of max_rows rows or more go straight through, as does
+    every request after close().
+    """
+
+    def __init__(self, predictor, window=COALESCE_WINDOW_MS / 1000, max_rows=COALESCE_MAX_ROWS, clock=time.monotonic):
+        self.predictor = predictor
+        self.model_id = predictor.model_id
+        self.window = window
+        self.max_rows = max_rows
+        self.clock = clock
+        self._queue = queue.Queue()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=INVOCATION_WORKERS, thread_name_prefix="stillsafe-coalesce")
+        self._thread = threading.Thread(target=self._gather, name="stillsafe-coalescer", daemon=True)
+        self._thread.start()
+
+    def predict(self, rows):
+        rows = np.atleast_2d(rows)
+        future = Future()
+        with self._lock:
+            # Nothing may be queued behind the sentinel close() puts on the queue
+            queued = len(rows) < self.max_rows and not self._closed
+            if queued:
+                self._queue.put((self.clock(), rows, future))
+        if not queued:
+            return self.predictor.predict(rows)
+        return future.result()
+
+    def close(self):
+        """
+        Sends the requests already queued, then stops the gatherer thread and
+        shuts down the worker threads once their batches are done.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join()
+        self._executor.shutdown(wait=False)
+        self.predictor.close()
+
+    def _gather(self):
+        carried = None
+        stopping = False
+        while not stopping:
+            first = carried or self._queue.get()
+            carried = None
+            if first is None:
+                break
+            batch = [first]
+            size = len(first[1])
+            deadline = first[0] + self.window
+            while size < self.max_rows:
+                remaining = deadline - self.clock()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if request is None:
+                    # close() was called: send this batch and stop
+                    stopping = True
+                    break
+                if size + len(request[1]) > self.max_rows:
+                    # Opens the next batch instead, keeping its own arrival time
+                    carried = request
+                    break
+                batch.append(request)
+                size += len(request[1])
+            self._executor.submit(self._send, batch)
+
+    def _send(self, batch):
+        try:
+            with span("coalesced_predict"):
+                predictions = self.predictor.predict(np.vstack([rows for _, rows, _ in batch]))
+        except Exception as e:
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+        start = 0
+        for _, rows, future in batch:
+            future.set_result(predictions[start:start + len(rows)])
+            start += len(rows)
+
+
+class CachedPredictor(Predictor):
+    """
+    Answers repeated rows from an LRU+TTL cache and forwards only the misses.
+
+    Each row is keyed on a digest of its scaled float64 bytes together with the
+    model id and the artifact manifest digest, so a new artifact version never
+    serves a stale score.
+    """
+
+    def __init__(self, predictor, artifact_digest, cache):
+        self.predictor = predictor
+        self.cache = cache
+        self.model_id = predictor.model_id
+        self._key_prefix = f"{predictor.model_id}|{artifact_digest}|".encode()
+
+    def close(self):
+        self.predictor.close()
+
+    def _key(self, row):
+        return hashlib.blake2b(self._key_prefix + row.tobytes(), digest_size=16).digest()
+
+    def predict(self, rows):
+        rows = np.ascontiguousarray(np.atleast_2d(rows), dtype=np.float64)
+        keys = [self._key(row) for row in rows]
+        predictions = np.array([self.cache.get(key, np.nan) for key in keys], dtype=np.float64)
+
+        misses = np.flatnonzero(np.isnan(predictions))
+        if len(misses):
+            predictions[misses] = self.predictor.predict(rows[misses])
+            for i in misses:
+                self.cache.put(keys[i], predictions[i])
+        return predictions
+
+
+def build_predictor(context, backend=PREDICTOR_BACKEND, artifacts=None):
+    """
+    Creates the predictor selected by configuration for one artifact version,
+    behind the request coalescer (if enabled) and the prediction cache.
+
+    Parameters:
+        context (InferenceContext): Shared credentials and runtime client.
+        backend (str): "sagemaker", "local" or "service".
+        artifacts (ArtifactVersion): The version to serve; defaults to the active one.
+
+    Returns:
+        Predictor: The configured backend.
+    """
+    artifacts = artifacts or context.artifacts
+    if backend == "sagemaker":
+        predictor = SageMakerPredictor(context, artifacts.endpoint_name)
+    elif backend == "local":
+        predictor = LocalXGBoostPredictor(artifacts.model_path or MODEL_PATH)
+    elif backend == "service":
+        predictor = ServicePredictor(SCORING_SERVICE_URL, artifacts.version)
+    else:
+        raise ValueError(f"Unknown predictor backend: {backend}")
+
+    if COALESCE_WINDOW_MS > 0:
+        predictor = CoalescingPredictor(predictor)
+    if PREDICTION_CACHE_SIZE <= 0:
+        return predictor
+    cache = TTLCache(PREDICTION_CACHE_SIZE, PREDICTION_CACHE_TTL)
+    REGISTRY.register_cache("prediction", cache)
+    return CachedPredictor(predictor, artifacts.digest, cache)
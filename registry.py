@@ -0,0 +1,307 @@
+# Versioned model and scaler artifacts.
+#
+# Each version is a directory holding the scaler's arrays as .npy files, an
+# optional booster file and a manifest.json with the feature order, the
+# SageMaker endpoint and a SHA-256 checksum of every file. A CURRENT file at
+# the registry root names the active version and is replaced atomically, so
+# running servers pick up a new version without a restart.
+#
+#     python registry.py publish v2 --scaler scaler.pkl --endpoint <name> [--model xgboost-model] [--activate]
+#     python registry.py activate v1
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+from features import FeatureGraph, FeaturePipeline
+from metrics import span
+
+# Registry root; resolved against this file, not the working directory
+ARTIFACT_DIR = os.environ.get("STILLSAFE_ARTIFACT_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "artifacts"))
+
+# How often a running server checks CURRENT for a new version
+ARTIFACT_POLL_SECONDS = float(os.environ.get("STILLSAFE_ARTIFACT_POLL", "5"))
+
+MANIFEST_NAME = "manifest.json"
+CURRENT_NAME = "CURRENT"
+
+
+class ArtifactError(Exception):
+    """
+    Raised when a version is missing, fails its checksums, or its artifacts do
+    not match each other.
+    """
+
+
+def file_digest(path):
+    """
+    Returns the SHA-256 hex digest of a file, used to tell artifact versions apart.
+    """
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class ArtifactVersion:
+    """
+    One loaded version: its manifest, the memory-mapped scaler arrays compiled
+    into a feature pipeline and graph, and where its model is served.
+    """
+
+    def __init__(self, version, manifest, digest, mean, scale, model_path=None):
+        self.version = version
+        self.manifest = manifest
+        self.digest = digest
+        self.endpoint_name = manifest["endpoint_name"]
+        self.model_path = model_path
+        self.pipeline = FeaturePipeline(mean, scale, manifest["feature_names"])
+        self.graph = FeatureGraph(self.pipeline)
+
+
+def load_version(root, version):
+    """
+    Loads and verifies one version of the registry.
+
+    Every file listed in the manifest is checked against its SHA-256 before
+    use. The scaler arrays are memory-mapped read-only, so worker processes on
+    the same host share one copy through the page cache.
+
+    Parameters:
+        root (str): Registry root directory.
+        version (str): Version directory name.
+
+    Returns:
+        ArtifactVersion: The loaded version.
+
+    Raises:
+        ArtifactError: The version is missing or corrupt, or its arrays or
+            model do not match its feature list.
+    """
+    directory = os.path.join(root, version)
+    try:
+        with open(os.path.join(directory, MANIFEST_NAME), "rb") as f:
+            raw_manifest = f.read()
+        manifest = json.loads(raw_manifest)
+        for name, expected in manifest["files"].items():
+            if file_digest(os.path.join(directory, name)) != expected:
+                raise ArtifactError(f"Checksum mismatch for {version}/{name}")
+        mean = np.load(os.path.join(directory, manifest["mean"]), mmap_mode="r", allow_pickle=False)
+        scale = np.load(os.path.join(directory, manifest["scale"]), mmap_mode="r", allow_pickle=False)
+        feature_names = manifest["feature_names"]
+        if not isinstance(feature_names, list) or not all(isinstance(name, str) for name in feature_names):
+            raise ArtifactError(f"Artifact version {version} does not list its feature names")
+        if not isinstance(manifest["endpoint_name"], str):
+            raise ArtifactError(f"Artifact version {version} does not name its endpoint")
+    except KeyError as e:
+        raise ArtifactError(f"The manifest of artifact version {version} has no {e} entry")
+    except (OSError, TypeError, ValueError) as e:
+        raise ArtifactError(f"Could not load artifact version {version}: {e}")
+
+    n_features = len(feature_names)
+    if mean.shape != (n_features,) or scale.shape != (n_features,):
+        raise ArtifactError(
+            f"Artifact version {version} lists {n_features} features but its scaler arrays have shapes {mean.shape} and {scale.shape}"
+        )
+
+    model_path = os.path.join(directory, manifest["model_file"]) if manifest.get("model_file") else None
+    if model_path:
+        check_model_features(model_path, version, n_features)
+    try:
+        return ArtifactVersion(version, manifest, hashlib.sha256(raw_manifest).hexdigest(), mean, scale, model_path)
+    except KeyError as e:
+        raise ArtifactError(f"Artifact version {version} lacks the model feature {e}")
+
+
+def check_model_features(model_path, version, n_features):
+    """
+    Checks that a version's booster takes as many features as the version lists.
+    Skipped when xgboost is not installed, as only the local backend needs it.
+
+    Raises:
+        ArtifactError: The booster cannot be loaded or has a different number of features.
+    """
+    try:
+        import xgboost as xgb
+    except ImportError:
+        return
+    booster = xgb.Booster()
+    try:
+        booster.load_model(model_path)
+    except xgb.core.XGBoostError as e:
+        raise ArtifactError(f"Could not load the model of artifact version {version}: {e}")
+    if booster.num_features() != n_features:
+        raise ArtifactError(f"Artifact version {version} lists {n_features} features but its model takes {booster.num_features()}")
+
+
+def read_current(root):
+    """
+    Returns the name of the active version, from the registry's CURRENT file.
+    """
+    try:
+        with open(os.path.join(root, CURRENT_NAME)) as f:
+            return f.read().strip()
+    except OSError as e:
+        raise ArtifactError(f"No active artifact version in {root}: {e}")
+
+
+def activate(root, version):
+    """
+    Makes a published version the active one. CURRENT is written to a temporary
+    file and renamed over the old one, so readers never see a partial name.
+    """
+    if not os.path.isfile(os.path.join(root, version, MANIFEST_NAME)):
+        raise ArtifactError(f"Artifact version {version} has not been published")
+    fd, tmp_path = tempfile.mkstemp(dir=root, prefix=".current-")
+    with os.fdopen(fd, "w") as f:
+        f.write(version + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, os.path.join(root, CURRENT_NAME))
+
+
+def publish_version(root, version, mean, scale, feature_names, endpoint_name, model_file=None):
+    """
+    Writes a new version into the registry without activating it.
+
+    The files are written to a staging directory first and renamed into place
+    in one step, so a half-written version is never visible.
+
+    Parameters:
+        root (str): Registry root directory.
+        version (str): Name of the new version.
+        mean (array-like): The scaler's mean_.
+        scale (array-like): The scaler's scale_.
+        feature_names (list): Model column order.
+        endpoint_name (str): SageMaker endpoint serving this model.
+        model_file (str): Optional booster file for the local backend, copied in.
+
+    Returns:
+        str: The new version's directory.
+    """
+    mean = np.asarray(mean, dtype=np.float64)
+    scale = np.asarray(scale, dtype=np.float64)
+    if not len(feature_names) == mean.shape[0] == scale.shape[0]:
+        raise ArtifactError("Scaler arrays and feature names have different lengths")
+
+    target = os.path.join(root, version)
+    if os.path.exists(target):
+        raise ArtifactError(f"Artifact version {version} already exists")
+    os.makedirs(root, exist_ok=True)
+    staging = tempfile.mkdtemp(dir=root, prefix=f".staging-{version}-")
+
+    np.save(os.path.join(staging, "mean.npy"), mean, allow_pickle=False)
+    np.save(os.path.join(staging, "scale.npy"), scale, allow_pickle=False)
+    manifest = {
+        "version": version,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "feature_names": list(feature_names),
+        "endpoint_name": endpoint_name,
+        "mean": "mean.npy",
+        "scale": "scale.npy",
+        "model_file": None,
+    }
+    if model_file:
+        manifest["model_file"] = os.path.basename(model_file)
+        shutil.copyfile(model_file, os.path.join(staging, manifest["model_file"]))
+    manifest["files"] = {name: file_digest(os.path.join(staging, name)) for name in sorted(os.listdir(staging))}
+
+    with open(os.path.join(staging, MANIFEST_NAME), "w") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+    os.chmod(staging, 0o755)
+    os.rename(staging, target)
+    return target
+
+
+class ArtifactRegistry:
+    """
+    Serves the active artifact version and follows CURRENT as it changes.
+
+    current() re-reads CURRENT at most every poll_seconds. A new version is
+    loaded and verified in full before it replaces the old one in a single
+    reference swap; callers that already hold the old ArtifactVersion keep
+    using it until they finish. A new version that fails to load is skipped
+    and the old one stays active.
+    """
+
+    def __init__(self, root=ARTIFACT_DIR, poll_seconds=ARTIFACT_POLL_SECONDS, clock=time.monotonic):
+        self.root = root
+        self.poll_seconds = poll_seconds
+        self.clock = clock
+        self.last_error = None
+        self._current = None
+        self._failed_version = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def current(self):
+        """
+        Returns:
+            ArtifactVersion: The active version.
+
+        Raises:
+            ArtifactError: No version has ever loaded successfully.
+        """
+        current = self._current
+        if current is not None and self.clock() - self._checked_at < self.poll_seconds:
+            return current
+
+        with self._lock:
+            if self._current is not None and self.clock() - self._checked_at < self.poll_seconds:
+                return self._current
+            self._checked_at = self.clock()
+            version = None
+            try:
+                version = read_current(self.root)
+                if self._current is None or (version != self._current.version and version != self._failed_version):
+                    with span("artifact_load"):
+                        self._current = load_version(self.root, version)
+                    self._failed_version = None
+            except ArtifactError as e:
+                if self._current is None:
+                    raise
+                self.last_error = str(e)
+                self._failed_version = version
+            return self._current
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Publish or activate model and scaler artifact versions.")
+    parser.add_argument("--root", default=ARTIFACT_DIR)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    publish = commands.add_parser("publish", help="Publish a version from a fitted scaler pickle")
+    publish.add_argument("version")
+    publish.add_argument("--scaler", required=True)
+    publish.add_argument("--endpoint", required=True)
+    publish.add_argument("--model", help="Booster file for the local backend")
+    publish.add_argument("--activate", action="store_true", help="Make it the active version too")
+
+    activate_command = commands.add_parser("activate", help="Make a published version the active one")
+    activate_command.add_argument("version")
+
+    args = parser.parse_args()
+    if args.command == "publish":
+        # Imported here so serving never needs to unpickle anything
+        from inference import load_scaler
+
+        scaler = load_scaler(args.scaler)
+        path = publish_version(args.root, args.version, scaler.mean_, scaler.scale_, scaler.feature_names_in_, args.endpoint, args.model)
+        print(f"Published {path}")
+        if args.activate:
+            activate(args.root, args.version)
+    else:
+        activate(args.root, args.version)
+    if args.command == "activate" or args.activate:
+        print(f"Active version: {args.version}")
+
+
+if __name__ == "__main__":
+    main()
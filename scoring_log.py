@@ -0,0 +1,431 @@
+# Scoring log, drift monitor and offline replay.
+#
+# With STILLSAFE_SCORING_LOG=1, every submitted Risk Assessment is appended
+# to a log of compact NumPy segments. Each row holds the scaled feature vector
+# and the model's score. No identifiers are stored: there is no session, user
+# or free text, the timestamp is cut to the UTC day, and rows are shuffled
+# within a segment before it is written, so row order cannot be matched to
+# visits. Segments never change once written.
+#
+# The offline jobs stream the segments through memory maps one chunk at a
+# time, so memory stays bounded however many rows have been logged:
+#
+#     python scoring_log.py drift [--reference v1]
+#     python scoring_log.py rescore v2 [--output rescored.npy]
+
+import argparse
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+
+import numpy as np
+
+from registry import ARTIFACT_DIR, load_version, read_current
+
+# Off by default: only log where retaining de-identified assessments is allowed
+SCORING_LOG = os.environ.get("STILLSAFE_SCORING_LOG") == "1"
+SCORING_LOG_DIR = os.environ.get("STILLSAFE_SCORING_LOG_DIR", "scoring_log")
+
+# A segment is written once this many rows are buffered, or LOG_FLUSH_SECONDS after the first
+SEGMENT_ROWS = 65536
+LOG_FLUSH_SECONDS = 60.0
+
+# A segment that could not be written is retried after this delay, doubling up to LOG_RETRY_MAX_SECONDS
+LOG_RETRY_SECONDS = 1.0
+LOG_RETRY_MAX_SECONDS = 60.0
+
+# Rows read into memory at a time by the offline jobs
+CHUNK_ROWS = 262144
+
+# A feature is flagged when its mean has moved this many training standard
+# deviations, or its variance is outside these multiples of the training variance
+DRIFT_MEAN_SHIFT = 0.1
+DRIFT_VARIANCE_RATIO = (0.5, 2.0)
+
+# Features listed first in the drift report
+MONITORED_FEATURES = ("Mothers_Age", "Mothers_PrePregnancy_BMI", "Month_Prenatal_Care_Began", "Mothers_Race_Recode_31")
+
+logger = logging.getLogger(__name__)
+
+
+def _replace_atomically(path, write):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def write_segment(directory, rows, predictions, artifact_version, feature_names, rng=None):
+    """
+    Writes one segment: an (N, n_features + 1) float32 array of shuffled rows
+    with the score in the last column, and a JSON sidecar describing it. The
+    sidecar is written last, so readers never see a partial segment.
+
+    Parameters:
+        directory (str): Log directory.
+        rows (np.ndarray): (N, n_features) scaled feature rows.
+        predictions (np.ndarray): N scores.
+        artifact_version (str): The artifact version the rows were scaled with.
+        feature_names (list): Column order of rows.
+        rng (np.random.Generator): Source of the shuffle.
+
+    Returns:
+        str: Path of the segment's .npy file.
+    """
+    rng = rng or np.random.default_rng()
+    data = np.empty((len(rows), len(feature_names) + 1), dtype=np.float32)
+    data[:, :-1] = rows
+    data[:, -1] = predictions
+    data = data[rng.permutation(len(data))]
+
+    os.makedirs(directory, exist_ok=True)
+    name = f"{time.strftime('%Y%m%d', time.gmtime())}-{uuid.uuid4().hex}"
+    path = os.path.join(directory, f"{name}.npy")
+    _replace_atomically(path, lambda f: np.save(f, data, allow_pickle=False))
+    meta = {
+        "day": time.strftime("%Y-%m-%d", time.gmtime()),
+        "rows": len(data),
+        "artifact_version": artifact_version,
+        "feature_names": list(feature_names),
+        "data": f"{name}.npy",
+    }
+    _replace_atomically(os.path.join(directory, f"{name}.json"), lambda f: f.write(json.dumps(meta).encode()))
+    return path
+
+
+class ScoringLog:
+    """
+    Collects scored rows without touching storage on the caller's thread.
+
+    record() only queues a copy of the rows; a background thread gathers them
+    into segments, one per artifact version. A segment that cannot be written
+    is logged and its rows are retried with exponential backoff. close() writes
+    whatever is still buffered and is registered to run at interpreter exit.
+    """
+
+    def __init__(self, directory=SCORING_LOG_DIR, segment_rows=SEGMENT_ROWS, flush_interval=LOG_FLUSH_SECONDS, retry_seconds=LOG_RETRY_SECONDS):
+        self.directory = directory
+        self.segment_rows = segment_rows
+        self.flush_interval = flush_interval
+        self.retry_seconds = retry_seconds
+        self._queue = queue.Queue()
+        self._closed = threading.Event()
+        self._writer = threading.Thread(target=self._run, name="stillsafe-scoring-log", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def record(self, rows, predictions, artifacts):
+        """
+        Queues scored rows for the log.
+
+        Parameters:
+            rows (np.ndarray): (N, n_features) scaled feature rows.
+            predictions (np.ndarray): The model's N scores.
+            artifacts (ArtifactVersion): The version the rows were scaled with.
+        """
+        if self._closed.is_set():
+            raise ValueError("Scoring log is closed")
+        self._queue.put((artifacts.version, artifacts.pipeline.feature_names, np.array(rows, dtype=np.float32), np.array(predictions, dtype=np.float32)))
+
+    def _write(self, pending):
+        """
+        Writes the pending rows as one segment per artifact version.
+
+        Returns:
+            list: The pending items of the versions whose segment could not be written.
+        """
+        by_version = {}
+        for item in pending:
+            by_version.setdefault((item[0], item[1]), []).append(item)
+        failed = []
+        for (version, feature_names), items in by_version.items():
+            rows = np.concatenate([item[2] for item in items])
+            try:
+                write_segment(self.directory, rows, np.concatenate([item[3] for item in items]), version, feature_names)
+            except Exception:
+                logger.exception("Could not write a scoring log segment of %d rows", len(rows))
+                failed.extend(items)
+        return failed
+
+    def _run(self):
+        pending = []
+        size = 0
+        deadline = None
+        failures = 0
+        while not self._closed.is_set():
+            timeout = self.flush_interval if deadline is None else max(deadline - time.monotonic(), 0)
+            try:
+                item = self._queue.get(timeout=min(timeout, 1.0))
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+                pending.append(item)
+                size += len(item[2])
+            except queue.Empty:
+                pass
+            # After a failed write, wait out the backoff even if the buffer is full
+            if pending and ((size >= self.segment_rows and not failures) or time.monotonic() >= deadline):
+                pending = self._write(pending)
+                size = sum(len(item[2]) for item in pending)
+                if pending:
+                    failures += 1
+                    deadline = time.monotonic() + min(self.retry_seconds * 2 ** (failures - 1), LOG_RETRY_MAX_SECONDS)
+                else:
+                    failures, deadline = 0, None
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        if pending:
+            failed = self._write(pending)
+            if failed:
+                logger.error("Dropped %d scoring log rows at shutdown", sum(len(item[2]) for item in failed))
+
+    def close(self):
+        """
+        Stops the writer and durably writes everything still buffered. Rows
+        that still cannot be written are logged and dropped.
+        """
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._writer.join()
+
+
+def list_segments(directory=SCORING_LOG_DIR):
+    """
+    Returns the metadata of every complete segment in the log, oldest day first.
+    """
+    if not os.path.isdir(directory):
+        return []
+    segments = []
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".json"):
+            with open(os.path.join(directory, name)) as f:
+                segments.append(json.load(f))
+    return segments
+
+
+def iter_chunks(directory=SCORING_LOG_DIR, chunk_rows=CHUNK_ROWS):
+    """
+    Streams the log one chunk at a time through read-only memory maps.
+
+    Yields:
+        tuple: Segment metadata and an (M, n_features + 1) float32 view of at most chunk_rows rows.
+    """
+    for meta in list_segments(directory):
+        data = np.load(os.path.join(directory, meta["data"]), mmap_mode="r", allow_pickle=False)
+        for start in range(0, len(data), chunk_rows):
+            yield meta, data[start:start + chunk_rows]
+
+
+class RunningMoments:
+    """
+    Count, mean and sum of squared deviations per column, merged one chunk at a
+    time (Chan et al.), so the variance is stable over millions of rows.
+    """
+
+    def __init__(self, n_columns):
+        self.count = 0
+        self.mean = np.zeros(n_columns)
+        self.m2 = np.zeros(n_columns)
+
+    def add(self, chunk):
+        n = len(chunk)
+        if n == 0:
+            return
+        mean = chunk.mean(axis=0)
+        m2 = ((chunk - mean) ** 2).sum(axis=0)
+        delta = mean - self.mean
+        total = self.count + n
+        self.mean += delta * n / total
+        self.m2 += m2 + delta ** 2 * self.count * n / total
+        self.count = total
+
+    @property
+    def variance(self):
+        return self.m2 / max(self.count, 1)
+
+
+class _Unscaler:
+    # Maps logged chunks back to raw feature values in a target feature order,
+    # using the arrays of whichever version each segment was scaled with
+    def __init__(self, root, feature_names):
+        self.root = root
+        self.feature_names = list(feature_names)
+        self._versions = {}
+
+    def __call__(self, meta, chunk):
+        version = meta["artifact_version"]
+        if version not in self._versions:
+            pipeline = load_version(self.root, version).pipeline
+            try:
+                order = [meta["feature_names"].index(name) for name in self.feature_names]
+            except ValueError as e:
+                raise ValueError(f"Segments scaled with {version} lack a feature: {e}")
+            self._versions[version] = (pipeline.mean[order], pipeline.scale[order], order)
+        mean, scale, order = self._versions[version]
+        return chunk[:, order].astype(np.float64) * scale + mean
+
+
+def drift_report(reference, directory=SCORING_LOG_DIR, root=ARTIFACT_DIR, chunk_rows=CHUNK_ROWS):
+    """
+    Compares the logged inputs with the distribution the reference scaler was fitted on.
+
+    Parameters:
+        reference (ArtifactVersion): Version whose scaler mean_ and scale_ define the training distribution.
+        directory (str): Log directory.
+        root (str): Artifact registry the logged versions are loaded from.
+        chunk_rows (int): Rows held in memory at a time.
+
+    Returns:
+        tuple: A summary dict (rows, mean score, share scored HIGH) and one dict
+        per feature with the training and live mean and standard deviation, the
+        mean shift in training standard deviations, the variance ratio and
+        whether the feature has drifted. Monitored features come first.
+    """
+    pipeline = reference.pipeline
+    unscale = _Unscaler(root, pipeline.feature_names)
+    features = RunningMoments(len(pipeline.feature_names))
+    scores = RunningMoments(1)
+    high = 0
+    for meta, chunk in iter_chunks(directory, chunk_rows):
+        features.add(unscale(meta, chunk))
+        predictions = chunk[:, -1].astype(np.float64)
+        scores.add(predictions[:, None])
+        high += int(np.count_nonzero(np.round(predictions)))
+
+    train_var = pipeline.scale ** 2
+    mean_shift = (features.mean - pipeline.mean) / pipeline.scale
+    variance_ratio = features.variance / train_var
+    low, high_ratio = DRIFT_VARIANCE_RATIO
+    rows = [
+        {
+            "Feature": name,
+            "Train mean": float(pipeline.mean[i]),
+            "Live mean": float(features.mean[i]),
+            "Train SD": float(pipeline.scale[i]),
+            "Live SD": float(np.sqrt(features.variance[i])),
+            "Mean shift (SD)": float(mean_shift[i]),
+            "Variance ratio": float(variance_ratio[i]),
+            "Drifted": bool(abs(mean_shift[i]) > DRIFT_MEAN_SHIFT or not low <= variance_ratio[i] <= high_ratio),
+        }
+        for i, name in enumerate(pipeline.feature_names)
+    ]
+    rows.sort(key=lambda row: MONITORED_FEATURES.index(row["Feature"]) if row["Feature"] in MONITORED_FEATURES else len(MONITORED_FEATURES))
+    summary = {
+        "rows": features.count,
+        "mean_score": float(scores.mean[0]) if scores.count else None,
+        "high_risk_share": high / features.count if features.count else None,
+    }
+    return summary, rows
+
+
+def rescore(candidate, predictor, directory=SCORING_LOG_DIR, root=ARTIFACT_DIR, chunk_rows=CHUNK_ROWS, output=None):
+    """
+    Re-scores every logged row through a candidate model, chunk by chunk.
+
+    Rows are mapped back to raw features with the scaler they were logged
+    with, scaled with the candidate's scaler and sent to the predictor in
+    batches of chunk_rows.
+
+    Parameters:
+        candidate (ArtifactVersion): The version to evaluate.
+        predictor (Predictor): Scores rows for the candidate model.
+        directory (str): Log directory.
+        root (str): Artifact registry the logged versions are loaded from.
+        chunk_rows (int): Rows held in memory at a time.
+        output (str): Optional .npy path for an (N, 2) float32 array of logged
+            and candidate scores, written through a memory map.
+
+    Returns:
+        dict: Rows scored, mean logged and candidate scores, share scored HIGH
+        by each, and how many rows moved from LOW to HIGH and back.
+    """
+    unscale = _Unscaler(root, candidate.pipeline.feature_names)
+    total = sum(meta["rows"] for meta in list_segments(directory))
+    scores = np.lib.format.open_memmap(output, mode="w+", dtype=np.float32, shape=(total, 2)) if output else None
+
+    result = {"rows": 0, "logged_score_sum": 0.0, "candidate_score_sum": 0.0, "logged_high": 0, "candidate_high": 0, "low_to_high": 0, "high_to_low": 0}
+    for meta, chunk in iter_chunks(directory, chunk_rows):
+        logged = chunk[:, -1].astype(np.float64)
+        candidate_scores = np.asarray(predictor.predict(candidate.pipeline.transform(unscale(meta, chunk))), dtype=np.float64)
+        logged_high = np.round(logged) != 0
+        candidate_high = np.round(candidate_scores) != 0
+        if scores is not None:
+            scores[result["rows"]:result["rows"] + len(chunk)] = np.column_stack([logged, candidate_scores])
+        result["rows"] += len(chunk)
+        result["logged_score_sum"] += float(logged.sum())
+        result["candidate_score_sum"] += float(candidate_scores.sum())
+        result["logged_high"] += int(logged_high.sum())
+        result["candidate_high"] += int(candidate_high.sum())
+        result["low_to_high"] += int((candidate_high & ~logged_high).sum())
+        result["high_to_low"] += int((logged_high & ~candidate_high).sum())
+    if scores is not None:
+        scores.flush()
+
+    rows = max(result["rows"], 1)
+    return {
+        "rows": result["rows"],
+        "mean_logged_score": result["logged_score_sum"] / rows,
+        "mean_candidate_score": result["candidate_score_sum"] / rows,
+        "logged_high_share": result["logged_high"] / rows,
+        "candidate_high_share": result["candidate_high"] / rows,
+        "low_to_high": result["low_to_high"],
+        "high_to_low": result["high_to_low"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drift statistics and candidate re-scoring over the scoring log.")
+    parser.add_argument("--dir", default=SCORING_LOG_DIR, help="Scoring log directory")
+    parser.add_argument("--root", default=ARTIFACT_DIR, help="Artifact registry")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    drift = commands.add_parser("drift", help="Compare logged inputs with the scaler's training distribution")
+    drift.add_argument("--reference", help="Artifact version to compare against (default: the active one)")
+
+    rescore_command = commands.add_parser("rescore", help="Re-score logged rows through a candidate version")
+    rescore_command.add_argument("version")
+    rescore_command.add_argument("--output", help="Write logged and candidate scores to this .npy file")
+
+    args = parser.parse_args()
+    if args.command == "drift":
+        reference = load_version(args.root, args.reference or read_current(args.root))
+        summary, rows = drift_report(reference, args.dir, args.root, args.chunk_rows)
+        if not summary["rows"]:
+            print(f"No logged rows in {args.dir}")
+            return
+        print(f"{summary['rows']:,} rows against {reference.version}; mean score {summary['mean_score']:.3f}, {summary['high_risk_share']:.1%} HIGH")
+        print(f"{'feature':<34}{'train mean':>12}{'live mean':>12}{'shift (SD)':>12}{'var ratio':>11}")
+        for row in rows:
+            flag = "  DRIFT" if row["Drifted"] else ""
+            print(
+                f"{row['Feature']:<34}{row['Train mean']:>12.3f}{row['Live mean']:>12.3f}"
+                f"{row['Mean shift (SD)']:>+12.3f}{row['Variance ratio']:>11.2f}{flag}"
+            )
+    else:
+        from predictors import LocalXGBoostPredictor, SageMakerPredictor
+
+        candidate = load_version(args.root, args.version)
+        if candidate.model_path:
+            predictor = LocalXGBoostPredictor(candidate.model_path)
+        else:
+            from inference import InferenceContext
+
+            predictor = SageMakerPredictor(InferenceContext(artifact_dir=args.root), candidate.endpoint_name)
+        result = rescore(candidate, predictor, args.dir, args.root, args.chunk_rows, args.output)
+        print(
+            f"{result['rows']:,} rows re-scored with {candidate.version}: mean score {result['mean_logged_score']:.3f} -> "
+            f"{result['mean_candidate_score']:.3f}, HIGH {result['logged_high_share']:.1%} -> {result['candidate_high_share']:.1%}, "
+            f"{result['low_to_high']:,} LOW->HIGH, {result['high_to_low']:,} HIGH->LOW"
+        )
+
+
+if __name__ == "__main__":
+    main()
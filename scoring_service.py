@@ -0,0 +1,256 @@
+# Standalone scoring service.
+#
+# Exposes the Risk Assessment's preprocessing and scoring as JSON endpoints
+# for other clients (EHR integrations, batch jobs) and for the Streamlit app's
+# "service" backend. The ASGI front end only parses and validates requests;
+# feature derivation, scaling and scoring run in a pool of worker processes,
+# each with its own inference context over the shared, memory-mapped artifacts.
+#
+#     python scoring_service.py [--host 127.0.0.1] [--port 8600] [--workers N]
+#
+#     POST /v1/score          {"Delivery_Month": 1, "Mothers_Age": 30, ...}
+#     POST /v1/score/batch    {"records": [{...}, {...}]}
+#     POST /v1/predict        {"rows": [[...scaled features...]], "artifact_version": "v1"}
+#     GET  /healthz
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+
+import numpy as np
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from batch import BATCH_INPUT_COLUMNS, describe_invalid, invalid_inputs
+from invocation import EndpointUnavailable
+from metrics import span
+from registry import ArtifactError, load_version
+
+# Scoring worker processes; each holds its own predictor and endpoint client
+SERVICE_WORKERS = int(os.environ.get("STILLSAFE_SERVICE_WORKERS", str(os.cpu_count() or 1)))
+
+# Largest batch accepted in one request
+SERVICE_MAX_RECORDS = int(os.environ.get("STILLSAFE_SERVICE_MAX_RECORDS", "50000"))
+
+SERVICE_HOST = os.environ.get("STILLSAFE_SERVICE_HOST", "127.0.0.1")
+SERVICE_PORT = int(os.environ.get("STILLSAFE_SERVICE_PORT", "8600"))
+
+# Per-process state of a scoring worker, set up by _init_worker
+_context = None
+_versions = {}
+_predictors = {}
+
+
+def _init_worker():
+    global _context
+    # Imported here so the front-end process never loads boto3 or the artifacts
+    from inference import InferenceContext
+    from predictors import PREDICTOR_BACKEND
+
+    if PREDICTOR_BACKEND == "service":
+        raise ValueError("The scoring service cannot use the service backend itself; set STILLSAFE_PREDICTOR to sagemaker or local")
+    _context = InferenceContext()
+
+
+def _artifacts_for(version):
+    # The active version, or an older one a client's rows were scaled with;
+    # the last two are kept loaded so requests spanning a swap still score
+    artifacts = _context.artifacts
+    if version is None or version == artifacts.version:
+        return artifacts
+    if version not in _versions:
+        _versions[version] = load_version(_context.registry.root, version)
+        while len(_versions) > 2:
+            _versions.pop(next(iter(_versions)))
+    return _versions[version]
+
+
+def _predictor_for(artifacts):
+    from predictors import build_predictor
+
+    if artifacts.version not in _predictors:
+        _predictors[artifacts.version] = build_predictor(_context, artifacts=artifacts)
+        while len(_predictors) > 2:
+            _predictors.pop(next(iter(_predictors))).close()
+    return _predictors[artifacts.version]
+
+
+def score_records(records):
+    """
+    Derives, scales and scores encoded form answers. Runs in a worker process.
+
+    Parameters:
+        records (list): Dicts of encoded answers, keyed like the batch upload's columns.
+
+    Returns:
+        tuple: The artifact version used and a list of scores, one per record.
+    """
+    # Imported here so the front-end process never loads pandas
+    import pandas as pd
+
+    artifacts = _context.artifacts
+    graph = artifacts.graph
+    try:
+        columns = {name: np.array([record[name] for record in records], dtype=np.float64) for name in BATCH_INPUT_COLUMNS}
+    except KeyError as e:
+        raise ValueError(f"Missing field {e} in record")
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Fields must be numbers: {e}")
+    for name, values in columns.items():
+        if values.shape != (len(records),):
+            raise ValueError(f"Field {name!r} must be a single number")
+
+    # The batch upload's checks: JSON null becomes NaN, and answers the form
+    # cannot produce (a zero height, an unknown code) would still be scored
+    invalid = invalid_inputs(pd.DataFrame(columns, copy=False))
+    if invalid.any():
+        first = np.flatnonzero(invalid.any(axis=1))[0]
+        raise ValueError(f"Record {first}: {describe_invalid(invalid[first:first + 1])[0]}")
+
+    rows = artifacts.pipeline.transform(graph.derive({name: columns[name] for name in graph.input_names}))
+    if not np.isfinite(rows).all():
+        raise ValueError("Derived features must be finite numbers")
+    return artifacts.version, _predictor_for(artifacts).predict(rows).tolist()
+
+
+def predict_rows(rows, version):
+    """
+    Scores rows that the client has already scaled. Runs in a worker process.
+
+    Parameters:
+        rows (list): Scaled feature rows, in the artifact version's feature order.
+        version (str): The artifact version the rows were scaled with.
+
+    Returns:
+        tuple: The artifact version used and a list of scores, one per row.
+    """
+    artifacts = _artifacts_for(version)
+    try:
+        rows = np.asarray(rows, dtype=np.float64)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Rows must be lists of numbers: {e}")
+    if rows.ndim != 2 or rows.shape[1] != len(artifacts.pipeline.feature_names):
+        raise ValueError(f"Rows must have {len(artifacts.pipeline.feature_names)} features each")
+    if not np.isfinite(rows).all():
+        raise ValueError("Rows must contain only finite numbers")
+    return artifacts.version, _predictor_for(artifacts).predict(rows).tolist()
+
+
+def risk_level(score):
+    return "LOW" if round(score) == 0 else "HIGH"
+
+
+async def _run(request, func, *args):
+    try:
+        with span(f"service:{func.__name__}"):
+            return await asyncio.get_running_loop().run_in_executor(request.app.state.pool, func, *args)
+    except ValueError as e:
+        return JSONResponse({"error": str(e)}, status_code=422)
+    except EndpointUnavailable as e:
+        return JSONResponse({"error": str(e)}, status_code=503)
+    except ArtifactError as e:
+        return JSONResponse({"error": str(e)}, status_code=409)
+
+
+async def _json_body(request):
+    try:
+        return await request.json()
+    except ValueError:
+        return None
+
+
+async def score(request):
+    record = await _json_body(request)
+    if not isinstance(record, dict):
+        return JSONResponse({"error": "Expected a JSON object of form answers"}, status_code=400)
+    result = await _run(request, score_records, [record])
+    if isinstance(result, JSONResponse):
+        return result
+    version, (risk_score,) = result
+    return JSONResponse({"risk_score": risk_score, "risk_level": risk_level(risk_score), "artifact_version": version})
+
+
+async def score_batch(request):
+    body = await _json_body(request)
+    records = body.get("records") if isinstance(body, dict) else None
+    if not isinstance(records, list) or not all(isinstance(record, dict) for record in records):
+        return JSONResponse({"error": "Expected {\"records\": [...]} with one object per patient"}, status_code=400)
+    if len(records) > SERVICE_MAX_RECORDS:
+        return JSONResponse({"error": f"At most {SERVICE_MAX_RECORDS} records per request"}, status_code=413)
+    if not records:
+        return JSONResponse({"risk_scores": [], "risk_levels": [], "artifact_version": None})
+    result = await _run(request, score_records, records)
+    if isinstance(result, JSONResponse):
+        return result
+    version, risk_scores = result
+    return JSONResponse({"risk_scores": risk_scores, "risk_levels": [risk_level(s) for s in risk_scores], "artifact_version": version})
+
+
+async def predict(request):
+    body = await _json_body(request)
+    rows = body.get("rows") if isinstance(body, dict) else None
+    if not isinstance(rows, list) or not rows:
+        return JSONResponse({"error": "Expected {\"rows\": [[...]], \"artifact_version\": ...}"}, status_code=400)
+    if len(rows) > SERVICE_MAX_RECORDS:
+        return JSONResponse({"error": f"At most {SERVICE_MAX_RECORDS} rows per request"}, status_code=413)
+    result = await _run(request, predict_rows, rows, body.get("artifact_version"))
+    if isinstance(result, JSONResponse):
+        return result
+    version, predictions = result
+    return JSONResponse({"predictions": predictions, "artifact_version": version})
+
+
+async def healthz(request):
+    return JSONResponse({"status": "ok", "workers": request.app.state.workers})
+
+
+def create_app(workers=SERVICE_WORKERS):
+    """
+    Builds the ASGI application with its pool of scoring workers.
+
+    Parameters:
+        workers (int): Number of worker processes.
+
+    Returns:
+        Starlette: The application.
+    """
+
+    @asynccontextmanager
+    async def lifespan(app):
+        # Spawned, not forked, so workers never inherit the front end's threads or sockets
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"), initializer=_init_worker)
+        app.state.pool = pool
+        app.state.workers = workers
+        # Start every worker and load its artifacts before taking traffic
+        await asyncio.gather(*(asyncio.get_running_loop().run_in_executor(pool, os.getpid) for _ in range(workers)))
+        yield
+        pool.shutdown(cancel_futures=True)
+
+    return Starlette(
+        routes=[
+            Route("/v1/score", score, methods=["POST"]),
+            Route("/v1/score/batch", score_batch, methods=["POST"]),
+            Route("/v1/predict", predict, methods=["POST"]),
+            Route("/healthz", healthz, methods=["GET"]),
+        ],
+        lifespan=lifespan,
+    )
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Serve StillSafe risk scoring over HTTP.")
+    parser.add_argument("--host", default=SERVICE_HOST)
+    parser.add_argument("--port", type=int, default=SERVICE_PORT)
+    parser.add_argument("--workers", type=int, default=SERVICE_WORKERS)
+    args = parser.parse_args()
+    uvicorn.run(create_app(args.workers), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from metrics import span
+from predictors import Predictor
+
+# Opt-in: score the form in the background once its answers stop changing
+SPECULATIVE_SCORING = os.environ.get("STILLSAFE_SPECULATIVE", "0") == "1"
+
+# How long the answers must stay put before a speculative call starts
+SPECULATION_DEBOUNCE_SECONDS = float(os.environ.get("STILLSAFE_SPECULATION_DEBOUNCE", "1.5"))
+
+# Speculative endpoint calls one session may make, over its lifetime
+SPECULATION_MAX_CALLS = int(os.environ.get("STILLSAFE_SPECULATION_MAX_CALLS", "10"))
+
+# Worker threads shared by every session's speculative calls
+SPECULATION_WORKERS = 4
+
+
+class SpeculationStats:
+    """
+    Process-wide counts of speculative calls and how often Submit used them.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def add(self, calls=0, hits=0, misses=0):
+        with self._lock:
+            self.calls += calls
+            self.hits += hits
+            self.misses += misses
+
+    def summary(self):
+        """
+        Returns:
+            dict: Speculative calls, Submit hits and misses, the hit rate and
+            the calls whose result was never shown.
+        """
+        with self._lock:
+            submits = self.hits + self.misses
+            return {
+                "speculative_calls": self.calls,
+                "submit_hits": self.hits,
+                "submit_misses": self.misses,
+                "hit_rate": self.hits / submits if submits else 0.0,
+                "unused_calls": self.calls - self.hits,
+            }
+
+
+STATS = SpeculationStats()
+
+_executor = ThreadPoolExecutor(max_workers=SPECULATION_WORKERS, thread_name_prefix="stillsafe-speculate")
+
+
+class SpeculativePredictor(Predictor):
+    """
+    One session's speculative front to the shared predictor.
+
+    schedule() is called on every rerun with the current scaled row. Once the
+    row has stayed the same for the debounce period it is scored on a shared
+    worker and the result parked under the row's exact bytes. predict() then
+    answers Submit from the parked result, or waits for the matching call if it
+    is already running, and only calls the predictor itself on a miss.
+
+    Spend is bounded by max_calls per session. A newer row cancels the pending
+    debounce and any queued call for an older row; a call already waiting on
+    the endpoint cannot be aborted, so it finishes and its result is parked.
+    """
+
+    def __init__(self, predictor, debounce=SPECULATION_DEBOUNCE_SECONDS, max_calls=SPECULATION_MAX_CALLS, stats=STATS, executor=_executor):
+        self.predictor = predictor
+        self.model_id = predictor.model_id
+        self.debounce = debounce
+        self.max_calls = max_calls
+        self.stats = stats
+        self.executor = executor
+        self.calls = 0
+        self._latest = None
+        self._timer = None
+        self._inflight = {}
+        self._parked = {}
+        self._lock = threading.Lock()
+
+    def schedule(self, row):
+        """
+        Notes the row currently on the form and restarts the debounce.
+
+        Parameters:
+            row (np.ndarray): A (1, n_features) array of scaled features.
+        """
+        key = row.tobytes()
+        with self._lock:
+            if key == self._latest:
+                return
+            self._latest = key
+            self._cancel_pending(keep=key)
+            if key in self._parked or key in self._inflight or self.calls >= self.max_calls:
+                return
+            self._timer = threading.Timer(self.debounce, self._start, (key, row.copy()))
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _cancel_pending(self, keep=None):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for key, future in list(self._inflight.items()):
+            if key != keep and future.cancel():
+                # Never reached the endpoint, so it does not count against the cap
+                del self._inflight[key]
+                self.calls -= 1
+
+    def _start(self, key, row):
+        with self._lock:
+            if key != self._latest or self.calls >= self.max_calls:
+                return
+            self.calls += 1
+            self._inflight[key] = self.executor.submit(self._score, key, row)
+
+    def _score(self, key, row):
+        self.stats.add(calls=1)
+        try:
+            with span("speculative_predict"):
+                predictions = self.predictor.predict(row)
+            with self._lock:
+                self._parked[key] = predictions
+            return predictions
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def predict(self, rows):
+        rows = np.atleast_2d(rows)
+        key = rows.tobytes()
+        with self._lock:
+            # A matching call still queued behind other sessions' is cancelled and scored directly
+            self._cancel_pending()
+            predictions = self._parked.get(key)
+            future = self._inflight.get(key) if predictions is None else None
+
+        if predictions is None and future is not None:
+            try:
+                predictions = future.result()
+            except Exception:
+                # Submit retries through the normal path and reports its own error
+                predictions = None
+
+        if predictions is not None:
+            self.stats.add(hits=1)
+            return predictions
+        self.stats.add(misses=1)
+        return self.predictor.predict(rows)
@@ -0,0 +1,44 @@
+import streamlit as st
+
+from metrics import REGISTRY
+from speculation import SPECULATIVE_SCORING, STATS
+from warmup import WARM_UP
+
+
+def render():
+    st.markdown("<h1 style='color:#C45BAA;'>Latency Metrics</h1>", unsafe_allow_html=True)
+    st.write("Per-stage timings for this server process. Rolling percentiles cover the most recent observations of each stage.")
+
+    summary = REGISTRY.summary()
+    if summary:
+        st.dataframe(summary, hide_index=True, width="stretch")
+    else:
+        st.write("No stages have been timed yet.")
+
+    caches = REGISTRY.cache_summary()
+    if caches:
+        st.markdown("<h3 style='color:#C45BAA;'>Caches</h3>", unsafe_allow_html=True)
+        st.dataframe(
+            caches,
+            hide_index=True,
+            width="stretch",
+            column_config={"hit_rate": st.column_config.NumberColumn(format="percent")},
+        )
+
+    warm_up = WARM_UP.summary()
+    if warm_up["seconds"] is not None:
+        st.write(f"Startup warm-up: {warm_up['state']} in {warm_up['seconds']:.2f} s.")
+    else:
+        st.write(f"Startup warm-up: {warm_up['state']}.")
+    if warm_up["error"]:
+        st.warning(f"Last warm-up error: {warm_up['error']}")
+
+    if SPECULATIVE_SCORING:
+        st.markdown("<h3 style='color:#C45BAA;'>Speculative Scoring</h3>", unsafe_allow_html=True)
+        st.write("Background calls made while forms were being filled in, and how many Submits they answered.")
+        st.dataframe([STATS.summary()], hide_index=True, width="stretch")
+
+    prometheus_text = REGISTRY.prometheus_text()
+    st.download_button("Download Prometheus Metrics", prometheus_text, file_name="stillsafe_metrics.prom", mime="text/plain", on_click="ignore")
+    with st.expander("Prometheus text"):
+        st.code(prometheus_text, language="text")
@@ -0,0 +1,44 @@
+import streamlit as st
+
+from assets import load_asset
+from feedback_store import build_feedback_sink
+from fragments import ERROR_PANEL, message_panel
+
+THANKS_PANEL = message_panel("<strong>Thank you for your feedback!</strong> We’ll get back to you shortly.")
+EMPTY_FEEDBACK_PANEL = message_panel("<strong>Please enter some feedback</strong> before submitting.", ERROR_PANEL)
+
+
+@st.cache_resource
+def get_feedback_sink():
+    """
+    Returns the buffered feedback sink shared by all sessions in this process.
+    """
+    return build_feedback_sink()
+
+
+def render():
+    # Create a two-column layout for the logo and the title
+    col1, col2 = st.columns([1, 5])  # Adjust column widths as needed
+
+    # Logo in the left column
+    with col1:
+        st.image(load_asset("images/finallogoonly.jpg"), width=200)  # Adjust the width as necessary
+
+    # Title in the right column
+    with col2:
+        st.markdown("<h1 style='color:#C45BAA;'>Feedback</h1>", unsafe_allow_html=True)
+    st.title("We’d Love to Hear From You!")
+    st.write("Your thoughts and suggestions are important to us. Whether you have questions, ideas, or feedback, we’d love to hear from you as we work to make **StillSafe** even better.")
+    
+    feedback = st.text_area("Your Feedback", placeholder="Type your message here...")
+    
+    if st.button("Submit Feedback"):
+        if feedback.strip():
+            # Queue the feedback; it is written to storage in the background
+            get_feedback_sink().submit(feedback.strip())
+
+            # Custom-styled success message
+            st.markdown(THANKS_PANEL, unsafe_allow_html=True)
+        else:
+            # Custom-styled error message
+            st.markdown(EMPTY_FEEDBACK_PANEL, unsafe_allow_html=True)
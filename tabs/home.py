@@ -0,0 +1,76 @@
+import streamlit as st
+
+from assets import load_asset
+
+
+def render():
+    # Centered Logo at the Top
+    col1, col2, col3 = st.columns([1, 2, 1])  # Create three columns for centering
+    with col2:
+        st.image(load_asset("images/finallogo.jpg"), caption=None, use_container_width=False, width=350)  # Adjust width to 150px
+
+    # About StillSafe
+    st.markdown("<h3 style='color:#C45BAA;'>About StillSafe</h3>", unsafe_allow_html=True)
+    st.write("""
+    **StillSafe** is a groundbreaking tool developed by a dedicated team of UC Berkeley Master of Information and Data Science (MIDS) 
+    students to address the sensitive and critical issue of stillbirth. Our innovative solution leverages advanced machine learning to 
+    predict the risk of stillbirth early, equipping expecting families with actionable insights and personalized support. By identifying
+     key risk factors, we aim to empower families and underserved communities with knowledge and tools to improve pregnancy outcomes.
+
+    At **StillSafe**, we recognize the deep emotional and societal impact of stillbirth. Our platform is designed not only to provide hope 
+    but to foster equity in healthcare access and decision-making for all families navigating their pregnancy journey.
+    """)
+
+    # Why We Care
+    st.markdown("<h3 style='color:#C45BAA;'>Why We Care</h3>", unsafe_allow_html=True)
+    st.write("""
+    Every year, 2 million stillbirths occur globally, with 1 in every 175 babies stillborn in the United States alone.
+     Most of these tragedies happen unexpectedly in seemingly healthy pregnancies, leaving families overwhelmed with grief, 
+    guilt, and financial burdens of up to $9,000. Research shows that 80% of stillbirths are preventable through early detection, 
+    timely intervention, and equitable access to quality healthcare. At **StillSafe**, we are driven by the belief that no family should 
+    endure this heartbreak. By harnessing data and machine learning, we aim to identify risks early and provide families with the 
+    tools they need to act—saving lives when it matters most.
+    """)
+
+    # Our Mission
+    st.markdown("<h3 style='color:#C45BAA;'>Our Mission</h3>", unsafe_allow_html=True)
+    st.write("""
+    Our mission is to empower pregnant individuals and their families with a groundbreaking, data-driven 
+    tool that predicts the risk of stillbirth early, offering hope, action, and equity when it matters most.
+    """)
+
+    # How It Works
+    st.markdown("<h3 style='color:#C45BAA;'>How It Works</h3>", unsafe_allow_html=True)
+    st.write("""
+    - **Input Key Information:** Enter basic health and demographic details into our secure, user-friendly platform.
+    - **Personalized Risk Assessment:** Our advanced machine learning tool identifies pregnancies at high or low risk for stillbirth.
+    - **Tips for Success:** Explore our medically-approved Guide to a Safe and Healthy Pregnancy for actionable recommendations.
+    - **Feedback Section:** Help us enhance and refine our platform by sharing your thoughts and suggestions directly with us.
+    """)
+
+    # Image and Content Layout
+    col1, col2 = st.columns([1, 2])  # Adjust column ratios as needed
+
+    # Left Column: Image
+    with col1:
+        st.image(load_asset("images/pregnancypic.jpg"), caption="Supporting your pregnancy journey.", use_container_width=True)
+
+    # Right Column: Center the content vertically
+    with col2:
+        # Add vertical spacing to align content to the middle of the image
+        st.markdown("<div style='height: 80px;'></div>", unsafe_allow_html=True)  # Adjust height as needed
+
+        # Centered Heading
+        st.markdown("<h3 style='text-align:left;color:#C45BAA;'>Get Started Today</h3>", unsafe_allow_html=True)
+
+        # Centered Text
+        st.markdown("""
+        <p style="text-align: left; font-size: 16px;">
+         Take the first step toward a safer pregnancy. Whether you’re planning, expecting, or supporting someone who is, 
+         <strong>StillSafe</strong> is here to help.
+        </p>
+        """, unsafe_allow_html=True)
+
+        # Button to navigate to Risk Assessment
+        if st.button("Start Your Risk Assessment Now", key="home_risk_button"):
+            st.session_state["tab_selection"] = "Risk Assessment"
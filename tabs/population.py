@@ -0,0 +1,96 @@
+import html
+import logging
+
+import streamlit as st
+
+from batch import BATCH_INPUT_COLUMNS
+from fragments import ERROR_PANEL, message_panel
+from invocation import EndpointUnavailable
+from population import GROUPINGS, file_digest, summarize_cohort
+from tabs.risk_assessment import get_inference_context, get_uncached_predictor
+
+logger = logging.getLogger(__name__)
+
+# Cohorts whose aggregates stay cached per server process
+COHORT_CACHE_ENTRIES = 8
+
+
+@st.cache_resource(max_entries=COHORT_CACHE_ENTRIES, show_spinner="Scoring the cohort...")
+def cohort_summary(digest, version, _source, _artifacts):
+    """
+    Scores and aggregates a cohort file once per file content and artifact
+    version; re-renders and other sessions uploading the same file reuse it.
+    """
+    return summarize_cohort(_source, _artifacts.graph, get_uncached_predictor(_artifacts))
+
+
+def get_file_digest(uploaded_file):
+    """
+    Returns the content hash of an upload, hashing each upload only once per session.
+    """
+    cached = st.session_state.get("population_file")
+    if cached is None or cached[0] != uploaded_file.file_id:
+        cached = st.session_state["population_file"] = (uploaded_file.file_id, file_digest(uploaded_file))
+    return cached[1]
+
+
+def render():
+    st.markdown("<h1 style='color:#C45BAA;'>Population Dashboard</h1>", unsafe_allow_html=True)
+    st.write(
+        "For public-health partners: upload a cohort with one row per person and see the predicted risk across the whole "
+        "population, broken down by race, education, prenatal care and more. The file uses the same columns as the "
+        "Batch Risk Assessment, encoded the same way as the Risk Assessment form: "
+        + ", ".join(f"`{col}`" for col in BATCH_INPUT_COLUMNS)
+    )
+
+    uploaded_file = st.file_uploader("Cohort CSV", type="csv")
+    if uploaded_file is None:
+        return
+
+    # One artifact version for the whole rerun, even if a new one is activated meanwhile
+    artifacts = get_inference_context().artifacts
+    try:
+        summary = cohort_summary(get_file_digest(uploaded_file), artifacts.version, uploaded_file, artifacts)
+    except EndpointUnavailable:
+        st.markdown(
+            message_panel("<strong>Our risk model is temporarily unavailable.</strong> Please try again in a few minutes.", ERROR_PANEL),
+            unsafe_allow_html=True,
+        )
+        return
+    except ValueError as e:
+        # A file that cannot be read as the expected CSV; the message is about the upload itself
+        st.markdown(message_panel(f"<strong>Could not score the uploaded cohort:</strong> {html.escape(str(e))}", ERROR_PANEL), unsafe_allow_html=True)
+        return
+    except Exception:
+        logger.exception("Cohort summary failed")
+        st.markdown(message_panel("<strong>Could not score the uploaded cohort.</strong> Please try again.", ERROR_PANEL), unsafe_allow_html=True)
+        return
+
+    overall = summary.overall()
+    col1, col2, col3 = st.columns(3)
+    col1.metric("People", f"{overall['People']:,}")
+    col2.metric("Mean risk score", f"{overall['Mean risk score']:.3f}")
+    col3.metric("Predicted high risk", f"{overall['High-risk share']:.1%}")
+    if summary.skipped:
+        st.warning(f"{summary.skipped:,} rows with an empty or out-of-range answer were skipped and are not counted above.")
+
+    grouping = st.selectbox("Break down by", list(GROUPINGS))
+    table = summary.groups[grouping].table()
+    st.bar_chart(
+        {"Group": [row["Group"] for row in table], "High-risk share": [row["High-risk share"] for row in table]},
+        x="Group",
+        y="High-risk share",
+        sort=False,
+        color="#C45BAA",
+    )
+    st.dataframe(
+        table,
+        hide_index=True,
+        width="stretch",
+        column_config={
+            "People": st.column_config.NumberColumn(format="localized"),
+            "Mean risk score": st.column_config.NumberColumn(format="%.3f"),
+            "High-risk share": st.column_config.NumberColumn(format="percent"),
+        },
+    )
+    st.caption("Scores come from the same model as the Risk Assessment. They describe the cohort as a whole and are not a diagnosis for anyone in it.")
@@ -0,0 +1,536 @@
+import html
+import io
+import logging
+from typing import NamedTuple
+
+import numpy as np
+import streamlit as st
+
+from assets import load_asset
+from batch import BATCH_INPUT_COLUMNS, score_csv
+from explain import EXPLAIN_TIMEOUT_SECONDS, TOP_FACTORS, build_explainer
+from fragments import ERROR_PANEL, message_panel
+from inference import InferenceContext
+from invocation import EndpointUnavailable
+from lookups import EDUCATION_CODES, EDUCATION_LEVELS, INFANT_SEXES, MONTH_CODES, MONTHS, RACE_CODES, RACES, YES_NO
+from metrics import span
+from predictors import CachedPredictor, build_predictor
+from scoring_log import SCORING_LOG, ScoringLog
+from speculation import SPECULATIVE_SCORING, SpeculativePredictor
+from warmup import WARM_UP, WARMUP_POLL_SECONDS
+from whatif import sensitivity_table
+
+logger = logging.getLogger(__name__)
+
+
+LOW_RISK_MESSAGE = (
+    "We are pleased to inform you that our predictive model indicates a <strong>LOW likelihood of stillbirth</strong> "
+    "based on the information you provided. While this is encouraging, ongoing prenatal care remains essential for "
+    "ensuring a healthy pregnancy.<br><br>"
+    "<strong>Recommendations for Continued Care:</strong><br>"
+    "- <strong>Attend Regular Check-ups</strong>: Keep all scheduled appointments to monitor your pregnancy.<br>"
+    "- <strong>Monitor Signs and Symptoms</strong>: Stay attentive to your body and your baby’s movements, and report "
+    "any concerns to your healthcare provider.<br>"
+    "- <strong>Maintain a Healthy Lifestyle</strong>: Follow medical advice on nutrition, exercise, and stress management.<br><br>"
+    "For additional information, visit our <em>Tips for Success</em> section on our website. It provides valuable insights "
+    "to help you maintain a healthy pregnancy.<br><br>"
+    "Thank you for your commitment to your health and your baby’s well-being. If you have any concerns, please reach out to your "
+    "healthcare provider. Wishing you a smooth and healthy pregnancy!"
+)
+
+HIGH_RISK_MESSAGE = (
+    "We regret to inform you that our model has identified a <strong>potential HIGH risk for stillbirth</strong> based on the "
+    "information you provided. This is not a guarantee of stillbirth but an indication that further medical evaluation is "
+    "crucial. We strongly recommend scheduling an appointment with your healthcare provider immediately to discuss these results "
+    "and determine the best course of action.<br><br>"
+    "<strong>Immediate Steps to Take:</strong><br>"
+    "- <strong>Consult a Healthcare Provider</strong>: Schedule an appointment as soon as possible.<br>"
+    "- <strong>Monitor Symptoms</strong>: Pay close attention to changes in symptoms or fetal movements and report them promptly.<br>"
+    "- <strong>Seek Support</strong>: Reach out to loved ones or support groups during this challenging time.<br>"
+    "- <strong>Maintain a Healthy Lifestyle</strong>: Focus on a balanced diet, appropriate physical activity, and stress management.<br><br>"
+    "For additional guidance, please visit our <em>Tips for Success</em> section on our website, where you’ll find helpful strategies "
+    "and resources.<br><br>"
+    "Your health and your baby’s well-being are our utmost priority. With timely intervention, the risk can often be mitigated. Wishing you "
+    "strength and support during this time."
+)
+
+# Result panels for each risk message, built once per process so the browser can cache them
+RISK_PANELS = {
+    message: message_panel(f"<strong>Risk Assessment: </strong>{message}")
+    for message in (LOW_RISK_MESSAGE, HIGH_RISK_MESSAGE)
+}
+
+
+@st.cache_resource
+def get_inference_context():
+    """
+    Returns the inference context shared by all sessions in this process.
+    Built once on first use; later reruns reuse the same registry and client.
+    """
+    return InferenceContext()
+
+@st.cache_resource
+def get_scoring_log():
+    """
+    Returns the scoring log shared by all sessions in this process, or None
+    when STILLSAFE_SCORING_LOG is off.
+    """
+    return ScoringLog() if SCORING_LOG else None
+
+def get_feature_state(artifacts):
+    """
+    Returns this session's incremental feature row, starting a fresh one if
+    there is none yet or it was built for another artifact version.
+    """
+    state = st.session_state.get("risk_features")
+    if state is None or state.graph is not artifacts.graph:
+        state = st.session_state["risk_features"] = artifacts.graph.state()
+    return state
+
+@st.cache_resource(max_entries=2, on_release=lambda predictor: predictor.close())
+def build_versioned_predictor(version, _artifacts):
+    """
+    Builds the scoring backend for one artifact version. The previous version's
+    stays cached so requests that started on it finish on it; older ones are
+    closed when evicted, which stops their coalescing threads.
+    """
+    return build_predictor(get_inference_context(), artifacts=_artifacts)
+
+
+def get_predictor(artifacts):
+    """
+    Returns the scoring backend chosen by STILLSAFE_PREDICTOR for an artifact version, shared across sessions.
+    """
+    return build_versioned_predictor(artifacts.version, artifacts)
+
+
+@st.cache_resource(max_entries=2)
+def build_versioned_explainer(version, _artifacts):
+    """
+    Loads the explainer for one artifact version, or None when explanations are
+    unavailable. Kept for two versions, like the predictor.
+    """
+    return build_explainer(_artifacts)
+
+
+def start_explanation(features, artifacts):
+    """
+    Starts explaining a prediction on a worker thread, so it overlaps the endpoint call.
+
+    Parameters:
+        features (np.ndarray): A (1, n_features) array of scaled features.
+        artifacts (ArtifactVersion): The version the features were scaled with.
+
+    Returns:
+        Future: Resolves to (question, contribution) pairs, largest effect
+            first, or None when explanations are unavailable.
+    """
+    explainer = build_versioned_explainer(artifacts.version, artifacts)
+    return None if explainer is None else explainer.submit(features)
+
+
+def render_explanation(explanation):
+    """
+    Lists the questions that moved the risk score most, and in which direction.
+    """
+    st.markdown("**Which answers influenced this result the most**")
+    st.markdown("\n".join(
+        f"- **{question}**: {'raised' if contribution > 0 else 'lowered'} the estimated risk"
+        for question, contribution in explanation
+    ))
+    st.caption(
+        "Compared with the average pregnancy the model was trained on. These are the model's reasons, "
+        "not medical causes; please discuss any concerns with your healthcare provider."
+    )
+
+
+def get_uncached_predictor(artifacts):
+    """
+    Returns the shared predictor without the prediction cache in front of it,
+    for calls that should not go through or fill the cache: the warm-up canary,
+    batch uploads and whole-cohort scoring, whose rows rarely repeat.
+    """
+    predictor = get_predictor(artifacts)
+    return predictor.predictor if isinstance(predictor, CachedPredictor) else predictor
+
+
+def get_session_predictor(artifacts):
+    """
+    Returns the predictor Submit uses: the shared one, or this session's
+    speculative front to it when STILLSAFE_SPECULATIVE is on.
+    """
+    predictor = get_predictor(artifacts)
+    if not SPECULATIVE_SCORING:
+        return predictor
+    speculator = st.session_state.get("risk_speculator")
+    if speculator is None or speculator.predictor is not predictor:
+        speculator = st.session_state["risk_speculator"] = SpeculativePredictor(predictor)
+    return speculator
+
+
+def predict_risk(features, predictor, scoring_log=None, artifacts=None):
+    """
+    Scores the preprocessed features with the configured predictor and returns the risk message.
+
+    Parameters:
+        features (np.ndarray): A (1, n_features) array of scaled features.
+        predictor (Predictor): The SageMaker or local scoring backend.
+        scoring_log (ScoringLog): Where to record the scored row, if logging is on.
+        artifacts (ArtifactVersion): The version the features were scaled with, for the log.
+
+    Returns:
+        str: The risk message.
+
+    Raises:
+        EndpointUnavailable: The SageMaker endpoint timed out, kept failing, or its circuit is open.
+    """
+    predictions_array = predictor.predict(features)
+    if scoring_log is not None:
+        scoring_log.record(features, predictions_array, artifacts)
+
+    # Round the predictions
+    rounded_predictions = np.round(predictions_array)
+
+    # Convert the rounded predictions into risk messages
+    return LOW_RISK_MESSAGE if rounded_predictions[0] == 0 else HIGH_RISK_MESSAGE
+
+# Helper functions
+def convert_month_to_number(month_name):
+    return MONTH_CODES.get(month_name)
+
+def convert_race_to_code(race_name):
+    return RACE_CODES[race_name]
+
+def convert_education_to_code(education_level):
+    return EDUCATION_CODES[education_level]
+
+def convert_sex_to_binary(sex):
+    return 1 if sex == "Male" else 0
+
+def convert_yes_no_to_binary(response):
+    return 1 if response == "Yes" else 0
+
+
+class RiskForm(NamedTuple):
+    """
+    Encoded answers from the Risk Assessment form, in the batch upload's column
+    order. These are the inputs of the feature graph.
+    """
+
+    Delivery_Month: int
+    Mothers_Age: int
+    Mothers_Race_Recode_31: int
+    Mothers_Education: int
+    Fathers_Age_Combined: int
+    Month_Prenatal_Care_Began: int
+    Weight_Pounds: float
+    Height_Inches: float
+    Diabetes_Prepregnancy: int
+    Gestational_Diabetes: int
+    PrePregnancy_Hypertension: int
+    Gestational_Hypertension: int
+    Hypertension_Eclampsia: int
+    Infertility_Treatment: int
+    Infant_Sex: int
+    WIC_Program: int
+    Cigarettes_During_Pregnancy: int
+    Cigarettes_Before_Pregnancy_Int: int
+    Total_Prior_Births: int
+    Last_Birth_Months: int
+
+
+# The form's default answers, scored at startup to warm up the inference path
+CANARY_FORM = RiskForm(
+    Delivery_Month=1,
+    Mothers_Age=30,
+    Mothers_Race_Recode_31=1,
+    Mothers_Education=1,
+    Fathers_Age_Combined=30,
+    Month_Prenatal_Care_Began=1,
+    Weight_Pounds=120.0,
+    Height_Inches=60.0,
+    Diabetes_Prepregnancy=0,
+    Gestational_Diabetes=0,
+    PrePregnancy_Hypertension=0,
+    Gestational_Hypertension=0,
+    Hypertension_Eclampsia=0,
+    Infertility_Treatment=0,
+    Infant_Sex=1,
+    WIC_Program=0,
+    Cigarettes_During_Pregnancy=0,
+    Cigarettes_Before_Pregnancy_Int=0,
+    Total_Prior_Births=0,
+    Last_Birth_Months=0,
+)
+
+
+def warm_up():
+    """
+    Loads the active artifacts, predictor and explainer and scores CANARY_FORM
+    through the same feature graph, predictor and message as Submit. The app
+    runs this once at server start (see warmup.py). The canary skips the
+    prediction cache, so it always reaches the backend, and is never logged.
+    """
+    with span("warmup_artifacts"):
+        artifacts = get_inference_context().artifacts
+        predictor = get_uncached_predictor(artifacts)
+        explainer = build_versioned_explainer(artifacts.version, artifacts)
+    state = artifacts.graph.state()
+    state.update(CANARY_FORM._asdict())
+    with span("warmup_canary"):
+        predict_risk(state.row(), predictor)
+        if explainer is not None:
+            explainer.explain(state.row())
+
+
+@st.fragment(run_every=WARMUP_POLL_SECONDS)
+def wait_for_warm_up():
+    """
+    Shown while Submit is disabled; reruns the page once the warm-up has finished.
+    """
+    if WARM_UP.ready:
+        st.rerun()
+    st.caption("Getting the risk model ready. Submit will be available in a moment.")
+
+
+def render():
+    # One artifact version for the whole rerun, even if a new one is activated meanwhile
+    artifacts = get_inference_context().artifacts
+
+    # Create a two-column layout for the logo and the title
+    col1, col2 = st.columns([1, 5])  # Adjust column widths as needed
+
+    # Logo in the left column
+    with col1:
+        st.image(load_asset("images/finallogoonly.jpg"), width=200)  # Adjust the width as necessary
+
+    # Title in the right column
+    with col2:
+        st.markdown("<h1 style='color:#C45BAA;'>Risk Assessment Tool</h1>", unsafe_allow_html=True)
+
+    st.write("Please provide the following information to receive a personalized pregnancy risk assessment.")
+
+    # User Inputs
+    delivery_month = st.selectbox("What month are you expecting to have your baby?", MONTHS)
+    delivery_month_num = convert_month_to_number(delivery_month)
+
+    mothers_age = st.slider("How old are you right now?", 0, 65, 30)
+
+    mothers_race = st.selectbox("What is your race?", RACES)
+    mothers_race_code = convert_race_to_code(mothers_race)
+
+    mothers_education = st.selectbox("What is your highest level of education?", EDUCATION_LEVELS)
+    mothers_education_code = convert_education_to_code(mothers_education)
+
+    fathers_age = st.slider("How old is the baby's father?", 0, 100, 30)
+
+    prenatal_care_month = st.slider("How many months along in your pregnancy were you when you had your first prenatal care visit? If you have yet to visit, at how many months do you expect to have your first prenatal care visit?", 1, 10)
+
+    # Prepregnancy Weight and Height Inputs (Side by Side)
+    col1, col2 = st.columns(2)
+    with col1:
+        weight_pounds = st.number_input("What was your pre-pregnancy weight in pounds?", min_value=50.0, max_value=500.0, step=0.1, value=120.0)
+    with col2:
+        height_inches = st.number_input("What was your pre-pregnancy height in inches?", min_value=48.0, max_value=96.0, step=0.1, value=60.0)
+
+    # Calculate BMI, reusing the last value unless weight or height moved
+    features = get_feature_state(artifacts)
+    features.update({"Weight_Pounds": weight_pounds, "Height_Inches": height_inches})
+    mothers_bmi = features.value("Mothers_PrePregnancy_BMI")
+    if mothers_bmi:
+        st.write(f"Your calculated pre-pregnancy BMI: {mothers_bmi:.2f}")
+
+    diabetes_prepregnancy = st.selectbox("Did you have diabetes pre-pregnancy?", YES_NO)
+    diabetes_prepregnancy_binary = convert_yes_no_to_binary(diabetes_prepregnancy)
+
+    gestational_diabetes = st.selectbox("Did you get gestational diabetes?", YES_NO)
+    gestational_diabetes_binary = convert_yes_no_to_binary(gestational_diabetes)
+
+    prep_hypertension = st.selectbox("Did you have pre-pregnancy hypertension?", YES_NO)
+    prep_hypertension_binary = convert_yes_no_to_binary(prep_hypertension)
+
+    gestational_hypertension = st.selectbox("Did you get gestational hypertension?", YES_NO)
+    gestational_hypertension_binary = convert_yes_no_to_binary(gestational_hypertension)
+
+    hypertension_eclampsia = st.selectbox("Do you have hypertension eclampsia?", YES_NO)
+    hypertension_eclampsia_binary = convert_yes_no_to_binary(hypertension_eclampsia)
+
+    infertility_treatment = st.selectbox("Have you undergone infertility treatment?", YES_NO)
+    infertility_treatment_binary = convert_yes_no_to_binary(infertility_treatment)
+
+    infant_sex = st.selectbox("What is the expected sex of your baby?", INFANT_SEXES)
+    infant_sex_binary = convert_sex_to_binary(infant_sex)
+
+    wic_program = st.selectbox("Are you participating in the WIC program? (Supplemental Nutrition Assistance)", YES_NO)
+    wic_program_binary = convert_yes_no_to_binary(wic_program)
+
+    cigarettes_during_pregnancy = st.selectbox("Have you been smoking cigarettes during your pregnancy?", YES_NO)
+    cigarettes_during_pregnancy_binary = convert_yes_no_to_binary(cigarettes_during_pregnancy)
+
+    cigarettes_before_pregnancy = st.selectbox("Did you smoke cigarettes before your pregnancy?", YES_NO)
+    cigarettes_before_pregnancy_binary = convert_yes_no_to_binary(cigarettes_before_pregnancy)
+
+    total_prior_births = st.slider("How many previous pregnancies have you had?", 0, 21, 0)
+
+    last_birth_months = st.slider("How many months has it been since your last pregnancy? Put 0 if you have not had any previous pregnancies.", 0, 320, 0)
+
+    form = RiskForm(
+        delivery_month_num,
+        mothers_age,
+        mothers_race_code,
+        mothers_education_code,
+        fathers_age,
+        prenatal_care_month,
+        weight_pounds,
+        height_inches,
+        diabetes_prepregnancy_binary,
+        gestational_diabetes_binary,
+        prep_hypertension_binary,
+        gestational_hypertension_binary,
+        hypertension_eclampsia_binary,
+        infertility_treatment_binary,
+        infant_sex_binary,
+        wic_program_binary,
+        cigarettes_during_pregnancy_binary,
+        cigarettes_before_pregnancy_binary,
+        total_prior_births,
+        last_birth_months,
+    )
+
+    # Only the features fed by answers that changed since the last rerun are recomputed and rescaled
+    features.update(form._asdict())
+    if SPECULATIVE_SCORING:
+        # Score in the background once the answers settle, so Submit can answer straight away
+        get_session_predictor(artifacts).schedule(features.row())
+
+    # Submit stays disabled until this server has warmed up the inference path
+    warming_up = not WARM_UP.ready
+    if warming_up:
+        wait_for_warm_up()
+
+    # Add logic to process inputs
+    if st.button("Submit", disabled=warming_up):
+        # Keep just the encoded answers for this session, not the full feature dictionary
+        st.session_state["risk_form"] = form
+
+        # Preprocess input data
+        with span("preprocess"):
+            preprocessed_data = features.row()
+
+        # Explain the row from the booster's tree paths while the endpoint scores it
+        try:
+            explanation_future = start_explanation(preprocessed_data, artifacts)
+        except Exception:
+            explanation_future = None
+
+        # Score the preprocessed data on a worker thread while the spinner shows
+        try:
+            with st.spinner("Assessing your risk..."):
+                with span("predict"):
+                    prediction = predict_risk(preprocessed_data, get_session_predictor(artifacts), get_scoring_log(), artifacts)
+        except EndpointUnavailable:
+            error_message = "Our risk model is temporarily unavailable. Please try again in a few minutes."
+            prediction = None
+        except Exception:
+            # The details can name the endpoint or echo the row; they go to the log, not the page
+            logger.exception("Risk assessment failed")
+            error_message = "Something went wrong while assessing your risk. Please try again."
+            prediction = None
+
+        # An explanation is never worth failing or delaying the result over
+        explanation = None
+        if explanation_future is not None:
+            try:
+                if prediction is not None:
+                    explanation = explanation_future.result(timeout=EXPLAIN_TIMEOUT_SECONDS)[:TOP_FACTORS]
+            except Exception:
+                pass
+            # Drops an explanation still queued behind slower ones; no effect once it has run
+            explanation_future.cancel()
+
+        # Display prediction
+        with span("render"):
+            if prediction is not None:
+                st.markdown(RISK_PANELS[prediction], unsafe_allow_html=True)
+                if explanation:
+                    render_explanation(explanation)
+            else:
+                st.markdown(
+                    message_panel(f"<strong>We could not complete your assessment.</strong> {error_message}", ERROR_PANEL),
+                    unsafe_allow_html=True,
+                )
+
+    # What-if sensitivity, around the answers last submitted in this session
+    submitted_form = st.session_state.get("risk_form")
+    if submitted_form is not None:
+        st.markdown("---")
+        st.markdown("<h3 style='color:#C45BAA;'>What If?</h3>", unsafe_allow_html=True)
+        st.write(
+            "See how the assessment would change with one answer different: without each risk factor, "
+            "at another age or BMI, or with prenatal care starting in a different month. All scenarios are scored together."
+        )
+        if st.button("Explore What-If Scenarios"):
+            try:
+                with st.spinner("Scoring scenarios..."):
+                    table = sensitivity_table(submitted_form._asdict(), artifacts.graph, get_predictor(artifacts))
+                st.dataframe(
+                    table,
+                    hide_index=True,
+                    width="stretch",
+                    column_config={
+                        "Risk score": st.column_config.NumberColumn(format="%.3f"),
+                        "Difference": st.column_config.NumberColumn(format="%+.3f"),
+                    },
+                )
+            except EndpointUnavailable:
+                st.warning("Our risk model is temporarily unavailable. Please try again in a few minutes.")
+            except Exception:
+                logger.exception("What-if scoring failed")
+                st.warning("Something went wrong while scoring the scenarios. Please try again.")
+
+    # Batch Risk Assessment
+    st.markdown("---")
+    st.markdown("<h3 style='color:#C45BAA;'>Batch Risk Assessment</h3>", unsafe_allow_html=True)
+    st.write(
+        "Screening a whole panel of patients? Upload a CSV with one row per patient and the columns below, "
+        "encoded the same way as the form above (codes for race and education, 1/0 for Yes/No, 1 for a male baby): "
+        + ", ".join(f"`{col}`" for col in BATCH_INPUT_COLUMNS)
+        + ". Rows with an empty or out-of-range answer are not scored and are marked in the results."
+    )
+    uploaded_file = st.file_uploader("Patient CSV", type="csv")
+    if uploaded_file is not None and st.button("Score File"):
+        status = st.empty()
+        # The upload is read and scored a chunk at a time, but st.download_button
+        # needs the whole result in memory, so it is built in memory
+        results = io.StringIO()
+        rows = not_scored = 0
+        try:
+            for rows, not_scored in score_csv(uploaded_file, results, artifacts.graph, get_uncached_predictor(artifacts)):
+                status.write(f"Scored {rows - not_scored:,} patients...")
+            summary = f"Scored {rows - not_scored:,} patients."
+            if not_scored:
+                summary += f" {not_scored:,} rows had missing or out-of-range answers and were not scored; see their Problems column."
+            status.write(summary)
+            st.download_button(
+                "Download Results",
+                results.getvalue(),
+                file_name="stillsafe_batch_results.csv",
+                mime="text/csv",
+                on_click="ignore",
+            )
+        except ValueError as e:
+            # A file that cannot be read as the expected CSV; the message is about the upload itself
+            status.empty()
+            st.markdown(message_panel(f"<strong>Could not score the uploaded file:</strong> {html.escape(str(e))}", ERROR_PANEL), unsafe_allow_html=True)
+        except Exception:
+            logger.exception("Batch risk assessment failed")
+            status.empty()
+            st.markdown(message_panel("<strong>Could not score the uploaded file.</strong> Please try again.", ERROR_PANEL), unsafe_allow_html=True)
+
+    st.markdown("---")
+    st.markdown("<h3 style='color:#C45BAA;'>Disclaimer</h3>", unsafe_allow_html=True)
+    st.write("""
+    The **StillSafe Risk Assessment Tool** is designed by data science students and professionals to offer data-driven insights. 
+    However, it is not intended to replace medical advice, diagnosis, or treatment. For any concerns about your pregnancy or health, always consult a qualified healthcare provider. 
+    Your health and well-being are our top priority.
+    """)
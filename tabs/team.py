@@ -0,0 +1,54 @@
+import streamlit as st
+
+from assets import load_asset
+
+# Team Members with Photos and Emails, shared by every session
+TEAM_MEMBERS = (
+    {"name": "Jonah Grossman", "role": "Project Manager, Head Developer, MLE & Master in Information and Data Science at UC Berkeley", "email": "jonahgrossman0@berkeley.edu", "photo": "images/jonahfinal.jpg"},
+    {"name": "Joshua Shin", "role": "MLE & Master in Information and Data Science at UC Berkeley", "email": "joony9191@berkeley.edu", "photo": "images/joshfinal.jpg"},
+    {"name": "Millie Kobayashi", "role": "Data Scientist, MLE & Master in Information and Data Science at UC Berkeley", "email": "milliek@berkeley.edu", "photo": "images/milliefinal.jpg"},
+    {"name": "Kelechi Nnebedum", "role": "Data Scientist & Master in Information and Data Science at UC Berkeley", "email": "knnebedum@berkeley.edu", "photo": "images/kelechifinal.jpg"},
+    {"name": "Adithi Suresh", "role": "Developer, Designer & Master in Information and Data Science at UC Berkeley", "email": "adithi_suresh@berkeley.edu", "photo": "images/adithifinal.jpg"},
+    {"name": "Nikita Chauhan", "role": "Data Scientist, Designer & Master in Information and Data Science at UC Berkeley", "email": "nikitac@berkeley.edu", "photo": "images/nikitafinal.jpg"},
+)
+
+# Name, role and email of each member as one Markdown fragment, built once per process so the browser can cache it
+MEMBER_FRAGMENTS = tuple(
+    f"### {member['name']}\n\n**{member['role']}**\n\n📧 **Email:** [{member['email']}](mailto:{member['email']})"
+    for member in TEAM_MEMBERS
+)
+
+
+def render():
+    # Create a two-column layout for the logo and the title
+    col1, col2 = st.columns([1, 5])  # Adjust column widths as needed
+
+    # Logo in the left column
+    with col1:
+        st.image(load_asset("images/finallogoonly.jpg"), width=200)  # Adjust the width as necessary
+
+    # Title in the right column
+    with col2:
+        st.markdown("<h1 style='color:#C45BAA;'>Meet Our Team</h1>", unsafe_allow_html=True)
+    st.write("At **StillSafe**, we’re a team of Master’s students from UC Berkeley, studying Information and Data Science, brought together by a shared passion for supporting moms-to-be and their little ones. We’re dedicated to using technology in a thoughtful, caring way to create tools that truly make a difference. With our hearts in the right place and our skills at work, we’re here to help make every pregnancy journey safer, more supported, and filled with confidence.")
+    
+    # Display each team member with photo, role, and email
+    for member, fragment in zip(TEAM_MEMBERS, MEMBER_FRAGMENTS):
+        col1, col2 = st.columns([1, 4])  # Define column layout
+        with col1:
+            try:
+                st.image(load_asset(member["photo"]), use_container_width=True)  # Load the image
+            except Exception as e:
+                st.warning(f"Could not load image for {member['name']}. Make sure the file exists at '{member['photo']}'.")
+        with col2:
+            st.markdown(fragment)
+
+    st.markdown("---")
+    st.markdown("<h3 style='color:#C45BAA;'>Contact Us</h3>", unsafe_allow_html=True)
+    st.write("""
+    **Have a question, concern, or just curious to learn more? We’re here to help! Reach out to our friendly team anytime – we’d love to hear from you.**
+
+    📧 **Email:** jonahgrossman0@berkeley.edu  
+
+    📞 **Phone:** (818) 312-3752  
+""")
@@ -0,0 +1,132 @@
+import streamlit as st
+
+from assets import load_asset
+from fragments import compact_html
+
+# Each tip's photo, heading and text
+TIPS = (
+    # Tip 1: Prenatal Checkups
+    (
+        "images/checkupsfinal.jpg",
+        "Schedule Regular Prenatal Checkups",
+        (
+            "Work closely with your healthcare provider to ensure everything is on track and to address any questions or concerns along the way. "
+            "They’re your trusted partner in this journey, so never hesitate to share how you’re feeling—they’re here to support both you and your baby!"
+        ),
+    ),
+    # Tip 2: Balanced Diet
+    (
+        "images/dietfinal.jpg",
+        "Nourish Your Body with a Balanced Diet",
+        (
+            "Eating well during pregnancy is one of the best gifts you can give yourself and your baby. "
+            "Focus on nutrient-rich foods, including fresh fruits, vegetables, whole grains, lean proteins, and dairy. "
+            "Treat yourself to wholesome, nourishing meals—it’s a small step with a big impact on you and your little one’s health!"
+        ),
+    ),
+    # Tip 3: Physical Activity
+    (
+        "images/exercisefinal.jpg",
+        "Engage in Safe Physical Activity",
+        (
+            "Staying active during pregnancy can boost your energy, improve your mood, and promote better sleep. "
+            "Try gentle exercises like walking, prenatal yoga, swimming, or low-impact aerobics—just make sure to get the green light from your healthcare provider. "
+            "These activities not only support your physical health but also help you stay mentally balanced and prepared for the journey ahead!"
+        ),
+    ),
+    # Tip 4: Avoid Harmful Substances
+    (
+        "images/avoid_harmfulfinal.jpg",
+        "Avoid Harmful Substances",
+        (
+            "Keeping your baby’s development safe and sound starts with making healthy choices for yourself. "
+            "Try to minimize caffeine, and be sure to steer clear of alcohol, tobacco, and recreational drugs to give your little one the best possible start. "
+            "Remember, every small step you take toward a healthier lifestyle is a big step for your baby’s well-being!"
+        ),
+    ),
+    # Tip 5: Stay Hydrated
+    (
+        "images/hydrationfinal.jpg",
+        "Stay Hydrated",
+        (
+            "Keeping hydrated is one of the simplest and most effective ways to care for yourself and your baby during pregnancy. "
+            "Aim to drink plenty of water throughout the day to support your body’s increased demands, maintain healthy circulation, "
+            "and reduce the risk of common pregnancy discomforts like swelling and constipation. "
+            "Carry a water bottle with you as a reminder, and consider adding slices of lemon, cucumber, or fresh fruit for a refreshing twist!"
+        ),
+    ),
+    # Tip 6: Rest and Relaxation
+    (
+        "images/relaxationfinal.jpg",
+        "Prioritize Rest and Relaxation",
+        (
+            "Your body is working hard to support your baby, so getting 7-9 hours of quality sleep each night is essential. "
+            "Create a cozy bedtime routine, and try relaxation techniques like mindfulness, light stretching, or a calming cup of herbal tea to unwind. "
+            "Resting well helps you recharge and prepare for the exciting journey ahead!"
+        ),
+    ),
+    # Tip 7: Empower with Knowledge
+    (
+        "images/knowledgefinal.jpg",
+        "Empower Yourself with Knowledge",
+        (
+            "Knowledge is power, especially when it comes to your pregnancy journey! "
+            "Explore trusted resources for accurate, up-to-date information, and don’t hesitate to ask your healthcare provider any questions you have—they’re there to guide you. "
+            "The more you know, the more confident and prepared you’ll feel as you await your baby’s arrival!"
+        ),
+    ),
+    # Tip 8: Support System
+    (
+        "images/supportfinal.jpg",
+        "Create Your Circle of Support",
+        (
+            "Surround yourself with loving family, friends, or a community of other parents-to-be. "
+            "Having a strong support network can uplift your spirits and offer the encouragement you need as you prepare for your baby’s arrival."
+        ),
+    ),
+    # Tip 9: Baby’s Big Day
+    (
+        "images/baby_dayfinal.jpg",
+        "Prepare for Your Baby’s Big Day",
+        (
+            "Get ready for your little one’s arrival by chatting with your healthcare provider about your birth plan. "
+            "Take some time to explore your hospital or birthing center's procedures, and don’t forget to pack a bag with all the essentials for labor and postpartum recovery—it’s one step closer to meeting your baby!"
+        ),
+    ),
+    # Tip 10: Monitor Your Health
+    (
+        "images/health_monitoringfinal.jpg",
+        "Keep an Eye on Your Health",
+        (
+            "Listen to your body and reach out to your healthcare provider if you notice anything unusual, like persistent headaches, swelling, or changes in your baby’s movements. "
+            "Catching concerns early can help ensure a smoother, healthier journey for you and your little one."
+        ),
+    ),
+)
+
+# Heading and text of each tip as one HTML fragment, built once per process so the browser can cache it
+TIP_FRAGMENTS = tuple(
+    (photo, compact_html(f"<h3 style='color:#C45BAA;'>{title}</h3>{text}"))
+    for photo, title, text in TIPS
+)
+
+
+def render():
+    # Create a two-column layout for the logo and the title
+    col1, col2 = st.columns([1, 5])  # Adjust column widths as needed
+
+    # Logo in the left column
+    with col1:
+        st.image(load_asset("images/finallogoonly.jpg"), width=200)  # Adjust the width as necessary
+
+    # Title in the right column
+    with col2:
+        st.markdown("<h1 style='color:#C45BAA;'>StillSafe Tips for Success</h1>", unsafe_allow_html=True)
+    st.title("StillSafe: Your Guide to a Safe and Healthy Pregnancy")
+
+    for photo, fragment in TIP_FRAGMENTS:
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            st.image(load_asset(photo), use_container_width=True)
+        with col2:
+            st.markdown(fragment, unsafe_allow_html=True)
@@ -0,0 +1,12 @@
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The stubbed AWS clients in benchmarks/fakes.py are shared with the tests
+for path in (REPO_ROOT, os.path.join(REPO_ROOT, "benchmarks")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+# No background warm-up: it would call AWS outside the tests' stubs
+os.environ.setdefault("STILLSAFE_WARMUP", "0")
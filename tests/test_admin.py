@@ -0,0 +1,22 @@
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from test_inference import APP_PATH
+
+
+def shows_admin_page(monkeypatch, token):
+    monkeypatch.setenv("STILLSAFE_ADMIN_TOKEN", "s3cret")
+    at = AppTest.from_file(APP_PATH, default_timeout=30)
+    at.query_params["admin"] = token
+    at.run()
+    assert not at.exception
+    return any("Latency Metrics" in element.value for element in at.markdown)
+
+
+def test_matching_token_shows_the_admin_page(monkeypatch):
+    assert shows_admin_page(monkeypatch, "s3cret")
+
+
+@pytest.mark.parametrize("token", ["wrong", "", "é", "s3cr€t"])
+def test_other_tokens_show_the_app(monkeypatch, token):
+    assert not shows_admin_page(monkeypatch, token)
@@ -0,0 +1,86 @@
+import io
+
+import numpy as np
+import pytest
+
+from batch import BATCH_INPUT_COLUMNS, NOT_SCORED, score_csv
+from registry import ArtifactRegistry
+
+VALID_ROW = {
+    "Delivery_Month": 3, "Mothers_Age": 30, "Mothers_Race_Recode_31": 1, "Mothers_Education": 4,
+    "Fathers_Age_Combined": 32, "Month_Prenatal_Care_Began": 2, "Weight_Pounds": 140.5, "Height_Inches": 64,
+    "Diabetes_Prepregnancy": 0, "Gestational_Diabetes": 0, "PrePregnancy_Hypertension": 0,
+    "Gestational_Hypertension": 1, "Hypertension_Eclampsia": 0, "Infertility_Treatment": 0, "Infant_Sex": 1,
+    "WIC_Program": 0, "Cigarettes_During_Pregnancy": 0, "Cigarettes_Before_Pregnancy_Int": 0,
+    "Total_Prior_Births": 1, "Last_Birth_Months": 40,
+}
+
+
+class RecordingPredictor:
+    model_id = "recording"
+
+    def __init__(self):
+        self.rows = 0
+
+    def predict(self, rows):
+        self.rows += len(rows)
+        return np.full(len(rows), 0.8)
+
+
+@pytest.fixture(scope="module")
+def graph():
+    return ArtifactRegistry().current().graph
+
+
+def score(graph, rows):
+    import pandas as pd
+
+    source = io.StringIO(pd.DataFrame(rows, columns=BATCH_INPUT_COLUMNS).to_csv(index=False))
+    output = io.StringIO()
+    predictor = RecordingPredictor()
+    counts = list(score_csv(source, output, graph, predictor))
+    output.seek(0)
+    return pd.read_csv(output, keep_default_na=False), counts[-1], predictor
+
+
+def test_valid_rows_are_scored(graph):
+    results, (rows, not_scored), predictor = score(graph, [VALID_ROW, VALID_ROW])
+    assert (rows, not_scored, predictor.rows) == (2, 0, 2)
+    assert list(results["Risk_Level"]) == ["HIGH", "HIGH"]
+    assert list(results["Problems"]) == ["", ""]
+
+
+@pytest.mark.parametrize(
+    "column, value",
+    [
+        ("Last_Birth_Months", None),
+        ("Weight_Pounds", None),
+        ("Total_Prior_Births", None),
+        ("Height_Inches", 0),
+        ("Mothers_Race_Recode_31", 40),
+        ("Mothers_Education", 2.5),
+        ("Diabetes_Prepregnancy", 2),
+        ("Mothers_Age", "thirty"),
+    ],
+)
+def test_rows_with_missing_or_out_of_range_answers_are_not_scored(graph, column, value):
+    bad = dict(VALID_ROW, **{column: value})
+    results, (rows, not_scored), predictor = score(graph, [VALID_ROW, bad])
+    assert (rows, not_scored, predictor.rows) == (2, 1, 1)
+    assert results["Risk_Level"][1] == NOT_SCORED
+    assert results["Risk_Score"][1] == ""
+    assert column in results["Problems"][1]
+    assert results["Risk_Level"][0] == "HIGH"
+
+
+def test_file_with_only_invalid_rows_makes_no_predictor_call(graph):
+    results, (rows, not_scored), predictor = score(graph, [dict(VALID_ROW, Weight_Pounds=None)])
+    assert (rows, not_scored, predictor.rows) == (1, 1, 0)
+
+
+def test_missing_column_is_rejected(graph):
+    import pandas as pd
+
+    source = io.StringIO(pd.DataFrame([VALID_ROW]).drop(columns="WIC_Program").to_csv(index=False))
+    with pytest.raises(ValueError, match="WIC_Program"):
+        list(score_csv(source, io.StringIO(), graph, RecordingPredictor()))
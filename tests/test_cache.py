@@ -0,0 +1,45 @@
+import numpy as np
+
+from cache import TTLCache
+from fakes import patch_boto3
+from inference import InferenceContext
+from metrics import MetricsRegistry, REGISTRY
+from predictors import build_predictor
+
+
+def scaled_row(value):
+    return np.full((1, 25), value, dtype=np.float64)
+
+
+def test_repeated_input_is_not_sent_to_the_endpoint_again():
+    with patch_boto3(latency=0) as counter:
+        predictor = build_predictor(InferenceContext(), backend="sagemaker")
+        first = predictor.predict(scaled_row(0.5))
+        second = predictor.predict(scaled_row(0.5))
+        assert counter["invoke_calls"] == 1
+        np.testing.assert_array_equal(first, second)
+
+        predictor.predict(scaled_row(0.25))
+        assert counter["invoke_calls"] == 2
+
+    stats = REGISTRY.caches["prediction"].stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["size"] == 2
+
+
+def test_prometheus_text_reports_cache_counters():
+    registry = MetricsRegistry()
+    cache = TTLCache(1, 3600)
+    registry.register_cache("prediction", cache)
+    cache.put("a", 1)
+    cache.get("a")
+    cache.get("b")
+    cache.put("b", 2)
+
+    text = registry.prometheus_text()
+    assert 'stillsafe_cache_entries{cache="prediction"} 1' in text
+    assert 'stillsafe_cache_hits_total{cache="prediction"} 1' in text
+    assert 'stillsafe_cache_misses_total{cache="prediction"} 1' in text
+    assert 'stillsafe_cache_evictions_total{cache="prediction"} 1' in text
+    assert registry.cache_summary()[0]["hit_rate"] == 0.5
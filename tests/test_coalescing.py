@@ -0,0 +1,160 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import predictors
+import scoring_service
+from predictors import CoalescingPredictor, Predictor
+
+
+class RecordingPredictor(Predictor):
+    """
+    Scores each row with its first value and records the size of every call.
+    """
+
+    model_id = "recording"
+
+    def __init__(self, error=None):
+        self.error = error
+        self.calls = []
+        self.closed = False
+
+    def predict(self, rows):
+        self.calls.append(len(rows))
+        if self.error is not None:
+            raise self.error
+        return np.asarray(rows)[:, 0].astype(np.float64)
+
+    def close(self):
+        self.closed = True
+
+
+def predict_concurrently(predictor, requests):
+    """
+    Sends each request from its own thread at once; returns their results or exceptions.
+    """
+    results = [None] * len(requests)
+    barrier = threading.Barrier(len(requests))
+
+    def send(i):
+        barrier.wait()
+        try:
+            results[i] = predictor.predict(requests[i])
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=send, args=(i,)) for i in range(len(requests))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    return results
+
+
+@pytest.fixture
+def coalescer():
+    created = []
+
+    def make(inner, **kwargs):
+        created.append(CoalescingPredictor(inner, **kwargs))
+        return created[-1]
+
+    yield make
+    for predictor in created:
+        predictor.close()
+
+
+def test_each_caller_gets_the_scores_of_its_own_rows(coalescer):
+    inner = RecordingPredictor()
+    predictor = coalescer(inner, window=0.2, max_rows=64)
+    requests = [np.full((1 + i % 3, 4), float(i)) for i in range(8)]
+
+    results = predict_concurrently(predictor, requests)
+    for i, (request, result) in enumerate(zip(requests, results)):
+        np.testing.assert_array_equal(result, np.full(len(request), float(i)))
+    assert len(inner.calls) < len(requests)
+    assert sum(inner.calls) == sum(len(request) for request in requests)
+
+
+def test_batch_is_sent_when_the_window_ends(coalescer):
+    inner = RecordingPredictor()
+    predictor = coalescer(inner, window=0.1, max_rows=64)
+    start = time.perf_counter()
+    np.testing.assert_array_equal(predictor.predict(np.full((1, 4), 7.0)), [7.0])
+    assert 0.1 <= time.perf_counter() - start < 2
+    assert inner.calls == [1]
+
+
+def test_batch_is_sent_as_soon_as_it_is_full(coalescer):
+    inner = RecordingPredictor()
+    predictor = coalescer(inner, window=30, max_rows=4)
+    start = time.perf_counter()
+    results = predict_concurrently(predictor, [np.full((1, 4), float(i)) for i in range(4)])
+    assert time.perf_counter() - start < 5
+    assert [float(result[0]) for result in results] == [0.0, 1.0, 2.0, 3.0]
+    assert inner.calls == [4]
+
+
+def test_large_request_goes_straight_through(coalescer):
+    inner = RecordingPredictor()
+    predictor = coalescer(inner, window=30, max_rows=4)
+    assert len(predictor.predict(np.zeros((4, 4)))) == 4
+    assert inner.calls == [4]
+
+
+def test_error_reaches_every_caller_in_the_batch(coalescer):
+    error = RuntimeError("endpoint failed")
+    inner = RecordingPredictor(error=error)
+    predictor = coalescer(inner, window=0.2, max_rows=64)
+    results = predict_concurrently(predictor, [np.zeros((1, 4)) for _ in range(5)])
+    assert all(result is error for result in results)
+
+
+def test_close_stops_the_threads_and_later_calls_go_straight_through():
+    inner = RecordingPredictor()
+    predictor = CoalescingPredictor(inner, window=0.05, max_rows=64)
+    predictor.predict(np.zeros((1, 4)))
+    predictor.close()
+    assert not predictor._thread.is_alive()
+    assert predictor._executor._shutdown
+    assert inner.closed
+
+    np.testing.assert_array_equal(predictor.predict(np.full((2, 4), 3.0)), [3.0, 3.0])
+    assert inner.calls == [1, 2]
+
+
+def test_scoring_service_closes_evicted_predictors(monkeypatch):
+    built = []
+
+    def build_predictor(context, artifacts):
+        built.append(RecordingPredictor())
+        return built[-1]
+
+    monkeypatch.setattr(predictors, "build_predictor", build_predictor)
+    monkeypatch.setattr(scoring_service, "_predictors", {})
+    for version in ("v1", "v2", "v3"):
+        scoring_service._predictor_for(SimpleNamespace(version=version))
+    assert [predictor.closed for predictor in built] == [True, False, False]
+
+
+def test_app_closes_predictors_of_evicted_versions(monkeypatch):
+    import streamlit as st
+
+    import tabs.risk_assessment as risk_assessment
+
+    built = []
+
+    def build_predictor(context, artifacts):
+        built.append(RecordingPredictor())
+        return built[-1]
+
+    st.cache_resource.clear()
+    monkeypatch.setattr(risk_assessment, "get_inference_context", lambda: None)
+    monkeypatch.setattr(risk_assessment, "build_predictor", build_predictor)
+    for version in ("v1", "v2", "v3"):
+        risk_assessment.build_versioned_predictor(version, SimpleNamespace(version=version))
+    assert [predictor.closed for predictor in built] == [True, False, False]
+    st.cache_resource.clear()
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from _common import random_inputs
+from explain import NO_RISK_FACTORS, QUESTION_LABELS, Explainer
+from features import RISK_FACTOR_COLUMNS
+from registry import ArtifactRegistry
+from whatif import RISK_FACTOR_LABELS
+
+PIPELINE = ArtifactRegistry().current().pipeline
+FEATURE_NAMES = PIPELINE.feature_names
+RISK_SUM = FEATURE_NAMES.index("Risk_Sum")
+
+
+def scaled_forms(n, seed):
+    raw = random_inputs(n, seed)
+    # More "Yes" answers than real forms have, so every case comes up
+    factors = [FEATURE_NAMES.index(name) for name in RISK_FACTOR_COLUMNS]
+    raw[:, factors] = np.random.default_rng(seed).random((n, len(factors))) < 0.2
+    raw[:, RISK_SUM] = raw[:, factors].sum(axis=1)
+    return raw, PIPELINE.transform(raw)
+
+
+@pytest.fixture(scope="module")
+def booster():
+    import xgboost as xgb
+
+    raw, rows = scaled_forms(2_000, 0)
+    labels = (raw[:, RISK_SUM] + np.random.default_rng(0).normal(size=2_000) > 1).astype(int)
+    return xgb.train({"objective": "binary:logistic", "max_depth": 4, "nthread": 1}, xgb.DMatrix(rows, labels), num_boost_round=20)
+
+
+@pytest.fixture(scope="module")
+def explainer(booster):
+    return Explainer(booster, PIPELINE, workers=1)
+
+
+def contributions(booster, rows):
+    import xgboost as xgb
+
+    matrix = xgb.DMatrix(rows.astype(np.float32))
+    return booster.predict(matrix, pred_contribs=True), booster.predict(matrix, output_margin=True)
+
+
+def test_every_question_is_a_form_question(explainer):
+    assert set(explainer.questions) == set(QUESTION_LABELS.values())
+    assert "Risk_Sum" not in QUESTION_LABELS
+
+
+def test_risk_sum_is_shared_by_the_factors_answered_yes(booster, explainer):
+    raw, rows = scaled_forms(50, 1)
+    all_contributions, margins = contributions(booster, rows)
+    assert 0 < (raw[:, RISK_SUM] == 0).sum() < len(rows)
+
+    for answers, row, contribution, margin in zip(raw, rows, all_contributions, margins):
+        explanation = dict(explainer.explain(row[np.newaxis]))
+        n_yes = answers[RISK_SUM]
+        for name in RISK_FACTOR_COLUMNS:
+            expected = contribution[FEATURE_NAMES.index(name)]
+            if answers[FEATURE_NAMES.index(name)] == 1:
+                expected += contribution[RISK_SUM] / n_yes
+            assert explanation[RISK_FACTOR_LABELS[name]] == pytest.approx(expected, abs=1e-5)
+        assert explanation.get(NO_RISK_FACTORS, 0.0) == pytest.approx(contribution[RISK_SUM] if n_yes == 0 else 0.0, abs=1e-6)
+        # Still adds up to the row's log-odds with the bias term
+        assert sum(explanation.values()) + contribution[-1] == pytest.approx(margin, abs=1e-4)
+
+
+def test_no_answer_gets_no_share_of_risk_sum(booster, explainer):
+    raw = random_inputs(1, 2)
+    factors = [FEATURE_NAMES.index(name) for name in RISK_FACTOR_COLUMNS]
+    raw[:, factors] = 0
+    raw[0, FEATURE_NAMES.index("Gestational_Diabetes")] = 1
+    raw[:, RISK_SUM] = 1
+    row = PIPELINE.transform(raw)
+    (contribution,), _ = contributions(booster, row)
+    assert contribution[RISK_SUM] != 0
+
+    explanation = dict(explainer.explain(row))
+    assert explanation[RISK_FACTOR_LABELS["Gestational_Diabetes"]] == pytest.approx(
+        contribution[FEATURE_NAMES.index("Gestational_Diabetes")] + contribution[RISK_SUM], abs=1e-5
+    )
+    for name in RISK_FACTOR_COLUMNS:
+        if name != "Gestational_Diabetes":
+            assert explanation[RISK_FACTOR_LABELS[name]] == pytest.approx(contribution[FEATURE_NAMES.index(name)], abs=1e-6)
+    assert NO_RISK_FACTORS not in explanation
@@ -0,0 +1,98 @@
+import os
+import warnings
+
+import numpy as np
+import pytest
+
+from _common import SAMPLE_INPUT, feature_vector, random_inputs, scaler_pipeline
+from conftest import REPO_ROOT
+from features import RISK_FACTOR_COLUMNS
+from inference import load_scaler
+from registry import ArtifactRegistry
+from test_batch import VALID_ROW
+
+
+@pytest.fixture(scope="module")
+def scaler():
+    with warnings.catch_warnings():
+        # scaler.pkl was pickled by an older scikit-learn
+        warnings.simplefilter("ignore")
+        return load_scaler(os.path.join(REPO_ROOT, "scaler.pkl"))
+
+
+@pytest.fixture(scope="module", params=["scaler.pkl", "artifact registry"])
+def pipeline(request, scaler):
+    if request.param == "scaler.pkl":
+        return scaler_pipeline(scaler)
+    return ArtifactRegistry().current().pipeline
+
+
+def scaler_transform(scaler, rows):
+    import pandas as pd
+
+    return scaler.transform(pd.DataFrame(rows, columns=scaler.feature_names_in_))
+
+
+def test_pipeline_uses_the_scaler_feature_order(scaler, pipeline):
+    assert pipeline.feature_names == tuple(scaler.feature_names_in_)
+
+
+def test_single_row_matches_the_scaler(scaler, pipeline):
+    row = feature_vector(pipeline, SAMPLE_INPUT)
+    np.testing.assert_allclose(pipeline.transform(row), scaler_transform(scaler, row[np.newaxis]), rtol=1e-12, atol=1e-12)
+
+
+def test_batch_matches_the_scaler(scaler, pipeline):
+    rows = random_inputs(10_000)
+    scaled = pipeline.transform(rows)
+    assert scaled.shape == rows.shape
+    np.testing.assert_allclose(scaled, scaler_transform(scaler, rows), rtol=1e-12, atol=1e-12)
+
+
+SINGLE_FIELD_CHANGES = [
+    ("Weight_Pounds", 180.5, ["Mothers_PrePregnancy_BMI"]),
+    ("Height_Inches", 70, ["Mothers_PrePregnancy_BMI"]),
+    ("Total_Prior_Births", 0, ["Total_Prior_Births", "Had_Previous_Birth"]),
+    ("Last_Birth_Months", 8, ["Less_than_1_year", "2.5_years_to_4_years"]),
+    ("Last_Birth_Months", 70, ["Greater_than_5.5_years", "2.5_years_to_4_years"]),
+    ("Mothers_Age", 41, ["Mothers_Age"]),
+    *[(name, 1 - VALID_ROW[name], [name, "Risk_Sum"]) for name in RISK_FACTOR_COLUMNS],
+]
+
+
+@pytest.fixture(scope="module")
+def graph():
+    return ArtifactRegistry().current().graph
+
+
+def assert_matches_full_recompute(graph, state, form):
+    raw = graph.derive({name: np.array([form[name]], dtype=np.float64) for name in graph.input_names})
+    np.testing.assert_allclose(state.raw[np.newaxis], raw, rtol=1e-12)
+    np.testing.assert_allclose(state.row(), graph.pipeline.transform(raw), rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize("name, value, moved", SINGLE_FIELD_CHANGES, ids=[f"{name}={value}" for name, value, _ in SINGLE_FIELD_CHANGES])
+def test_single_field_change_matches_a_full_recompute(graph, name, value, moved):
+    form = dict(VALID_ROW)
+    state = graph.state()
+    state.update(form)
+    before = state.raw.copy()
+
+    form[name] = value
+    state.update({name: value})
+    assert_matches_full_recompute(graph, state, form)
+
+    # The features the change feeds moved and nothing else did
+    changed = {graph.pipeline.feature_names[i] for i in np.flatnonzero(state.raw != before)}
+    assert changed == set(moved)
+
+
+def test_risk_factor_toggles_keep_risk_sum_in_step(graph):
+    form = dict(VALID_ROW)
+    state = graph.state()
+    state.update(form)
+    for name in [*RISK_FACTOR_COLUMNS, *RISK_FACTOR_COLUMNS[::2]]:
+        form[name] = 1 - form[name]
+        state.update({name: form[name]})
+        assert state.value("Risk_Sum") == sum(form[factor] for factor in RISK_FACTOR_COLUMNS)
+        assert_matches_full_recompute(graph, state, form)
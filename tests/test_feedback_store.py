@@ -0,0 +1,54 @@
+import threading
+import time
+
+from feedback_store import BufferedFeedbackSink
+
+
+class FlakyStore:
+    """
+    Refuses the first `failures` writes, then keeps every batch it is given.
+    """
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.attempts = 0
+        self.batches = []
+        self.written = threading.Event()
+
+    def write_batch(self, records):
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            raise OSError("disk full")
+        self.batches.append(list(records))
+        self.written.set()
+
+
+def feedback(store):
+    return [record["feedback"] for batch in store.batches for record in batch]
+
+
+def test_refused_batch_is_retried_and_the_writer_keeps_running():
+    store = FlakyStore(failures=2)
+    sink = BufferedFeedbackSink(store, flush_interval=0.01, retry_seconds=0.01)
+    sink.submit("first")
+    assert store.written.wait(5)
+    assert sink._writer.is_alive()
+    assert feedback(store) == ["first"]
+
+    store.written.clear()
+    sink.submit("second")
+    assert store.written.wait(5)
+    sink.close()
+    assert feedback(store) == ["first", "second"]
+    assert store.attempts == 4
+
+
+def test_close_writes_a_batch_waiting_for_retry():
+    store = FlakyStore(failures=1)
+    sink = BufferedFeedbackSink(store, flush_interval=0.01, retry_seconds=60)
+    sink.submit("kept")
+    while store.attempts < 1:
+        time.sleep(0.01)
+    sink.submit("queued")
+    sink.close()
+    assert sorted(feedback(store)) == ["kept", "queued"]
@@ -0,0 +1,50 @@
+import os
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+from conftest import REPO_ROOT
+from fakes import patch_boto3
+from inference import InferenceContext
+
+APP_PATH = os.path.join(REPO_ROOT, "streamlit_app.py")
+RERUNS = 5
+
+
+def open_risk_assessment():
+    st.cache_resource.clear()
+    at = AppTest.from_file(APP_PATH, default_timeout=30).run()
+    at.sidebar.radio[0].set_value("Risk Assessment").run()
+    return at
+
+
+def submit(at):
+    next(button for button in at.button if button.label == "Submit").click().run()
+    assert not at.exception
+
+
+def test_context_fetches_credentials_once():
+    with patch_boto3(latency=0) as counter:
+        context = InferenceContext()
+        assert counter["cognito_calls"] == 0
+        runtimes = {id(context.runtime) for _ in range(RERUNS)}
+    assert counter["cognito_calls"] == 1
+    assert len(runtimes) == 1
+
+
+def test_reruns_without_submit_make_no_cognito_calls():
+    with patch_boto3(latency=0) as counter:
+        at = open_risk_assessment()
+        for _ in range(RERUNS):
+            at.run()
+    assert counter["cognito_calls"] == 0
+
+
+def test_cognito_calls_stay_flat_across_submits():
+    with patch_boto3(latency=0) as counter:
+        at = open_risk_assessment()
+        for age in range(20, 20 + RERUNS):
+            at.slider[0].set_value(age).run()
+            submit(at)
+    assert counter["invoke_calls"] == RERUNS
+    assert counter["cognito_calls"] == 1
@@ -0,0 +1,113 @@
+import pytest
+from botocore.exceptions import ClientError
+
+from fakes import Counter, FakeSageMakerRuntime
+from invocation import CircuitBreaker, EndpointInvoker, EndpointUnavailable
+
+BODY = b"0.5,0.5\n"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def client_error(code, status):
+    return ClientError(
+        {"Error": {"Code": code, "Message": code}, "ResponseMetadata": {"HTTPStatusCode": status}},
+        "InvokeEndpoint",
+    )
+
+
+def validation_error():
+    return client_error("ValidationError", 400)
+
+
+def model_error():
+    return client_error("ModelError", 424)
+
+
+def throttling_error():
+    return client_error("ThrottlingException", 429)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def runtime():
+    return FakeSageMakerRuntime(Counter(), latency=0)
+
+
+def make_invoker(clock, **kwargs):
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=30, clock=clock)
+    return EndpointInvoker(breaker=breaker, sleep=lambda seconds: None, workers=2, **kwargs)
+
+
+def invoke(invoker, runtime):
+    return invoker.call(runtime.invoke_endpoint, EndpointName="test", ContentType="text/csv", Body=BODY)
+
+
+def open_breaker(invoker, runtime, clock):
+    runtime.fail_next(model_error(), model_error())
+    for _ in range(2):
+        with pytest.raises(ClientError):
+            invoke(invoker, runtime)
+    assert invoker.breaker.state == "open"
+    clock.now += 30
+
+
+def test_model_errors_open_the_breaker(clock, runtime):
+    invoker = make_invoker(clock)
+    open_breaker(invoker, runtime, clock)
+    clock.now -= 1
+    with pytest.raises(EndpointUnavailable):
+        invoke(invoker, runtime)
+    assert runtime.counter["invoke_calls"] == 2
+
+
+def test_client_errors_do_not_open_the_breaker(clock, runtime):
+    invoker = make_invoker(clock)
+    runtime.fail_next(validation_error(), validation_error(), validation_error())
+    for _ in range(3):
+        with pytest.raises(ClientError):
+            invoke(invoker, runtime)
+    assert invoker.breaker.state == "closed"
+    invoke(invoker, runtime)
+
+
+@pytest.mark.parametrize("error, state", [(validation_error, "closed"), (model_error, "open")])
+def test_non_retryable_error_in_half_open_trial_settles_the_breaker(clock, runtime, error, state):
+    invoker = make_invoker(clock)
+    open_breaker(invoker, runtime, clock)
+
+    runtime.fail_next(error())
+    with pytest.raises(ClientError):
+        invoke(invoker, runtime)
+    assert invoker.breaker.state == state
+
+    clock.now += 30
+    invoke(invoker, runtime)
+    assert invoker.breaker.state == "closed"
+
+
+def test_throttling_is_retried(clock, runtime):
+    invoker = make_invoker(clock)
+    runtime.fail_next(throttling_error(), throttling_error())
+    assert invoke(invoker, runtime)["Body"].read() == b"0.2"
+    assert runtime.counter["invoke_calls"] == 3
+    assert invoker.breaker.state == "closed"
+
+
+def test_slow_endpoint_times_out_and_counts_as_a_failure(clock):
+    runtime = FakeSageMakerRuntime(Counter(), latency=0.5)
+    invoker = make_invoker(clock, latency_budget=0.05)
+    for _ in range(2):
+        with pytest.raises(EndpointUnavailable):
+            invoke(invoker, runtime)
+    assert invoker.breaker.state == "open"
@@ -0,0 +1,66 @@
+import io
+
+import numpy as np
+import pytest
+
+from batch import BATCH_INPUT_COLUMNS
+from fakes import patch_boto3
+from inference import InferenceContext
+from population import summarize_cohort
+from predictors import SageMakerPredictor
+from test_batch import VALID_ROW
+
+
+@pytest.fixture
+def context():
+    with patch_boto3(latency=0) as counter:
+        context = InferenceContext()
+        context.counter = counter
+        yield context
+
+
+def cohort(rows):
+    header = ",".join(BATCH_INPUT_COLUMNS)
+    lines = [",".join(str(row[col]) for col in BATCH_INPUT_COLUMNS) for row in rows]
+    return io.StringIO("\n".join([header, *lines]) + "\n")
+
+
+def test_header_only_cohort_makes_no_endpoint_call(context):
+    predictor = SageMakerPredictor(context, context.artifacts.endpoint_name)
+    assert predictor.predict(np.empty((0, len(context.artifacts.pipeline.feature_names)))).shape == (0,)
+
+    summary = summarize_cohort(cohort([]), context.artifacts.graph, predictor)
+    assert summary.overall()["People"] == 0
+    assert context.counter["invoke_calls"] == 0
+
+
+def test_cohort_is_scored_through_the_endpoint(context):
+    predictor = SageMakerPredictor(context, context.artifacts.endpoint_name)
+    summary = summarize_cohort(cohort([VALID_ROW] * 3), context.artifacts.graph, predictor)
+    assert summary.overall()["People"] == 3
+    assert summary.overall()["Mean risk score"] == pytest.approx(0.2)
+    assert context.counter["rows_scored"] == 3
+
+
+def test_invalid_rows_are_skipped_and_counted(context):
+    invalid = [
+        {**VALID_ROW, "Weight_Pounds": ""},
+        {**VALID_ROW, "Height_Inches": 0},
+        {**VALID_ROW, "Mothers_Race_Recode_31": 99},
+        {**VALID_ROW, "Diabetes_Prepregnancy": "yes"},
+    ]
+    predictor = SageMakerPredictor(context, context.artifacts.endpoint_name)
+    summary = summarize_cohort(cohort([VALID_ROW, *invalid, VALID_ROW]), context.artifacts.graph, predictor)
+    assert summary.skipped == len(invalid)
+    assert summary.overall()["People"] == 2
+    assert context.counter["rows_scored"] == 2
+    race = summary.groups["Race"].table()
+    assert [row["People"] for row in race] == [2]
+
+
+def test_chunk_with_only_invalid_rows_is_not_sent(context):
+    predictor = SageMakerPredictor(context, context.artifacts.endpoint_name)
+    summary = summarize_cohort(cohort([{**VALID_ROW, "Height_Inches": 0}] * 3 + [VALID_ROW]), context.artifacts.graph, predictor, chunk_rows=3)
+    assert summary.skipped == 3
+    assert summary.overall()["People"] == 1
+    assert context.counter["invoke_calls"] == 1
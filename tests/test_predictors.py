@@ -0,0 +1,96 @@
+import io
+
+import numpy as np
+import pytest
+
+from payloads import get_codec
+from predictors import LocalXGBoostPredictor, SageMakerPredictor
+
+N_FEATURES = 25
+
+
+@pytest.fixture(scope="module")
+def model_path(tmp_path_factory):
+    import xgboost as xgb
+
+    rng = np.random.default_rng(0)
+    features = rng.normal(size=(2_000, N_FEATURES))
+    labels = (features[:, :5].sum(axis=1) + rng.normal(size=2_000) > 1).astype(int)
+    booster = xgb.train({"objective": "binary:logistic", "max_depth": 4, "nthread": 1}, xgb.DMatrix(features, labels), num_boost_round=30)
+    path = str(tmp_path_factory.mktemp("model") / "xgboost-model.ubj")
+    booster.save_model(path)
+    return path
+
+
+class ScoringRuntime:
+    """
+    A stubbed sagemaker-runtime client that parses the request body the way
+    the XGBoost container does and scores it with a local booster.
+    """
+
+    def __init__(self, model_path):
+        import xgboost as xgb
+
+        self.booster = xgb.Booster()
+        self.booster.load_model(model_path)
+        self.calls = 0
+
+    def parse(self, content_type, body):
+        lines = body.decode().splitlines()
+        if content_type == "text/csv":
+            return np.array([[float(value) for value in line.split(",")] for line in lines])
+        # Like the container, an absent libsvm entry is a missing value, not 0
+        rows = np.full((len(lines), N_FEATURES), np.nan)
+        for i, line in enumerate(lines):
+            for pair in line.split()[1:]:
+                index, value = pair.split(":")
+                rows[i, int(index)] = float(value)
+        return rows
+
+    def invoke_endpoint(self, EndpointName, ContentType, Body, Accept="text/csv"):
+        import xgboost as xgb
+
+        self.calls += 1
+        rows = self.parse(ContentType, Body).astype(np.float32)
+        scores = self.booster.predict(xgb.DMatrix(rows))
+        return {"Body": io.BytesIO("\n".join(f"{score:.9g}" for score in scores).encode())}
+
+
+class StubContext:
+    def __init__(self, runtime):
+        self.runtime = runtime
+
+
+@pytest.mark.parametrize("codec", ["csv", "libsvm"])
+def test_sagemaker_and_local_backends_agree(model_path, codec):
+    rows = np.random.default_rng(1).normal(size=(500, N_FEATURES))
+    rows[:, 7:13] = 0  # sparse binary columns, as in real forms
+    runtime = ScoringRuntime(model_path)
+
+    remote = SageMakerPredictor(StubContext(runtime), "stub", codec=get_codec(codec)).predict(rows)
+    local = LocalXGBoostPredictor(model_path).predict(rows)
+
+    assert runtime.calls >= 1
+    assert remote.shape == local.shape == (500,)
+    np.testing.assert_allclose(remote, local, rtol=1e-6, atol=1e-7)
+
+
+def test_backends_agree_on_a_single_row(model_path):
+    row = np.random.default_rng(2).normal(size=(1, N_FEATURES))
+    remote = SageMakerPredictor(StubContext(ScoringRuntime(model_path)), "stub").predict(row)
+    local = LocalXGBoostPredictor(model_path).predict(row)
+    np.testing.assert_allclose(remote, local, rtol=1e-6, atol=1e-7)
+
+
+def test_libsvm_keeps_zero_valued_features(model_path):
+    # Zeros in the features the model splits on most; dropping them from the
+    # payload would make the container score them as missing
+    rows = np.random.default_rng(3).normal(size=(200, N_FEATURES))
+    rows[::2, :5] = 0
+    pairs = get_codec("libsvm").encode(rows[:1]).decode().split()[1:]
+    assert [pair.split(":")[0] for pair in pairs] == [str(i) for i in range(N_FEATURES)]
+    assert pairs[:5] == ["0:0", "1:0", "2:0", "3:0", "4:0"]
+
+    remote = SageMakerPredictor(StubContext(ScoringRuntime(model_path)), "stub", codec=get_codec("libsvm")).predict(rows)
+    local = LocalXGBoostPredictor(model_path).predict(rows)
+    np.testing.assert_allclose(remote, local, rtol=1e-6, atol=1e-7)
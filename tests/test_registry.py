@@ -0,0 +1,66 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from registry import MANIFEST_NAME, ArtifactError, ArtifactRegistry, activate, load_version, publish_version
+
+FEATURE_NAMES = ArtifactRegistry().current().pipeline.feature_names
+N_FEATURES = len(FEATURE_NAMES)
+
+
+def train_model(path, n_features):
+    import xgboost as xgb
+
+    rng = np.random.default_rng(0)
+    features = rng.normal(size=(200, n_features))
+    booster = xgb.train({"objective": "binary:logistic", "nthread": 1}, xgb.DMatrix(features, features[:, 0] > 0), num_boost_round=2)
+    booster.save_model(str(path))
+    return str(path)
+
+
+def publish(root, version, model_features):
+    model = train_model(root / f"{version}.ubj", model_features)
+    publish_version(str(root), version, np.zeros(N_FEATURES), np.ones(N_FEATURES), FEATURE_NAMES, "endpoint", model)
+
+
+def test_model_matching_the_feature_list_loads(tmp_path):
+    publish(tmp_path, "v1", N_FEATURES)
+    assert load_version(str(tmp_path), "v1").model_path.endswith(".ubj")
+
+
+def test_model_with_a_different_feature_count_is_rejected(tmp_path):
+    publish(tmp_path, "v1", N_FEATURES - 1)
+    with pytest.raises(ArtifactError, match=f"lists {N_FEATURES} features but its model takes {N_FEATURES - 1}"):
+        load_version(str(tmp_path), "v1")
+
+
+def drop_manifest_entry(root, version, key):
+    path = os.path.join(root, version, MANIFEST_NAME)
+    with open(path) as f:
+        manifest = json.load(f)
+    del manifest[key]
+    with open(path, "w") as f:
+        json.dump(manifest, f)
+
+
+@pytest.mark.parametrize("key", ["feature_names", "endpoint_name", "mean"])
+def test_manifest_missing_an_entry_is_rejected(tmp_path, key):
+    publish(tmp_path, "v1", N_FEATURES)
+    drop_manifest_entry(tmp_path, "v1", key)
+    with pytest.raises(ArtifactError, match=key):
+        load_version(str(tmp_path), "v1")
+
+
+def test_registry_keeps_serving_the_previous_version_after_a_bad_publish(tmp_path):
+    publish(tmp_path, "v1", N_FEATURES)
+    activate(str(tmp_path), "v1")
+    registry = ArtifactRegistry(str(tmp_path), poll_seconds=0)
+    assert registry.current().version == "v1"
+
+    publish(tmp_path, "v2", N_FEATURES)
+    drop_manifest_entry(tmp_path, "v2", "feature_names")
+    activate(str(tmp_path), "v2")
+    assert registry.current().version == "v1"
+    assert "feature_names" in registry.last_error
@@ -0,0 +1,68 @@
+import time
+from concurrent.futures import Future
+
+import tabs.risk_assessment as risk_assessment
+from fakes import patch_boto3
+from test_inference import open_risk_assessment, submit
+
+
+def shows_result(at):
+    return any(element.value in risk_assessment.RISK_PANELS.values() for element in at.markdown)
+
+
+def test_slow_explanation_does_not_hold_up_the_result(monkeypatch):
+    pending = Future()
+    monkeypatch.setattr(risk_assessment, "start_explanation", lambda features, artifacts: pending)
+    with patch_boto3(latency=0):
+        at = open_risk_assessment()
+        start = time.perf_counter()
+        submit(at)
+    assert time.perf_counter() - start < 5
+    assert shows_result(at)
+    assert pending.cancelled()
+
+
+def test_batch_upload_skips_the_prediction_cache():
+    import pandas as pd
+
+    from batch import BATCH_INPUT_COLUMNS
+    from metrics import REGISTRY
+    from test_batch import VALID_ROW
+
+    rows = [{**VALID_ROW, "Mothers_Age": age} for age in range(20, 40)]
+    upload = pd.DataFrame(rows, columns=BATCH_INPUT_COLUMNS).to_csv(index=False).encode()
+    with patch_boto3(latency=0) as counter:
+        at = open_risk_assessment()
+        at.file_uploader[0].set_value(("patients.csv", upload, "text/csv")).run()
+        next(button for button in at.button if button.label == "Score File").click().run()
+    assert not at.exception
+    assert counter["rows_scored"] == len(rows)
+    assert REGISTRY.caches["prediction"].stats()["size"] == 0
+
+
+def test_submit_error_details_stay_off_the_page(monkeypatch, caplog):
+    def fail(*args):
+        raise RuntimeError("<script>alert(1)</script> from endpoint stillsafe-xgb")
+
+    monkeypatch.setattr(risk_assessment, "predict_risk", fail)
+    with patch_boto3(latency=0):
+        at = open_risk_assessment()
+        submit(at)
+    assert not at.exception
+    assert any("We could not complete your assessment." in element.value for element in at.markdown)
+    assert not any("stillsafe-xgb" in element.value for element in at.markdown)
+    assert "stillsafe-xgb" in caplog.text
+
+
+def test_upload_error_is_escaped(monkeypatch):
+    def fail(*args):
+        raise ValueError("<img src=x onerror=alert(1)>")
+
+    monkeypatch.setattr(risk_assessment, "score_csv", fail)
+    with patch_boto3(latency=0):
+        at = open_risk_assessment()
+        at.file_uploader[0].set_value(("patients.csv", b"Mothers_Age\n30\n", "text/csv")).run()
+        next(button for button in at.button if button.label == "Score File").click().run()
+    assert not at.exception
+    assert not any("<img" in element.value for element in at.markdown)
+    assert any("&lt;img src=x onerror=alert(1)&gt;" in element.value for element in at.markdown)
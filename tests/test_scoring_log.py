@@ -0,0 +1,38 @@
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+
+import scoring_log
+from scoring_log import ScoringLog, iter_chunks, list_segments
+
+FEATURE_NAMES = ("a", "b", "c")
+ARTIFACTS = SimpleNamespace(version="v1", pipeline=SimpleNamespace(feature_names=FEATURE_NAMES))
+
+
+def test_failed_segment_is_retried_and_the_writer_keeps_running(tmp_path, monkeypatch):
+    attempts = []
+    written = threading.Event()
+    write_segment = scoring_log.write_segment
+
+    def flaky_write_segment(*args, **kwargs):
+        attempts.append(len(args[1]))
+        if len(attempts) <= 2:
+            raise OSError("disk full")
+        path = write_segment(*args, **kwargs)
+        written.set()
+        return path
+
+    monkeypatch.setattr(scoring_log, "write_segment", flaky_write_segment)
+    log = ScoringLog(str(tmp_path), flush_interval=0.01, retry_seconds=0.01)
+    log.record(np.ones((2, 3)), np.array([0.1, 0.2]), ARTIFACTS)
+    assert written.wait(5)
+    assert log._writer.is_alive()
+
+    log.record(np.zeros((1, 3)), np.array([0.3]), ARTIFACTS)
+    log.close()
+
+    assert sorted(meta["rows"] for meta in list_segments(str(tmp_path))) == [1, 2]
+    scores = np.concatenate([chunk[:, -1] for _, chunk in iter_chunks(str(tmp_path))])
+    np.testing.assert_allclose(np.sort(scores), [0.1, 0.2, 0.3], rtol=1e-6)
+    assert attempts[:3] == [2, 2, 2]
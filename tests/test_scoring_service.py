@@ -0,0 +1,69 @@
+import pytest
+
+import scoring_service
+from fakes import patch_boto3
+from inference import InferenceContext
+from scoring_service import predict_rows, score_records
+from test_batch import VALID_ROW
+
+
+@pytest.fixture
+def counter(monkeypatch):
+    # Stands in for _init_worker, in this process and against the stubbed runtime
+    with patch_boto3(latency=0) as counter:
+        monkeypatch.setattr(scoring_service, "_context", InferenceContext())
+        monkeypatch.setattr(scoring_service, "_predictors", {})
+        yield counter
+
+
+def n_features():
+    return len(scoring_service._context.artifacts.pipeline.feature_names)
+
+
+def test_valid_records_are_scored(counter):
+    version, scores = score_records([VALID_ROW, VALID_ROW])
+    assert version == scoring_service._context.artifacts.version
+    assert scores == [0.2, 0.2]
+
+
+@pytest.mark.parametrize("value", [None, float("nan"), float("inf")])
+def test_non_finite_fields_are_rejected(counter, value):
+    with pytest.raises(ValueError, match="Mothers_Age"):
+        score_records([VALID_ROW, {**VALID_ROW, "Mothers_Age": value}])
+    assert counter["invoke_calls"] == 0
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("Height_Inches", 0),
+        ("Weight_Pounds", -10),
+        ("Mothers_Race_Recode_31", 99),
+        ("Diabetes_Prepregnancy", 5),
+        ("Month_Prenatal_Care_Began", 2.5),
+    ],
+)
+def test_answers_the_form_cannot_produce_are_rejected(counter, field, value):
+    with pytest.raises(ValueError, match=f"Record 1: Missing or out of range: {field}"):
+        score_records([VALID_ROW, {**VALID_ROW, field: value}])
+    assert counter["invoke_calls"] == 0
+
+
+@pytest.mark.parametrize("value", ["thirty", [30], {"age": 30}])
+def test_non_numeric_fields_are_rejected(counter, value):
+    with pytest.raises(ValueError):
+        score_records([{**VALID_ROW, "Mothers_Age": value}])
+
+
+@pytest.mark.parametrize("bad", [None, float("nan"), {"x": 1}, "x", [1.0]])
+def test_bad_scaled_rows_are_rejected(counter, bad):
+    row = [0.0] * n_features()
+    row[3] = bad
+    with pytest.raises(ValueError):
+        predict_rows([row], None)
+    assert counter["invoke_calls"] == 0
+
+
+def test_scaled_rows_are_scored(counter):
+    version, predictions = predict_rows([[0.0] * n_features()], None)
+    assert predictions == [0.2]
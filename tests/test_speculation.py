@@ -0,0 +1,113 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from predictors import Predictor
+from speculation import SpeculationStats, SpeculativePredictor
+
+DEBOUNCE = 0.01
+
+
+class RecordingPredictor(Predictor):
+    """
+    Scores each row with its first value and records every row it was asked for.
+    """
+
+    model_id = "recording"
+
+    def __init__(self):
+        self.rows = []
+        self._lock = threading.Lock()
+
+    def predict(self, rows):
+        with self._lock:
+            self.rows.append(np.array(rows))
+        return np.asarray(rows)[:, 0].astype(np.float64)
+
+
+def form_row(value):
+    return np.full((1, 4), float(value))
+
+
+def parked(speculator, row):
+    with speculator._lock:
+        return row.tobytes() in speculator._parked
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Timed out waiting for the speculative call")
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def executor():
+    executor = ThreadPoolExecutor(max_workers=1)
+    yield executor
+    executor.shutdown(wait=True, cancel_futures=True)
+
+
+@pytest.fixture
+def predictor():
+    return RecordingPredictor()
+
+
+def test_submit_reuses_the_speculative_result(predictor, executor):
+    stats = SpeculationStats()
+    speculator = SpeculativePredictor(predictor, debounce=DEBOUNCE, stats=stats, executor=executor)
+
+    speculator.schedule(form_row(1))
+    wait_for(lambda: parked(speculator, form_row(1)))
+
+    np.testing.assert_array_equal(speculator.predict(form_row(1)), [1.0])
+    assert len(predictor.rows) == 1
+    assert stats.summary()["submit_hits"] == 1
+    assert stats.summary()["submit_misses"] == 0
+
+
+def test_form_change_cancels_the_stale_speculation(predictor, executor):
+    # Occupy the only worker so the first row's call stays queued
+    gate = threading.Event()
+    executor.submit(gate.wait)
+    stats = SpeculationStats()
+    speculator = SpeculativePredictor(predictor, debounce=DEBOUNCE, stats=stats, executor=executor)
+
+    speculator.schedule(form_row(1))
+    wait_for(lambda: speculator._inflight)
+    stale = next(iter(speculator._inflight.values()))
+
+    speculator.schedule(form_row(2))
+    assert stale.cancelled()
+    assert speculator.calls == 0
+
+    gate.set()
+    wait_for(lambda: parked(speculator, form_row(2)))
+    assert [row[0, 0] for row in predictor.rows] == [2.0]
+
+    np.testing.assert_array_equal(speculator.predict(form_row(2)), [2.0])
+    assert len(predictor.rows) == 1
+
+
+def test_speculative_calls_stop_at_the_cap(predictor, executor):
+    stats = SpeculationStats()
+    speculator = SpeculativePredictor(predictor, debounce=DEBOUNCE, max_calls=2, stats=stats, executor=executor)
+
+    for value in (1, 2):
+        speculator.schedule(form_row(value))
+        wait_for(lambda: parked(speculator, form_row(value)))
+
+    speculator.schedule(form_row(3))
+    time.sleep(DEBOUNCE * 5)
+    assert speculator.calls == 2
+    assert stats.calls == 2
+    assert len(predictor.rows) == 2
+
+    # Past the cap, Submit still scores the row itself
+    np.testing.assert_array_equal(speculator.predict(form_row(3)), [3.0])
+    assert len(predictor.rows) == 3
+    assert stats.summary()["submit_misses"] == 1
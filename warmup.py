@@ -0,0 +1,99 @@
+# Startup warm-up of the inference path.
+#
+# Without it, the first Submit after a deploy pays for all of the one-time
+# work: loading the artifacts, importing the scoring stack, creating the
+# Cognito identity, building the sagemaker-runtime client and opening its TLS
+# connection, and possibly a cold endpoint container. The app does that work
+# once per server process, on a background thread at startup, and finishes by
+# scoring a canary form through the same path Submit uses. The Risk
+# Assessment's Submit button stays disabled until the warm-up has finished.
+
+import os
+import threading
+import time
+
+from metrics import span
+
+WARMUP_ENABLED = os.environ.get("STILLSAFE_WARMUP", "1") == "1"
+
+# Re-send the canary this often once warm (0 = never). This keeps an idle
+# server's credentials, client and pooled connection fresh, at the cost of
+# one endpoint call per interval.
+WARMUP_KEEPALIVE_SECONDS = float(os.environ.get("STILLSAFE_WARMUP_KEEPALIVE", "0"))
+
+# How often a page waiting on the warm-up checks whether it has finished
+WARMUP_POLL_SECONDS = 1.0
+
+
+class WarmUp:
+    """
+    Tracks the warm-up of one server process.
+
+    ready is True once the warm-up has finished, or if it was never started.
+    A failed warm-up counts as finished: it must not lock users out, and
+    Submit then reports the error itself. The time taken is recorded under
+    the "warmup" stage of the latency metrics.
+    """
+
+    def __init__(self):
+        self.state = "not started"
+        self.seconds = None
+        self.error = None
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self):
+        return self.state != "running"
+
+    def start(self, warm, keepalive=WARMUP_KEEPALIVE_SECONDS):
+        """
+        Runs warm() on a background thread, once per process.
+
+        Parameters:
+            warm (callable): Does the warm-up work; raises if it fails.
+            keepalive (float): Seconds between later re-runs of warm(); 0 for none.
+        """
+        with self._lock:
+            if self.state != "not started":
+                return
+            self.state = "running"
+        threading.Thread(target=self._run, args=(warm, keepalive), name="stillsafe-warmup", daemon=True).start()
+
+    def _run(self, warm, keepalive):
+        start = time.perf_counter()
+        try:
+            with span("warmup"):
+                warm()
+            self.state = "ready"
+        except Exception as e:
+            self.error = str(e)
+            self.state = "failed"
+        self.seconds = time.perf_counter() - start
+        self._done.set()
+
+        while keepalive > 0:
+            time.sleep(keepalive)
+            try:
+                with span("warmup_keepalive"):
+                    warm()
+                self.error = None
+            except Exception as e:
+                self.error = str(e)
+
+    def wait(self, timeout=None):
+        """
+        Blocks until the warm-up has finished. Returns False on timeout.
+        """
+        return self.ready or self._done.wait(timeout)
+
+    def summary(self):
+        """
+        Returns:
+            dict: The warm-up's state, how long it took in seconds and the last error, if any.
+        """
+        return {"state": self.state, "seconds": self.seconds, "error": self.error}
+
+
+# The warm-up of this server process
+WARM_UP = WarmUp()
@@ -0,0 +1,85 @@
+import numpy as np
+
+from features import RISK_FACTOR_COLUMNS
+from metrics import span
+
+# How each risk factor reads in the what-if table
+RISK_FACTOR_LABELS = {
+    "Diabetes_Prepregnancy": "Diabetes before pregnancy",
+    "Gestational_Diabetes": "Gestational diabetes",
+    "PrePregnancy_Hypertension": "Hypertension before pregnancy",
+    "Gestational_Hypertension": "Gestational hypertension",
+    "Hypertension_Eclampsia": "Hypertension eclampsia",
+    "Infertility_Treatment": "Infertility treatment",
+    "Cigarettes_During_Pregnancy": "Smoking during pregnancy",
+    "Cigarettes_Before_Pregnancy_Int": "Smoking before pregnancy",
+}
+
+# Values swept for the continuous answers
+AGE_SWEEP = (20, 25, 30, 35, 40, 45)
+BMI_SWEEP = (18.5, 22.0, 25.0, 30.0, 35.0, 40.0)
+PRENATAL_MONTH_SWEEP = (1, 2, 3, 4, 6, 8)
+
+
+def build_scenarios(inputs):
+    """
+    Lists the single-answer changes explored around a submitted form.
+
+    Each binary risk factor is flipped, and age, BMI and the month prenatal care
+    began are swept over typical values. BMI is moved by changing the weight at
+    the patient's own height.
+
+    Parameters:
+        inputs (dict): The submitted answers, keyed by feature graph input name.
+
+    Returns:
+        list: (change, new answer, inputs) tuples, starting with the answers as submitted.
+    """
+    scenarios = [("As submitted", "", inputs)]
+    for name in RISK_FACTOR_COLUMNS:
+        flipped = 1 - inputs[name]
+        scenarios.append((RISK_FACTOR_LABELS[name], "Yes" if flipped else "No", {**inputs, name: flipped}))
+    for age in AGE_SWEEP:
+        if age != inputs["Mothers_Age"]:
+            scenarios.append(("Mother's age", str(age), {**inputs, "Mothers_Age": age}))
+    height = inputs["Height_Inches"]
+    for bmi in BMI_SWEEP:
+        scenarios.append(("Pre-pregnancy BMI", f"{bmi:g}", {**inputs, "Weight_Pounds": bmi * height ** 2 / 703}))
+    for month in PRENATAL_MONTH_SWEEP:
+        if month != inputs["Month_Prenatal_Care_Began"]:
+            scenarios.append(("Month prenatal care began", str(month), {**inputs, "Month_Prenatal_Care_Began": month}))
+    return scenarios
+
+
+def sensitivity_table(inputs, graph, predictor):
+    """
+    Scores every what-if scenario around a submitted form in one batch.
+
+    The scenarios are derived and scaled as a single matrix and sent to the
+    predictor in one call, so the whole table costs one endpoint round trip.
+
+    Parameters:
+        inputs (dict): The submitted answers, keyed by feature graph input name.
+        graph (FeatureGraph): Feature derivation and scaling from the training scaler.
+        predictor (Predictor): The SageMaker or local scoring backend.
+
+    Returns:
+        list: One dict per scenario with the change, the new answer, its risk
+        score and level, and the score's difference from the submitted answers.
+    """
+    scenarios = build_scenarios(inputs)
+    with span("what_if"):
+        columns = {name: np.array([s[name] for _, _, s in scenarios], dtype=np.float64) for name in graph.input_names}
+        predictions = predictor.predict(graph.pipeline.transform(graph.derive(columns)))
+
+    baseline = predictions[0]
+    return [
+        {
+            "Change": change,
+            "New answer": answer,
+            "Risk score": float(score),
+            "Risk level": "LOW" if np.round(score) == 0 else "HIGH",
+            "Difference": float(score - baseline),
+        }
+        for (change, answer, _), score in zip(scenarios, predictions)
+    ]